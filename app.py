@@ -1,13 +1,33 @@
-from flask import Flask, request, send_from_directory, jsonify
+from flask import Flask, Response, request, send_from_directory, jsonify
 import pandas as pd
 import os
+import re
+import json
+import heapq
+import itertools
+import shutil
+import threading
 from dotenv import load_dotenv
 from datetime import datetime
 import pytz
 from functools import wraps
 from flask_cors import CORS
+import time
 import uuid
 import requests  # needed for update_spreads
+from team_names import known_team_id, team_id
+from session_picks import SessionPicksBuffer
+from snapshots import generation, publish, read_csv_cached, write_csv
+from consensus import ConsensusStore
+from pick_matrix import PickMatrix
+from throttle import SingleFlight, TokenBucket
+from jobs.runner import JobRunner, file_lock
+from jobs.live_scores import LiveScores, read_state
+
+try:
+    import orjson  # optional: much faster encoding for large responses
+except ImportError:
+    orjson = None
 
 
 # ======================================================
@@ -16,7 +36,8 @@ import requests  # needed for update_spreads
 
 load_dotenv()
 
-app = Flask(__name__)
+# static/ is served by static_files() below so it can set cache headers
+app = Flask(__name__, static_folder=None)
 CORS(app, resources={r"/*": {"origins": "*"}})
 app.secret_key = os.getenv("FLASK_SECRET_KEY", "pickem_secret_key")
 
@@ -31,10 +52,37 @@ else:
 
 # File paths
 USERS_PATH = os.path.join(DISK_DIR, "users.csv")
-PICKS_PATH = os.path.join(DISK_DIR, "picks.csv")
+PICKS_PATH = os.path.join(DISK_DIR, "picks.csv")  # legacy, split into PICKS_DIR
+PICKS_DIR = os.path.join(DISK_DIR, "picks")        # one picks CSV per group
 GAMES_PATH = os.path.join(DISK_DIR, "games.csv")
 GROUPS_PATH = os.path.join(DISK_DIR, "groups.csv")
 
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+LOGO_MANIFEST_PATH = os.path.join(STATIC_DIR, "build", "manifest.json")
+
+
+def load_logo_manifest() -> dict:
+    """
+    Map /static/logos/<Team>.png → content-hashed PNG/WebP URLs, written by
+    build_static_assets.py at build time. Empty if the build step hasn't run.
+    """
+    if not os.path.exists(LOGO_MANIFEST_PATH):
+        return {}
+    with open(LOGO_MANIFEST_PATH, "r") as f:
+        return json.load(f)
+
+
+LOGO_MANIFEST = load_logo_manifest()
+
+
+def file_version(path):
+    """(mtime_ns, size) of a file, or None if missing — changes on every write."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 
 def load_users() -> pd.DataFrame:
     """
@@ -50,9 +98,63 @@ def load_users() -> pd.DataFrame:
 
 def save_users(df: pd.DataFrame) -> None:
     """
-    Write the DataFrame back to users.csv.
+    Write the DataFrame back to users.csv (callers hold file_lock(USERS_PATH)).
     """
-    df.to_csv(USERS_PATH, index=False)
+    write_csv(df, USERS_PATH)
+    _index_users(df)
+
+
+# ------------------------------------------------------
+# USER LOOKUP INDEX
+# token → user row and (group_lower, username_lower) → user row, plus a
+# fingerprint of each group's rows so a group's cached results survive
+# users.csv writes that only touch other groups.
+# save_users() refreshes it in place; a write from another process
+# changes users.csv's mtime/size and triggers a rebuild on next lookup.
+# ------------------------------------------------------
+_USER_INDEX = (None, {}, {}, {})  # (file_version, by_token, by_name, group_fingerprints)
+
+
+def _index_users(df: pd.DataFrame) -> None:
+    global _USER_INDEX
+    by_token = {}
+    by_name = {}
+    by_group = {}
+    for row in df.to_dict(orient="records"):
+        token = row.get("token")
+        if isinstance(token, str) and token:
+            by_token[token] = row
+        key = (str(row["group_name"]).lower(), str(row["username"]).lower())
+        # First row wins, matching the old .iloc[0] lookups
+        by_name.setdefault(key, row)
+        by_group.setdefault(key[0], []).append(row)
+
+    # repr, not the rows themselves: NaN != NaN would never compare equal
+    fingerprints = {g: hash(repr(rows)) for g, rows in by_group.items()}
+
+    # Swap in one assignment so concurrent readers never see a half-built index
+    _USER_INDEX = (file_version(USERS_PATH), by_token, by_name, fingerprints)
+
+
+def _user_index():
+    if _USER_INDEX[0] is None or _USER_INDEX[0] != file_version(USERS_PATH):
+        _index_users(load_users())
+    return _USER_INDEX
+
+
+def find_user_by_token(token):
+    """users.csv row (as a dict) for a permalink token, or None."""
+    return _user_index()[1].get(token)
+
+
+def find_user(group_name, username):
+    """users.csv row (as a dict) for a group + username, case-insensitive, or None."""
+    return _user_index()[2].get((group_name.lower(), username.lower()))
+
+
+def group_users_version(group_name):
+    """Changes only when one of the group's rows in users.csv changes."""
+    return _user_index()[3].get(group_name.lower())
 
 # ------------------------------------------------------
 # LOCK DEADLINE — 8:00 PM ET (5:00 PM PT), DECEMBER 13, 2025
@@ -83,27 +185,36 @@ def championship_complete() -> bool:
 def generate_user_token():
     return uuid.uuid4().hex
 
-def game_locked(game_row) -> bool:
+def lock_epoch(game_row) -> float:
     """
-    A game is locked if it has started or is completed.
+    Epoch seconds at which a game locks: its kickoff (US/Pacific), -inf if
+    already completed, inf if the kickoff is missing or unparseable.
     """
     # Completed game → locked
     if bool(game_row.get("completed", False)):
-        return True
+        return -float("inf")
 
     kickoff = game_row.get("kickoff_datetime")
     if not kickoff:
-        return False
+        return float("inf")
 
     try:
         kickoff_dt = pd.to_datetime(kickoff).tz_localize(
             "US/Pacific", nonexistent="shift_forward", ambiguous="NaT"
         )
     except Exception:
-        return False
+        return float("inf")
 
-    now_pst = datetime.now(pytz.timezone("US/Pacific"))
-    return now_pst >= kickoff_dt
+    if pd.isna(kickoff_dt):
+        return float("inf")
+    return kickoff_dt.timestamp()
+
+
+def game_locked(game_row) -> bool:
+    """
+    A game is locked if it has started or is completed.
+    """
+    return time.time() >= lock_epoch(game_row)
 
 
 # ======================================================
@@ -122,14 +233,14 @@ def seed_disk():
 
     os.makedirs(DISK_DIR, exist_ok=True)
 
-    for filename in ["games.csv", "groups.csv", "picks.csv"]:
+    # Picks aren't seeded: per-group shards are created on first submission
+    for filename in ["games.csv", "groups.csv"]:
         dst = f"{DISK_DIR}/{filename}"
         src = f"{seed_dir}/{filename}"
 
         # Only seed if disk file does NOT exist
         if not os.path.exists(dst):
             if os.path.exists(src):
-                import shutil
                 shutil.copy(src, dst)
                 print(f"🌱 Seeded {filename} → {dst}")
             else:
@@ -142,6 +253,65 @@ def seed_disk():
 seed_disk()
 
 
+# ======================================================
+#               PICKS SHARDS
+# ======================================================
+# Picks are stored one CSV per group, PICKS_DIR/<group>.csv, with the same
+# columns picks.csv had. A group's routes read, cache and rewrite only its
+# own shard, so a submission in one group never invalidates another
+# group's cached results, and the cost of serving a group doesn't grow
+# with the number of groups.
+
+def picks_shard_path(group_name) -> str:
+    """Shard CSV for a group (case-insensitive, like group names)."""
+    slug = re.sub(r"[^a-z0-9]+", "_", str(group_name).strip().lower()).strip("_")
+    return os.path.join(PICKS_DIR, f"{slug or '_'}.csv")
+
+
+def picks_shard_paths() -> list:
+    """Every shard on disk."""
+    try:
+        names = os.listdir(PICKS_DIR)
+    except FileNotFoundError:
+        return []
+    return sorted(os.path.join(PICKS_DIR, n) for n in names if n.endswith(".csv"))
+
+
+def shard_picks():
+    """
+    One-time migration: split a legacy picks.csv into per-group shards.
+    The shards are written to a temp dir that is renamed into place, so
+    workers starting together never see a half-split PICKS_DIR. The old
+    file is kept as picks.csv.pre-shard.
+    """
+    if os.path.isdir(PICKS_DIR):
+        return
+
+    tmp_dir = f"{PICKS_DIR}.tmp-{os.getpid()}"
+    os.makedirs(tmp_dir, exist_ok=True)
+    if os.path.exists(PICKS_PATH):
+        df = pd.read_csv(PICKS_PATH)
+        shard_names = df["group_name"].astype(str).map(
+            lambda g: os.path.basename(picks_shard_path(g))
+        )
+        for shard_name, rows in df.groupby(shard_names, sort=False):
+            rows.to_csv(os.path.join(tmp_dir, shard_name), index=False)
+
+    try:
+        os.rename(tmp_dir, PICKS_DIR)
+    except OSError:
+        # Another worker finished the split first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return
+
+    if os.path.exists(PICKS_PATH):
+        os.replace(PICKS_PATH, PICKS_PATH + ".pre-shard")
+        print(f"🗂️ Split picks.csv into {len(picks_shard_paths())} group shards → {PICKS_DIR}")
+
+
+shard_picks()
+
+
 # ======================================================
 #               GROUP SUPPORT
 # ======================================================
@@ -180,24 +350,121 @@ def require_group(f):
     return wrapper
 
 
+# ------------------------------------------------------
+# RATE LIMITS (expensive read routes)
+# In-process token buckets per client IP. Nothing here identifies the
+# caller by token: the only token these routes see is the /api/p/<token>
+# permalink, which everyone the link is shared with sends, so a bucket
+# keyed on it would lock out all of them at once.
+# ------------------------------------------------------
+IP_LIMIT = TokenBucket(rate=5, burst=30)      # shared NATs (family wifi, campus)
+
+# Proxies in front of the app that each append the caller's address to
+# X-Forwarded-For (Render: 1). Entries left of those are client-supplied.
+TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "1" if os.getenv("RENDER") else "0"))
+
+
+def client_ip(forwarded_for="", remote_addr="") -> str:
+    """The address our own proxy saw, never a hop the client could have written."""
+    hops = [h.strip() for h in forwarded_for.split(",") if h.strip()]
+    if TRUSTED_PROXY_HOPS and len(hops) >= TRUSTED_PROXY_HOPS:
+        return hops[-TRUSTED_PROXY_HOPS]
+    return remote_addr or ""
+
+
+def rate_limit_wait(route, ip) -> float:
+    """Takes one request from the caller's bucket: 0 to go ahead, else seconds to wait."""
+    return IP_LIMIT.take((route, ip))
+
+
+def rate_limited(f):
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        ip = client_ip(request.headers.get("X-Forwarded-For", ""), request.remote_addr)
+
+        wait = rate_limit_wait(f.__name__, ip)
+        if wait:
+            retry_after = max(1, round(wait))
+            return (
+                {"error": "rate_limited", "retry_after": retry_after},
+                429,
+                {"Retry-After": str(retry_after)},
+            )
+        return f(*args, **kwargs)
+
+    # asgi.py checks this before answering from its poll cache
+    wrapper.rate_limited = True
+    return wrapper
+
+
 # ======================================================
 #               DATA HELPERS
 # ======================================================
-def normalize_team(name: str) -> str:
-    if not isinstance(name, str):
-        return ""
-    return (
-        name.lower()
-        .replace("’", "'")   # curly apostrophe
-        .replace("'", "")    # remove apostrophes
-        .replace(".", "")
-        .strip()
-    )
+def correct_picks(merged: pd.DataFrame) -> pd.Series:
+    """
+    Pick is correct if its game is completed and selected_team is the winner.
+    Teams are compared by canonical team ID, so spelling differences
+    (Hawai'i vs hawaii, Boise St. vs Boise State) never break scoring.
+    """
+    names = pd.unique(pd.concat([merged["selected_team"], merged["winner"]]))
+    ids = {name: team_id(name) for name in names}
+    picked = merged["selected_team"].map(ids)
+    won = merged["winner"].map(ids)
+    return (merged["completed"] == True) & won.notna() & (picked == won)
+
+
+# ------------------------------------------------------
+# SHARED READ-ONLY FRAMES
+# load_games()/load_group_picks() hand out one normalized DataFrame per
+# CSV version, shared by every request thread. Treat them as read-only:
+# derive per-request views with filters, merges and .assign() instead of
+# setting columns in place. With copy-on-write those views share the base
+# data until they modify it, and can never write through to it.
+# Writers publish() after saving a CSV, which bumps that CSV's generation
+# and drops every worker's cached frame of it on their next request.
+# "Shared" means across threads of one worker: each worker keeps its own
+# normalized copy (fillna/astype below), only the snapshot it parses from
+# is shared between workers.
+# ------------------------------------------------------
+if int(pd.__version__.split(".")[0]) < 3:
+    # Always on from pandas 3
+    pd.set_option("mode.copy_on_write", True)
+
+_FRAMES = {}  # csv path → ((generation, file_version), DataFrame)
+
+
+def csv_version(path) -> tuple:
+    """(generation, file_version) of one CSV."""
+    # file_version still catches scripts that write CSVs without publishing
+    return (generation(path).value, file_version(path))
+
+
+def shared_frame(path, reader) -> pd.DataFrame:
+    """reader(path), re-run only when the CSV's generation or file changes."""
+    version = csv_version(path)
+    cached = _FRAMES.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    df = reader(path)
+    # Version was taken before the read, so a write racing the read just
+    # triggers one more reload next time
+    _FRAMES[path] = (version, df)
+    return df
 
 
 def load_games() -> pd.DataFrame:
+    """Shared, read-only games frame (see SHARED READ-ONLY FRAMES)."""
+    return shared_frame(GAMES_PATH, _read_games)
+
+
+def load_group_picks(group_name) -> pd.DataFrame:
+    """Shared, read-only picks frame for one group's shard."""
+    return shared_frame(picks_shard_path(group_name), _read_picks)
+
+
+def _read_games(path) -> pd.DataFrame:
     """Load games metadata from games.csv, with safe defaults."""
-    path = f"{DISK_DIR}/games.csv"
     if not os.path.exists(path):
         return pd.DataFrame(
             columns=[
@@ -223,7 +490,7 @@ def load_games() -> pd.DataFrame:
             ]
         )
 
-    df = pd.read_csv(path)
+    df = read_csv_cached(path)
     df = df.fillna("")
     if "game_id" not in df.columns:
         df["game_id"] = ""
@@ -231,9 +498,8 @@ def load_games() -> pd.DataFrame:
     return df
 
 
-def load_picks() -> pd.DataFrame:
-    """Load picks from picks.csv and normalize schema."""
-    path = f"{DISK_DIR}/picks.csv"
+def _read_picks(path) -> pd.DataFrame:
+    """Load picks from a picks CSV and normalize schema."""
     if not os.path.exists(path):
         return pd.DataFrame(
             columns=[
@@ -246,7 +512,7 @@ def load_picks() -> pd.DataFrame:
             ]
         )
 
-    df = pd.read_csv(path)
+    df = read_csv_cached(path)
 
     # Ensure required columns exist
     required_columns = [
@@ -268,13 +534,66 @@ def load_picks() -> pd.DataFrame:
     return df
 
 
-def user_has_submitted(username: str, group_name: str) -> bool:
+def user_has_submitted(username: str, group_name: str, picks_df=None) -> bool:
     """Check if a user has already submitted final picks for this group."""
-    picks_df = load_picks()
-    return (
+    if picks_df is None:
+        picks_df = load_group_picks(group_name)
+    return bool((
         (picks_df["group_name"] == group_name)
         & (picks_df["username"] == username)
-    ).any()
+    ).any())
+
+
+def user_has_all_picks(username: str, group_name: str, picks_df, games_df) -> bool:
+    """True if the user has a pick for every game (case-insensitive match)."""
+    user_picks = picks_df[
+        (picks_df["group_name"].str.lower() == group_name.lower()) &
+        (picks_df["username"].str.lower() == username.lower())
+    ]
+    return len(user_picks) == len(games_df)
+
+
+def games_payload(games_df) -> list:
+    """Serialize games.csv rows for the /games response."""
+    games = []
+    for _, row in games_df.iterrows():
+        bowl_name = str(row.get("bowl_name", ""))
+
+        game = row.to_dict()
+        game["is_cfp"] = "CFP" in bowl_name.upper()
+
+        # Hashed (long-cacheable) logo URLs; falls back to the plain path
+        for side in ("away", "home"):
+            logo = str(game.get(f"{side}_logo", ""))
+            game[f"{side}_logo_assets"] = LOGO_MANIFEST.get(logo, {"png": logo})
+
+        games.append(game)
+
+    return games
+
+
+def group_pot(group_name, picks_df) -> dict:
+    """Pot size = buy_in × number of users with picks in the group."""
+    info = load_group_info(group_name) or {}
+    try:
+        buy_in = float(info.get("buy_in") or 0)
+    except (TypeError, ValueError):
+        buy_in = 0.0
+
+    group_picks = picks_df[
+        picks_df["group_name"].astype(str).str.strip().str.lower()
+        == group_name.strip().lower()
+    ]
+    num_players = group_picks["username"].nunique()
+
+    return {"pot": num_players * buy_in, "num_players": int(num_players)}
+
+
+def pick_lock_status() -> dict:
+    return {
+        "picks_locked": picks_locked(),
+        "deadline_iso": PICK_DEADLINE_PST.isoformat()
+    }
 
 
 def get_eliminated_cfp_teams(games_df):
@@ -287,9 +606,9 @@ def get_eliminated_cfp_teams(games_df):
     ]
 
     for _, row in cfp_games.iterrows():
-        winner = normalize_team(row["winner"])
-        home = normalize_team(row["home_team"])
-        away = normalize_team(row["away_team"])
+        winner = team_id(row["winner"])
+        home = team_id(row["home_team"])
+        away = team_id(row["away_team"])
 
         # Only eliminate if winner matches one side exactly
         if winner == home:
@@ -301,6 +620,226 @@ def get_eliminated_cfp_teams(games_df):
     return sorted(eliminated)
 
 
+def eliminated_cfp_teams() -> list:
+    """get_eliminated_cfp_teams for the current games.csv, once per data version."""
+    return COALESCE.do(
+        ("eliminated_cfp_teams",), csv_version(GAMES_PATH), lambda: get_eliminated_cfp_teams(load_games())
+    )
+
+
+def championship_total_points(games_df):
+    """
+    Combined final score of the national championship game, used for the
+    tiebreaker. Returns None until the game is completed: games.csv also
+    holds in-progress scores (batched in by the live-score poller).
+    """
+    champ_game = games_df[
+        games_df["bowl_name"].str.contains("National Championship", case=False, na=False)
+    ]
+    if champ_game.empty:
+        return None
+
+    champ_row = champ_game.iloc[0]
+    if champ_row["completed"] != True:
+        return None
+    try:
+        return int(champ_row["home_score"]) + int(champ_row["away_score"])
+    except Exception:
+        return None
+
+
+def load_group_info(group_name):
+    """Return the group_info.csv row for a group (buy-in + payout split), or None."""
+    import csv
+    path = os.path.join(DISK_DIR, "group_info.csv")
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "r") as f:
+        for row in csv.DictReader(f):
+            if row["group_name"].strip().lower() == group_name.strip().lower():
+                return row
+    return None
+
+
+# ======================================================
+#               STANDINGS CACHE
+# ======================================================
+
+# Per-group derived results (standings, picks board, winner), keyed by
+# group version. Concurrent requests after a data change share one
+# computation instead of each recomputing it.
+COALESCE = SingleFlight()
+
+
+def group_version(group_name) -> tuple:
+    """
+    Cheap fingerprint of everything a group's results depend on: games.csv,
+    the group's own picks shard and its rows in users.csv. Other groups'
+    submissions don't change it.
+    """
+    return (
+        csv_version(GAMES_PATH),
+        csv_version(picks_shard_path(group_name)),
+        group_users_version(group_name),
+    )
+
+
+def data_version() -> tuple:
+    """Fingerprint of every CSV, all groups' shards included."""
+    paths = [GAMES_PATH, USERS_PATH] + picks_shard_paths()
+    return tuple((path, csv_version(path)) for path in paths)
+
+
+def compute_standings(group_name, picks_df, games_df, users_df) -> pd.DataFrame:
+    """
+    Score every user in a group.
+
+    Returns one row per user, sorted by total_points, with:
+    username, name, total_points, rank (method="min"), tiebreaker and
+    tb_error (distance from the championship total, NaN until it is known).
+    """
+    columns = ["username", "name", "total_points", "rank", "tiebreaker", "tb_error"]
+
+    picks_df = picks_df[picks_df["group_name"] == group_name]
+    if picks_df.empty:
+        return pd.DataFrame(columns=columns)
+
+    merged = picks_df.merge(
+        games_df[["game_id", "winner", "completed"]],
+        on="game_id",
+        how="left",
+    )
+
+    merged["completed"] = merged["completed"].fillna(False)
+    merged["correct"] = correct_picks(merged)
+
+    merged["score"] = merged["correct"].astype(int) * merged["point_value"]
+
+    # Username → name mapping
+    name_map = picks_df[["username", "name"]].drop_duplicates()
+
+    totals = (
+        merged.groupby("username", as_index=False)["score"]
+        .sum()
+        .rename(columns={"score": "total_points"})
+        .merge(name_map, on="username", how="left")
+    )
+
+    totals = totals.sort_values("total_points", ascending=False)
+    totals["rank"] = totals["total_points"].rank(
+        method="min", ascending=False
+    ).astype(int)
+
+    # Tiebreakers come from users.csv ONLY
+    group_users = users_df[users_df["group_name"] == group_name]
+    tb_map = dict(zip(
+        group_users["username"].astype(str).str.lower(),
+        pd.to_numeric(group_users["tiebreaker"], errors="coerce"),
+    ))
+    totals["tiebreaker"] = totals["username"].astype(str).str.lower().map(tb_map)
+
+    champ_total = championship_total_points(games_df)
+    if champ_total is None:
+        totals["tb_error"] = float("nan")
+    else:
+        # Missing tiebreakers get a very large error (they lose the tiebreaker)
+        totals["tb_error"] = (totals["tiebreaker"].fillna(9999) - champ_total).abs()
+
+    return totals[columns]
+
+
+def get_standings(group_name, frames=None) -> pd.DataFrame:
+    """
+    Standings for a group, recomputed only when the underlying CSVs change.
+    `frames` is an optional callable returning (picks_df, games_df, users_df)
+    for callers that already hold those frames, so a cache miss doesn't
+    parse the CSVs a second time. Callers must treat the result as read-only.
+    """
+    def compute():
+        if frames is None:
+            picks_df, games_df, users_df = load_group_picks(group_name), load_games(), load_users()
+        else:
+            picks_df, games_df, users_df = frames()
+        return compute_standings(group_name, picks_df, games_df, users_df)
+
+    return COALESCE.do(("standings", group_name), group_version(group_name), compute)
+
+
+def get_pick_matrix(group_name) -> PickMatrix:
+    """Users × games pick matrix for a group, built once per group version."""
+    def build():
+        picks_df = load_group_picks(group_name)
+        group_picks = picks_df[picks_df["group_name"] == group_name]
+        return PickMatrix(group_picks, load_games(), eliminated_cfp_teams())
+
+    return COALESCE.do(("pick_matrix", group_name), group_version(group_name), build)
+
+
+GLOBAL_TOP_MAX = 100  # most entries the global leaderboard returns
+
+
+def get_group_top(group_name) -> list:
+    """
+    A group's top GLOBAL_TOP_MAX standings as (-total_points, group_name,
+    username, name, group_rank) tuples, already in merge order. Rebuilt
+    only when that group's version changes.
+    """
+    def build():
+        top = get_standings(group_name).head(GLOBAL_TOP_MAX)
+        return sorted(
+            (-int(points), group_name, str(username), str(name), int(rank))
+            for username, name, points, rank in zip(
+                top["username"], top["name"].fillna(""), top["total_points"], top["rank"]
+            )
+        )
+
+    return COALESCE.do(("group_top", group_name), group_version(group_name), build)
+
+
+def split_payouts(ranks, prizes):
+    """
+    Split prize money by rank. `ranks` are min-method ranks in sorted order;
+    `prizes` are the amounts for 1st, 2nd, 3rd... Users tied at rank r occupy
+    places r..r+k-1 and share the sum of those prizes equally.
+    """
+    counts = {}
+    for r in ranks:
+        counts[r] = counts.get(r, 0) + 1
+
+    share = {}
+    for r, k in counts.items():
+        places = prizes[r - 1:r - 1 + k]
+        share[r] = sum(places) / k
+
+    return [share[r] for r in ranks]
+
+
+def parse_tiebreaker(raw):
+    """users.csv tiebreaker → int, the raw string if not numeric, or None."""
+    raw_tb = str(raw).strip()
+    if not raw_tb or raw_tb.lower() in ("nan", "none"):
+        return None
+    try:
+        return int(float(raw_tb))
+    except ValueError:
+        return raw_tb
+
+
+def page_args():
+    """Read ?offset=&limit= for paginated routes. limit=None means no limit."""
+    offset = max(request.args.get("offset", 0, type=int), 0)
+    limit = request.args.get("limit", None, type=int)
+    if limit is not None:
+        limit = max(limit, 0)
+    return offset, limit
+
+
+def json_dumps(obj) -> bytes:
+    """Compact JSON encoding, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 
 # ======================================================
@@ -329,30 +868,7 @@ def get_group_info(group_name):
 @app.get("/group_pot/<group_name>")
 @require_group
 def get_group_pot(group_name):
-    import csv
-    picks_path = os.path.join(DISK_DIR, "picks.csv")
-    info_path = os.path.join(DISK_DIR, "group_info.csv")
-
-    # Load buy_in
-    buy_in = 0
-    with open(info_path, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row["group_name"].strip().lower() == group_name.strip().lower():
-                buy_in = float(row["buy_in"])
-                break
-
-    # Count unique users in picks.csv
-    unique_users = set()
-    with open(picks_path, "r") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row["group_name"].strip().lower() == group_name.strip().lower():
-                unique_users.add(row["username"])
-
-    pot = len(unique_users) * buy_in
-
-    return {"pot": pot, "num_players": len(unique_users)}
+    return group_pot(group_name, load_group_picks(group_name))
 
 
 # ------------------------------
@@ -361,24 +877,21 @@ def get_group_pot(group_name):
 @app.route("/api/<group_name>/games")
 @require_group
 def api_games(group_name):
-    df = load_games()
-
-    games = []
-    for _, row in df.iterrows():
-        bowl_name = str(row.get("bowl_name", ""))
-
-        game = row.to_dict()
-        game["is_cfp"] = "CFP" in bowl_name.upper()
-
-        games.append(game)
-
-    return games
+    return games_payload(load_games())
 
 
 # ------------------------------
-# Save in-progress picks to session_picks.csv
+# Save in-progress picks (autosave)
 # (not used by scoring, just backup / in-progress)
+# Buffered in memory, upserted into session_picks.db (one row per user)
+# in batches; drafts are evicted once the pick deadline passes
 # ------------------------------
+SESSION_PICKS = SessionPicksBuffer(
+    f"{DISK_DIR}/session_picks.db",
+    expires_at=PICK_DEADLINE_PST.timestamp(),
+)
+
+
 @app.route("/api/<group_name>/save_session_picks", methods=["POST"])
 @require_group
 def api_save_session_picks(group_name):
@@ -397,42 +910,39 @@ def api_save_session_picks(group_name):
     if not username or point_value is None or raw_picks is None:
         return {"error": "Missing required fields"}, 400
 
-    picks_path = f"{DISK_DIR}/session_picks.csv"
+    # Drafts are worthless once picks lock
+    if picks_locked():
+        return {
+            "error": "Picks are locked",
+            "deadline_iso": PICK_DEADLINE_PST.isoformat()
+        }, 403
 
-    if os.path.exists(picks_path):
-        df = pd.read_csv(picks_path)
-    else:
-        df = pd.DataFrame(
-            columns=["group_name", "username", "point_value", "picks"]
-        )
+    SESSION_PICKS.save(group_name, username, point_value, raw_picks)
 
-    # Store raw_picks as a string for now (we never read it back in this app)
-    formatted_picks = str(raw_picks)
-
-    df = pd.concat(
-        [
-            df,
-            pd.DataFrame(
-                [
-                    {
-                        "group_name": group_name,
-                        "username": username,
-                        "point_value": point_value,
-                        "picks": formatted_picks,
-                    }
-                ]
-            ),
-        ],
-        ignore_index=True,
-    )
+    return {"success": True}, 200
 
-    df.to_csv(picks_path, index=False)
 
-    return {"success": True}, 200
+# ------------------------------
+# Resume in-progress picks (latest autosave)
+# ------------------------------
+@app.get("/api/<group_name>/session_picks")
+@require_group
+def api_get_session_picks(group_name):
+    username = request.args.get("username", "").strip()
+    if not username:
+        return {"error": "Missing username"}, 400
+
+    draft = SESSION_PICKS.latest(group_name, username)
+    out = {"draft": draft}
+
+    if request.args.get("history", "").lower() in ("1", "true", "yes"):
+        out["history"] = SESSION_PICKS.history(group_name, username)
+
+    return out
 
 
 # ------------------------------
-# Create user (pre-seed picks.csv rows)
+# Create user
 # ------------------------------
 @app.route("/api/<group_name>/create-user", methods=["POST"])
 @require_group
@@ -444,33 +954,38 @@ def api_create_user(group_name):
     if not username or not name:
         return {"error": "Missing username or name"}, 400
 
-    users_df = load_users()
-    picks_df = load_picks()
-
     group_lower = group_name.lower()
     username_lower = username.lower()
 
-    existing_user = users_df[
-        (users_df["group_name"].str.lower() == group_lower) &
-        (users_df["username"].str.lower() == username_lower)
-    ]
+    existing_user = find_user(group_name, username)
 
     # CASE 1: Username does not exist → create new user
-    if existing_user.empty:
-        token = generate_user_token()
-        new_row = {
-            "group_name": group_name,
-            "username": username,
-            "name": name,
-            "token": token
-        }
+    if existing_user is None:
+        with file_lock(USERS_PATH):
+            users_df = load_users()
+            # Re-check under the lock: a concurrent request may have just created it
+            taken = (
+                (users_df["group_name"].str.lower() == group_lower) &
+                (users_df["username"].str.lower() == username_lower)
+            )
+            if taken.any():
+                existing_user = users_df[taken].iloc[0].to_dict()
+            else:
+                token = generate_user_token()
+                new_row = {
+                    "group_name": group_name,
+                    "username": username,
+                    "name": name,
+                    "token": token
+                }
 
-        users_df = pd.concat([users_df, pd.DataFrame([new_row])], ignore_index=True)
-        save_users(users_df)
+                users_df = pd.concat([users_df, pd.DataFrame([new_row])], ignore_index=True)
+                save_users(users_df)
 
-        return {"token": token, "new": True}, 200
+                return {"token": token, "new": True}, 200
 
     # CASE 2: Username DOES exist → check picks
+    picks_df = load_group_picks(group_name)
     user_picks = picks_df[
         (picks_df["group_name"].str.lower() == group_lower) &
         (picks_df["username"].str.lower() == username_lower)
@@ -481,13 +996,87 @@ def api_create_user(group_name):
         return {"error": "Username already exists and has submitted picks"}, 400
 
     # CASE 2b: User exists but no picks → allow resume
-    token = existing_user.iloc[0]["token"]
+    token = existing_user["token"]
     return {"token": token, "new": False, "resume": True}, 200
 
 
 
 # ------------------------------
-# Final submission — writes canonical picks to picks.csv
+# Pick validation — one dict lookup per pick, rebuilt per games.csv version
+# ------------------------------
+def is_placeholder_team(name) -> bool:
+    """TBD_* slots for CFP games whose teams aren't known yet."""
+    return str(name).strip().upper().startswith("TBD")
+
+
+def pick_rules() -> dict:
+    """
+    game_id → (point_value, lock_epoch, {team_id: team name as in games.csv}).
+    A TBD_* side can be filled by any team in the CFP field (the real teams
+    of every CFP game), so those games accept the whole field.
+    """
+    def build():
+        games = load_games().to_dict(orient="records")
+
+        cfp_field = {}
+        for game in games:
+            if "CFP" not in str(game["bowl_name"]):
+                continue
+            for side in ("away_team", "home_team"):
+                tid = team_id(game[side])
+                if tid is not None and not is_placeholder_team(game[side]):
+                    cfp_field.setdefault(tid, game[side])
+
+        rules = {}
+        for game in games:
+            teams = {}
+            for side in ("away_team", "home_team"):
+                if is_placeholder_team(game[side]):
+                    teams.update(cfp_field)
+            for side in ("away_team", "home_team"):
+                tid = team_id(game[side])
+                if tid is not None and not is_placeholder_team(game[side]):
+                    teams[tid] = game[side]
+            rules[str(game["game_id"])] = (int(game["point_value"]), lock_epoch(game), teams)
+        return rules
+
+    return COALESCE.do(("pick_rules",), csv_version(GAMES_PATH), build)
+
+
+def validate_picks(picks):
+    """
+    Split a {game_id: team} submission into accepted (game_id, team,
+    point_value) tuples and rejected {game_id, selected_team, reason}
+    dicts. Teams are matched to the game's two teams (or, for a TBD_*
+    side, the CFP field) by any known spelling and stored as games.csv
+    spells them.
+    """
+    rules = pick_rules()
+    now = time.time()
+
+    accepted = []
+    rejected = []
+    for game_id, selected_team in picks.items():
+        rule = rules.get(str(game_id))
+        if rule is None:
+            reason = "unknown_game"
+        else:
+            point_value, locks_at, teams = rule
+            team = teams.get(known_team_id(selected_team))
+            if now >= locks_at:
+                reason = "game_locked"
+            elif team is None:
+                reason = "invalid_team"
+            else:
+                accepted.append((str(game_id), team, point_value))
+                continue
+        rejected.append({"game_id": str(game_id), "selected_team": selected_team, "reason": reason})
+
+    return accepted, rejected
+
+
+# ------------------------------
+# Final submission — writes canonical picks to the group's shard
 # and generates permalink token + tiebreaker
 # ------------------------------
 @app.route("/api/<group_name>/confirm_picks", methods=["POST"])
@@ -503,6 +1092,9 @@ def api_confirm_picks(group_name):
     if not username or not picks:
         return {"error": "Missing username or picks"}, 400
 
+    if not isinstance(picks, dict):
+        return {"error": "picks must be an object of game_id → team"}, 400
+
     # 🔒 GLOBAL PICK LOCK (ADD THIS)
     if picks_locked():
         return {
@@ -511,97 +1103,166 @@ def api_confirm_picks(group_name):
         }, 403
 
     # ======================================================
-    # 1. Load users.csv and confirm user exists
+    # 1. Load users.csv and confirm user exists. users.csv and the
+    #    shard are each read and rewritten under their file lock, so
+    #    concurrent submissions can't drop each other's writes.
     # ======================================================
-    users_df = load_users()
+    with file_lock(USERS_PATH):
+        users_df = load_users()
 
-    mask = (
-        (users_df["group_name"].str.lower() == group_name.lower()) &
-        (users_df["username"].str.lower() == username.lower())
-    )
+        mask = (
+            (users_df["group_name"].str.lower() == group_name.lower()) &
+            (users_df["username"].str.lower() == username.lower())
+        )
 
-    if not mask.any():
-        return {"error": "User does not exist"}, 400
+        if not mask.any():
+            return {"error": "User does not exist"}, 400
 
-    user_token = users_df.loc[mask, "token"].iloc[0]
+        user_token = users_df.loc[mask, "token"].iloc[0]
 
-    # ======================================================
-    # 2. Update user submission fields
-    # ======================================================
-    users_df.loc[mask, "has_submitted"] = True
+        # ======================================================
+        # 2. Validate every pick before writing anything
+        # ======================================================
+        accepted, rejected = validate_picks(picks)
+        if not accepted:
+            return {"error": "No valid picks", "rejected": rejected}, 400
 
-    if tiebreaker is not None:
-        try:
-            users_df.loc[mask, "tiebreaker"] = int(tiebreaker)
-        except Exception:
-            users_df.loc[mask, "tiebreaker"] = tiebreaker
+        # ======================================================
+        # 3. Update user submission fields
+        # ======================================================
+        users_df.loc[mask, "has_submitted"] = True
 
-    save_users(users_df)
+        if tiebreaker is not None:
+            try:
+                users_df.loc[mask, "tiebreaker"] = int(tiebreaker)
+            except Exception:
+                users_df.loc[mask, "tiebreaker"] = tiebreaker
+
+        save_users(users_df)
 
     # ======================================================
-    # 3. Save final picks to picks.csv
+    # 4. Save final picks to the group's picks shard
     # ======================================================
-    picks_path = f"{DISK_DIR}/picks.csv"
-    games_df = load_games()
-    games_df["game_id"] = games_df["game_id"].astype(str)
+    picks_path = picks_shard_path(group_name)
+    os.makedirs(PICKS_DIR, exist_ok=True)
 
-    if os.path.exists(picks_path):
-        picks_df = pd.read_csv(picks_path)
-    else:
-        picks_df = pd.DataFrame(
-            columns=[
-                "group_name",
-                "username",
-                "name",
-                "game_id",
-                "selected_team",
-                "point_value",
-            ]
-        )
+    with file_lock(picks_path):
+        if os.path.exists(picks_path):
+            picks_df = pd.read_csv(picks_path)
+        else:
+            picks_df = pd.DataFrame(
+                columns=[
+                    "group_name",
+                    "username",
+                    "name",
+                    "game_id",
+                    "selected_team",
+                    "point_value",
+                ]
+            )
 
-    # Remove previous picks for user
-    picks_df = picks_df[
-        ~(
+        # Remove previous picks for user
+        user_mask = (
             (picks_df["group_name"].str.lower() == group_name.lower()) &
             (picks_df["username"].str.lower() == username.lower())
         )
-    ]
+        replaced = picks_df[user_mask]
+        picks_df = picks_df[~user_mask]
 
-    new_rows = []
+        new_rows = [
+            {
+                "group_name": group_name,
+                "username": username,
+                "name": name or username,
+                "game_id": game_id,
+                "selected_team": team,
+                "point_value": point_value,
+            }
+            for game_id, team, point_value in accepted
+        ]
+        picks_df = pd.concat([picks_df, pd.DataFrame(new_rows)], ignore_index=True)
 
-    for game_id, selected_team in picks.items():
-        game_row = games_df[games_df["game_id"] == str(game_id)]
-        if game_row.empty:
-            continue
+        picks_df = picks_df.drop_duplicates(
+            subset=["group_name", "username", "game_id"], keep="last"
+        )
 
-        # 🚫 Block picks for locked games (already started / completed)
-        if game_locked(game_row.iloc[0]):
-            continue
+        consensus_base = CONSENSUS.shard_version(group_name)
+        write_csv(picks_df, picks_path)
+        consensus_written = CONSENSUS.shard_version(group_name)
+        publish(picks_path)
+
+        CONSENSUS.apply(
+            group_name,
+            zip(replaced["game_id"], replaced["selected_team"], replaced["point_value"]),
+            ((r["game_id"], r["selected_team"], r["point_value"]) for r in new_rows),
+            consensus_base,
+            consensus_written,
+        )
 
-        point_val = int(game_row.iloc[0]["point_value"])
+    # ======================================================
+    # 5. Success — rejected picks are reported, not silently dropped
+    # ======================================================
+    return {
+        "success": True,
+        "token": user_token,
+        "accepted": len(accepted),
+        "rejected": rejected,
+    }, 200
 
-        new_rows.append({
-            "group_name": group_name,
-            "username": username,
-            "name": name or username,
-            "game_id": str(game_id),
-            "selected_team": selected_team,
-            "point_value": point_val,
-        })
 
-    if new_rows:
-        picks_df = pd.concat([picks_df, pd.DataFrame(new_rows)], ignore_index=True)
+# ------------------------------
+# Consensus — each game's pick split, maintained incrementally on confirm
+# ------------------------------
+CONSENSUS = ConsensusStore(f"{DISK_DIR}/consensus.db", picks_shard_path)
 
-    picks_df = picks_df.drop_duplicates(
-        subset=["group_name", "username", "game_id"], keep="last"
-    )
 
-    picks_df.to_csv(picks_path, index=False)
+def _consensus_side(team, picks, points, total):
+    return {
+        "team": team,
+        "picks": picks,
+        "pct": round(100 * picks / total, 1) if total else 0.0,
+        "points_at_stake": points,
+    }
+
 
-    # ======================================================
-    # 4. Success
-    # ======================================================
-    return {"success": True, "token": user_token}, 200
+@app.get("/api/<group_name>/consensus")
+@require_group
+def api_consensus(group_name):
+    counts = CONSENSUS.counts(group_name, lambda: load_group_picks(group_name))
+    games_df = load_games()
+    games_df = games_df.assign(_order=pd.to_numeric(games_df["game_id"], errors="coerce"))
+
+    out = []
+    for game in games_df.sort_values("_order").to_dict(orient="records"):
+        teams = counts.get(str(game["game_id"]), {})
+        total = sum(picks for picks, _ in teams.values())
+
+        home_id, away_id = team_id(game["home_team"]), team_id(game["away_team"])
+        sides = {"home": [0, 0], "away": [0, 0]}
+        other = []
+        for team, (picks, points) in teams.items():
+            tid = team_id(team)
+            side = "home" if tid == home_id else "away" if tid == away_id else None
+            if side:
+                sides[side][0] += picks
+                sides[side][1] += points
+            else:
+                other.append(_consensus_side(team, picks, points, total))
+
+        entry = {
+            "game_id": str(game["game_id"]),
+            "bowl_name": game["bowl_name"],
+            "point_value": int(game["point_value"] or 0),
+            "total_picks": total,
+            "home": _consensus_side(game["home_team"], *sides["home"], total),
+            "away": _consensus_side(game["away_team"], *sides["away"], total),
+        }
+        if other:
+            # Picks naming neither listed team (e.g. made before a CFP matchup was set)
+            entry["other"] = other
+        out.append(entry)
+
+    return {"games": out}
 
 
 # ------------------------------
@@ -615,7 +1276,7 @@ def api_get_user_picks(group_name):
     if not username:
         return {"error": "Missing username"}, 400
 
-    picks_df = load_picks()
+    picks_df = load_group_picks(group_name)
     games_df = load_games()
 
     group_lower = group_name.lower()
@@ -630,9 +1291,7 @@ def api_get_user_picks(group_name):
         return []
 
     # --- ADD CORRECT FLAG ---
-    filtered["game_id"] = filtered["game_id"].astype(str)
-    games_df["game_id"] = games_df["game_id"].astype(str)
-
+    # (load_group_picks/load_games already give string game_ids)
     merged = filtered.merge(
         games_df[["game_id", "winner", "completed"]],
         on="game_id",
@@ -640,10 +1299,7 @@ def api_get_user_picks(group_name):
     )
 
     merged["completed"] = merged["completed"].fillna(False)
-    merged["correct"] = (merged["completed"] == True) & merged.apply(
-        lambda r: normalize_team(r["selected_team"]) == normalize_team(r["winner"]),
-        axis=1
-    )
+    merged["correct"] = correct_picks(merged)
 
     return merged.to_dict(orient="records")
 
@@ -658,19 +1314,13 @@ def api_get_tiebreaker(group_name):
     if not username:
         return {"tiebreaker": None}, 200  # frontend handles null
 
-    users_df = load_users()
-    group_lower = group_name.lower()
-
-    row = users_df[
-        (users_df["group_name"].str.lower() == group_lower) &
-        (users_df["username"].str.lower() == username)
-    ]
+    row = find_user(group_name, username)
 
     # If user not found → return null tiebreaker so frontend still works
-    if row.empty:
+    if row is None:
         return {"tiebreaker": None}, 200
 
-    raw_tb = row.iloc[0].get("tiebreaker", "")
+    raw_tb = row.get("tiebreaker", "")
     if pd.isna(raw_tb) or str(raw_tb).strip() == "":
         return {"tiebreaker": None}, 200
 
@@ -686,10 +1336,7 @@ def api_get_tiebreaker(group_name):
 @app.get("/api/<group_name>/pick-lock-status")
 @require_group
 def api_pick_lock_status(group_name):
-    return {
-        "picks_locked": picks_locked(),
-        "deadline_iso": PICK_DEADLINE_PST.isoformat()
-    }
+    return pick_lock_status()
 
 # ------------------------------
 # User status — has submitted? 
@@ -702,15 +1349,9 @@ def api_has_submitted_picks(group_name):
     if not username:
         return {"has_submitted": False}
 
-    picks_df = load_picks()
-    total_games = len(load_games())
-
-    user_picks = picks_df[
-        (picks_df["group_name"].str.lower() == group_name.lower()) &
-        (picks_df["username"].str.lower() == username)
-    ]
-
-    return {"has_submitted": len(user_picks) == total_games}
+    return {
+        "has_submitted": user_has_all_picks(username, group_name, load_group_picks(group_name), load_games())
+    }
 
 # ------------------------------
 # User status — has submitted? is locked?
@@ -724,71 +1365,22 @@ def api_user_status(group_name):
         return {"submitted": False, "locked": picks_locked()}
 
     submitted = user_has_submitted(username, group_name)
-    locked = picks_locked()
-
-    return {"submitted": submitted, "locked": locked}
-
-
-# ------------------------------
-# Top 5 leaderboard (per group)
-# ------------------------------
-@app.route("/api/<group_name>/leaderboard_top5")
-@require_group
-def api_leaderboard_top5(group_name):
-    picks_path = f"{DISK_DIR}/picks.csv"
-    if not os.path.exists(picks_path):
-        return {"leaderboard": []}
-
-    picks_df = pd.read_csv(picks_path)
-
-    required_columns = [
-        "group_name",
-        "username",
-        "selected_team",
-        "point_value",
-        "game_id",
-    ]
-    for col in required_columns:
-        if col not in picks_df.columns:
-            picks_df[col] = 0 if col == "point_value" else ""
-
-    picks_df = picks_df[picks_df["group_name"] == group_name]
-
-    if picks_df.empty:
-        return {"leaderboard": []}
-
-    games_df = load_games()
-
-    picks_df["game_id"] = picks_df["game_id"].astype(str)
-    games_df["game_id"] = games_df["game_id"].astype(str)
-
-    merged = picks_df.merge(
-        games_df[["game_id", "winner", "completed"]],
-        on="game_id",
-        how="left",
-    )
-
-    merged["completed"] = merged["completed"].fillna(False)
-    merged["correct"] = (merged["completed"] == True) & merged.apply(
-        lambda r: normalize_team(r["selected_team"]) == normalize_team(r["winner"]),
-        axis=1
-    )
-
-    merged["score"] = merged["correct"].astype(int) * merged["point_value"]
+    locked = picks_locked()
 
-    # Get username → name mapping
-    name_map = picks_df[["username", "name"]].drop_duplicates()
+    return {"submitted": submitted, "locked": locked}
 
-    totals = (
-        merged.groupby("username", as_index=False)["score"]
-        .sum()
-        .rename(columns={"score": "total_points"})
-        .merge(name_map, on="username", how="left")
-    )
 
-    totals = totals.sort_values("total_points", ascending=False)
-    top5 = totals.head(5)
+# ------------------------------
+# Top 5 leaderboard (per group)
+# ------------------------------
+@app.route("/api/<group_name>/leaderboard_top5")
+@require_group
+def api_leaderboard_top5(group_name):
+    standings = get_standings(group_name)
+    if standings.empty:
+        return {"leaderboard": []}
 
+    top5 = standings.head(5)[["username", "total_points", "name"]]
     return {"leaderboard": top5.to_dict(orient="records")}
 
 
@@ -797,131 +1389,186 @@ def api_leaderboard_top5(group_name):
 # ------------------------------
 @app.route("/api/<group_name>/leaderboard")
 @require_group
+@rate_limited
 def api_leaderboard(group_name):
-    picks_path = f"{DISK_DIR}/picks.csv"
-    if not os.path.exists(picks_path):
+    standings = get_standings(group_name)
+    if standings.empty:
         return {"leaderboard": []}
 
-    picks_df = pd.read_csv(picks_path)
-
-    required_columns = [
-        "group_name",
-        "username",
-        "selected_team",
-        "point_value",
-        "game_id",
-    ]
-    for col in required_columns:
-        if col not in picks_df.columns:
-            picks_df[col] = 0 if col == "point_value" else ""
+    offset, limit = page_args()
+    end = None if limit is None else offset + limit
 
-    picks_df = picks_df[picks_df["group_name"] == group_name]
+    totals = standings[["username", "total_points", "name", "rank"]].iloc[offset:end]
+    return {"leaderboard": totals.to_dict(orient="records"), "total_users": len(standings)}
 
-    if picks_df.empty:
-        return {"leaderboard": []}
 
-    games_df = load_games()
+# ------------------------------
+# Global leaderboard — top users across every group
+# ------------------------------
+@app.get("/api/leaderboard/global")
+@rate_limited
+def api_global_leaderboard():
+    limit = min(max(request.args.get("limit", 25, type=int), 0), GLOBAL_TOP_MAX)
+
+    # The global top K is always inside the union of each group's top K,
+    # so merging the per-group heads reads at most K entries per group
+    groups = sorted(ALLOWED_GROUPS.values())
+    merged = heapq.merge(*(get_group_top(g) for g in groups))
+
+    leaderboard = []
+    for neg_points, group_name, username, name, group_rank in itertools.islice(merged, limit):
+        points = -neg_points
+        # rank method="min": everyone with more points is earlier in the list
+        if leaderboard and leaderboard[-1]["total_points"] == points:
+            rank = leaderboard[-1]["rank"]
+        else:
+            rank = len(leaderboard) + 1
+        leaderboard.append({
+            "group_name": group_name,
+            "username": username,
+            "name": name,
+            "total_points": points,
+            "rank": rank,
+            "group_rank": group_rank,
+        })
 
-    picks_df["game_id"] = picks_df["game_id"].astype(str)
-    games_df["game_id"] = games_df["game_id"].astype(str)
+    return {
+        "leaderboard": leaderboard,
+        "total_users": sum(len(get_standings(g)) for g in groups),
+        "groups": len(groups),
+    }
 
-    merged = picks_df.merge(
-        games_df[["game_id", "winner", "completed"]],
-        on="game_id",
-        how="left",
-    )
 
-    merged["completed"] = merged["completed"].fillna(False)
-    
-    merged["correct"] = (merged["completed"] == True) & merged.apply(
-        lambda r: normalize_team(r["selected_team"]) == normalize_team(r["winner"]),
-        axis=1
-    )
+# ------------------------------
+# Personal card — points, max possible, rank, distance to the leader
+# ------------------------------
+@app.get("/api/<group_name>/user_summary")
+@require_group
+def api_user_summary(group_name):
+    username = request.args.get("username", "").strip()
+    if not username:
+        return {"error": "Missing username"}, 400
 
-    merged["score"] = merged["correct"].astype(int) * merged["point_value"]
+    summary = get_pick_matrix(group_name).summary(username)
+    if summary is None:
+        return {"error": "No picks found for user"}, 404
 
-    # Add username → name mapping
-    name_map = picks_df[["username", "name"]].drop_duplicates()
+    return summary
 
-    totals = (
-        merged.groupby("username", as_index=False)["score"]
-        .sum()
-        .rename(columns={"score": "total_points"})
-        .merge(name_map, on="username", how="left")
-    )
 
-    totals = totals.sort_values("total_points", ascending=False)
-    totals["rank"] = totals["total_points"].rank(
-        method="min", ascending=False
-    ).astype(int)
+# ------------------------------
+# Head-to-head — ?a=&b= for two users, ?a= alone for a vs everyone
+# ------------------------------
+@app.get("/api/<group_name>/compare")
+@require_group
+@rate_limited
+def api_compare(group_name):
+    a = request.args.get("a", "").strip()
+    b = request.args.get("b", "").strip()
+    if not a:
+        return {"error": "Missing a"}, 400
+
+    matrix = get_pick_matrix(group_name)
+    result = matrix.compare(a, b) if b else matrix.compare_all(a)
+    if result is None:
+        return {"error": "No picks found for user"}, 404
 
-    return {"leaderboard": totals.to_dict(orient="records")}
+    return result
 
 
 # ------------------------------
-# Picks board — comparison grid across all users in a group
+# Payouts — projected from current ranks, final after the championship
 # ------------------------------
-@app.route("/api/<group_name>/picks_board")
+@app.route("/api/<group_name>/payouts")
 @require_group
-def api_picks_board(group_name):
-    print("\n===== PICKS BOARD DEBUG =====", flush=True)
-    print("URL group_name:", repr(group_name), flush=True)
+@rate_limited
+def api_payouts(group_name):
+    info = load_group_info(group_name)
+    if info is None:
+        return {"error": "Group not found"}, 404
 
-    # ---------------------------
-    # Load picks
-    # ---------------------------
-    picks_path = f"{DISK_DIR}/picks.csv"
-    print("picks.csv exists?", os.path.exists(picks_path), flush=True)
-
-    if os.path.exists(picks_path):
-        print("First 5 lines of picks.csv:", flush=True)
-        with open(picks_path, "r") as f:
-            for i in range(5):
-                print("  ", f.readline().rstrip("\n"), flush=True)
-    else:
-        print("picks.csv missing!", flush=True)
+    def money(key):
+        try:
+            return float(info.get(key) or 0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    standings = get_standings(group_name)
+    buy_in = money("buy_in")
+    pot = len(standings) * buy_in
+    prizes = [
+        pot * money(key)
+        for key in ("winnings_first", "winnings_second", "winnings_third")
+    ]
 
-    picks_df = pd.read_csv(picks_path)
+    # Once the championship is over and scored, the tiebreaker separates
+    # users on equal points; until then ties split the prize money.
+    final = championship_complete() and standings["tb_error"].notna().all()
+
+    if final:
+        ordered = standings.sort_values(
+            ["total_points", "tb_error"], ascending=[False, True]
+        )
+        keys = list(zip(ordered["total_points"], ordered["tb_error"]))
+        ranks = []
+        for i, key in enumerate(keys):
+            ranks.append(ranks[-1] if i and key == keys[i - 1] else i + 1)
+    else:
+        ordered = standings
+        ranks = ordered["rank"].tolist()
+
+    amounts = split_payouts(ranks, prizes)
+
+    payouts = [
+        {
+            "username": row.username,
+            "name": row.name,
+            "total_points": int(row.total_points),
+            "rank": rank,
+            "payout": round(amount, 2),
+        }
+        for row, rank, amount in zip(ordered.itertuples(index=False), ranks, amounts)
+        if amount > 0
+    ]
 
-    # normalize usernames for matching
-    picks_df["username"] = picks_df["username"].astype(str).str.lower()
+    return {
+        "final": bool(final),
+        "buy_in": buy_in,
+        "pot": pot,
+        "num_players": len(standings),
+        "payouts": payouts,
+    }
 
-    # ---------------------------
-    # Load users.csv (for tiebreakers + real_name)
-    # ---------------------------
-    users_df = load_users()
-    users_df = users_df[users_df["group_name"] == group_name]
-    users_df["username"] = users_df["username"].astype(str).str.lower()
-    users_df["tiebreaker"] = users_df["tiebreaker"].fillna("").astype(str)
 
+# ------------------------------
+# Picks board — comparison grid across all users in a group
+# ------------------------------
+def build_picks_board(group_name):
+    """
+    (games_meta, users) for a group's picks board, or None if nobody in the
+    group has picks. `users` is every user's row, ordered by total_points
+    and pre-encoded as JSON bytes, so requests only slice and join.
+    """
     # ---------------------------
-    # Validate picks.csv columns
+    # Load picks for this group
     # ---------------------------
-    required_columns = ["group_name", "username", "selected_team", "point_value", "game_id"]
-    for col in required_columns:
-        if col not in picks_df.columns:
-            picks_df[col] = 0 if col == "point_value" else ""
-
-    picks_df["group_name"] = picks_df["group_name"].astype(str).str.strip()
-    group_name = group_name.strip()
-
-    # Filter to this group
-    picks_df = picks_df[picks_df["group_name"] == group_name]
+    picks_df = load_group_picks(group_name)
+    picks_df = picks_df[picks_df["group_name"].astype(str).str.strip() == group_name]
 
     if picks_df.empty:
-        print("No picks for group — return empty.", flush=True)
-        return {"games": [], "users": []}
+        return None
+
+    # normalize usernames for matching, numeric game_id for sorting
+    picks_df = picks_df.assign(
+        username=picks_df["username"].astype(str).str.lower(),
+        game_id=picks_df["game_id"].astype(int),
+    )
 
     # ---------------------------
     # Load games
     # ---------------------------
     games_df = load_games()
-    print("GAMES_DF COLUMNS:", list(games_df.columns), flush=True)
-
-    # Ensure numeric sorting
-    picks_df["game_id"] = picks_df["game_id"].astype(int)
-    games_df["game_id"] = games_df["game_id"].astype(int)
-
+    games_df = games_df.assign(game_id=games_df["game_id"].astype(int))
     games_df = games_df.rename(columns={"point_value": "game_point_value"})
 
     # ---------------------------
@@ -954,10 +1601,7 @@ def api_picks_board(group_name):
     merged["completed"] = merged["completed"].fillna(False)
     merged["game_point_value"] = merged["game_point_value"].fillna(0).astype(int)
 
-    merged["correct"] = (merged["completed"] == True) & merged.apply(
-        lambda r: normalize_team(r["selected_team"]) == normalize_team(r["winner"]),
-        axis=1
-    )
+    merged["correct"] = correct_picks(merged)
 
     merged["score"] = merged["correct"].astype(int) * merged["game_point_value"]
 
@@ -969,59 +1613,96 @@ def api_picks_board(group_name):
     )
 
     # ---------------------------
-    # Build users output
+    # Tiebreakers (from users.csv ONLY)
     # ---------------------------
-    users_output = []
-
-    for _, row in totals.iterrows():
-        username = row["username"]
-        total_points = int(row["total_points"])
+    users_df = load_users()
+    users_df = users_df[users_df["group_name"] == group_name]
+    tiebreakers = dict(zip(
+        users_df["username"].astype(str).str.lower(),
+        users_df["tiebreaker"],
+    ))
 
-        user_picks_df = merged[merged["username"] == username]
+    # username → row positions in merged, computed once
+    rows_by_user = merged.groupby("username").indices
 
-        # numeric → string keys
-        pick_map = {
-            str(r["game_id"]): {
-                "pick": r["selected_team"],
-                "correct": bool(r["correct"]),
-                "completed": bool(r["completed"]),
-                "point_value": int(r["game_point_value"]),
+    # ---------------------------
+    # Build users output (one at a time, encoded once)
+    # ---------------------------
+    def iter_users():
+        for username, total_points in zip(totals["username"], totals["total_points"]):
+            user_picks_df = merged.iloc[rows_by_user[username]]
+
+            # numeric → string keys
+            pick_map = {
+                str(game_id): {
+                    "pick": pick,
+                    "correct": bool(correct),
+                    "completed": bool(completed),
+                    "point_value": int(point_value),
+                }
+                for game_id, pick, correct, completed, point_value in zip(
+                    user_picks_df["game_id"],
+                    user_picks_df["selected_team"],
+                    user_picks_df["correct"],
+                    user_picks_df["completed"],
+                    user_picks_df["game_point_value"],
+                )
             }
-            for _, r in user_picks_df.iterrows()
-        }
 
-        # real name
-        real_name = ""
-        if "name" in user_picks_df.columns:
             real_name = str(user_picks_df["name"].iloc[0])
 
-        # tiebreaker (from users.csv ONLY)
-        tb_row = users_df[users_df["username"] == username]
-        if not tb_row.empty:
-            raw_tb = str(tb_row.iloc[0]["tiebreaker"]).strip()
-            if raw_tb and raw_tb.lower() not in ("nan", "none", ""):
-                try:
-                    tiebreaker_value = int(float(raw_tb))
-                except:
-                    tiebreaker_value = raw_tb
-            else:
-                tiebreaker_value = None
-        else:
-            tiebreaker_value = None
-
-        users_output.append(
-            {
+            yield {
                 "username": username,
                 "name": real_name,
                 "display_name": f"{username} ({real_name})" if real_name else username,
-                "total_points": total_points,
+                "total_points": int(total_points),
                 "picks": pick_map,
-                "tiebreaker": tiebreaker_value,
+                "tiebreaker": parse_tiebreaker(tiebreakers.get(username, "")),
             }
-        )
 
-    print("Returning picks board successfully.", flush=True)
-    return {"games": games_meta, "users": users_output}
+    return games_meta, [json_dumps(user) for user in iter_users()]
+
+
+def get_picks_board(group_name):
+    """build_picks_board, computed once per data version (see COALESCE)."""
+    return COALESCE.do(
+        ("picks_board", group_name), group_version(group_name), lambda: build_picks_board(group_name)
+    )
+
+
+@app.route("/api/<group_name>/picks_board")
+@require_group
+@rate_limited
+def api_picks_board(group_name):
+    """
+    ?offset=&limit= page through users (ordered by total_points).
+    ?stream=1 streams the body one user at a time instead of joining the
+    page into one buffer first.
+    """
+    offset, limit = page_args()
+    stream = request.args.get("stream", "").lower() in ("1", "true", "yes")
+
+    board = get_picks_board(group_name.strip())
+    if board is None:
+        return {"games": [], "users": []}
+
+    games_meta, users = board
+    end = None if limit is None else offset + limit
+    page = users[offset:end]
+
+    # Same JSON document either way: {"games":..., "total_users":..., "users":[...]}
+    head = json_dumps({"games": games_meta, "total_users": len(users)})[:-1] + b',"users":['
+
+    if not stream:
+        return Response(head + b",".join(page) + b"]}", mimetype="application/json")
+
+    def generate():
+        yield head
+        for i, user in enumerate(page):
+            yield (b"," if i else b"") + user
+        yield b"]}"
+
+    return Response(generate(), mimetype="application/json")
 
 # ------------------------------
 # Check Username (correct format for frontend)
@@ -1033,17 +1714,12 @@ def api_check_username(group_name):
     if not username:
         return {"available": False, "reason": None, "stored_name": None}, 400
 
-    users_df = load_users()
-    picks_df = load_picks()
     group_lower = group_name.lower()
 
-    matching_user = users_df[
-        (users_df["group_name"].str.lower() == group_lower) &
-        (users_df["username"].str.lower() == username)
-    ]
+    matching_user = find_user(group_name, username)
 
     # USER DOES NOT EXIST
-    if matching_user.empty:
+    if matching_user is None:
         return { 
             "available": True, 
             "reason": "new",
@@ -1051,9 +1727,10 @@ def api_check_username(group_name):
         }
 
     # USER EXISTS
-    stored_name = matching_user.iloc[0]["name"]
+    stored_name = matching_user["name"]
 
     # CHECK PICKS
+    picks_df = load_group_picks(group_name)
     user_picks = picks_df[
         (picks_df["group_name"].str.lower() == group_lower) &
         (picks_df["username"].str.lower() == username)
@@ -1078,7 +1755,7 @@ def api_check_username(group_name):
 @require_group
 def api_users_with_picks(group_name):
     users_df = load_users()
-    picks_df = load_picks()
+    picks_df = load_group_picks(group_name)
 
     group_lower = group_name.lower()
 
@@ -1110,14 +1787,94 @@ def api_users_with_picks(group_name):
 @app.get("/api/<group_name>/eliminated_cfp_teams")
 @require_group
 def api_eliminated_cfp_teams(group_name):
-    games_df = load_games()
-    eliminated = get_eliminated_cfp_teams(games_df)
-
     return {
-        "eliminated_cfp_teams": eliminated
+        "eliminated_cfp_teams": eliminated_cfp_teams()
     }
 
 
+# ------------------------------
+# Group dashboard — everything the group page needs in one call
+# ------------------------------
+DASHBOARD_FIELDS = [
+    "games",
+    "leaderboard_top5",
+    "pick_lock_status",
+    "group_pot",
+    "eliminated_cfp_teams",
+    "user_status",
+    "has_submitted_picks",
+]
+
+
+@app.get("/api/<group_name>/dashboard")
+@require_group
+@rate_limited
+def api_dashboard(group_name):
+    """
+    Combined payload for the group page, computed from one load of each CSV.
+    ?fields=games,group_pot,... limits the response to the listed sections.
+    """
+    fields_arg = request.args.get("fields", "").strip()
+    if fields_arg:
+        fields = [f.strip() for f in fields_arg.split(",") if f.strip()]
+    else:
+        fields = DASHBOARD_FIELDS
+
+    unknown = [f for f in fields if f not in DASHBOARD_FIELDS]
+    if unknown:
+        return {"error": "unknown_fields", "fields": unknown}, 400
+
+    username = request.args.get("username", "").strip()
+
+    # Each CSV is read at most once, and only if a requested field needs it
+    loaded = {}
+
+    def frame(name):
+        if name not in loaded:
+            loaded[name] = {
+                "games": load_games,
+                "picks": lambda: load_group_picks(group_name),
+                "users": load_users,
+            }[name]()
+        return loaded[name]
+
+    out = {}
+
+    if "games" in fields:
+        out["games"] = games_payload(frame("games"))
+
+    if "leaderboard_top5" in fields:
+        standings = get_standings(
+            group_name, frames=lambda: (frame("picks"), frame("games"), frame("users"))
+        )
+        top5 = standings.head(5)[["username", "total_points", "name"]]
+        out["leaderboard_top5"] = {"leaderboard": top5.to_dict(orient="records")}
+
+    if "pick_lock_status" in fields:
+        out["pick_lock_status"] = pick_lock_status()
+
+    if "group_pot" in fields:
+        out["group_pot"] = group_pot(group_name, frame("picks"))
+
+    if "eliminated_cfp_teams" in fields:
+        out["eliminated_cfp_teams"] = {
+            "eliminated_cfp_teams": eliminated_cfp_teams()
+        }
+
+    if "user_status" in fields:
+        submitted = bool(username) and user_has_submitted(username, group_name, frame("picks"))
+        out["user_status"] = {"submitted": submitted, "locked": picks_locked()}
+
+    if "has_submitted_picks" in fields:
+        out["has_submitted_picks"] = {
+            "has_submitted": bool(username) and user_has_all_picks(
+                username, group_name, frame("picks"), frame("games")
+            )
+        }
+
+    return out
+
+
 
 # ------------------------------
 # List users for recovery (read-only)
@@ -1139,15 +1896,46 @@ def api_list_users(group_name):
     return group_users.to_dict(orient="records")
 
 
+# ======================================================
+#               JOB RUNNER
+# CFBD jobs run on a background thread under a per-job lock shared with
+# cron and the scheduler (jobs/runner.py). The /internal/* triggers
+# return a job ID right away instead of holding a web thread on CFBD.
+# ======================================================
+JOB_RUNNER = JobRunner(
+    f"{DISK_DIR}/job_runs.db",
+    f"{DISK_DIR}/.locks",
+    on_success=lambda job: PRECOMPUTE_WAKE.set(),
+)
+
+
+def start_job(job):
+    run_id, running_id = JOB_RUNNER.start(job, source="web")
+    if run_id is None:
+        return {"error": "already_running", "job_id": running_id}, 409
+    return {"status": "running", "job_id": run_id, "status_url": f"/internal/jobs/{run_id}"}, 202
+
+
+@app.get("/internal/jobs")
+def internal_jobs():
+    return JOB_RUNNER.stats()
+
+
+@app.get("/internal/jobs/<job_id>")
+def internal_job_status(job_id):
+    run = JOB_RUNNER.get(job_id)
+    if run is None:
+        return {"error": "Job not found"}, 404
+    return run
+
+
 # ======================================================
 #               UPDATE WINNERS (CFBD live winners)
 # ======================================================
 @app.post("/internal/update_winners")
 def internal_update_winners():
     # Only allow from cron, but skip security for now
-    from jobs import update_winners_live
-    update_winners_live.main()
-    return {"status": "ok"}
+    return start_job("update_winners")
 
 
 # ======================================================
@@ -1155,9 +1943,7 @@ def internal_update_winners():
 # ======================================================
 @app.post("/internal/update_cfbd_ids")
 def internal_update_cfbd_ids():
-    from jobs import assign_cfbd_ids_live
-    result = assign_cfbd_ids_live.main()
-    return result
+    return start_job("update_cfbd_ids")
 
 
 
@@ -1165,22 +1951,18 @@ def internal_update_cfbd_ids():
 # ======================================================
 #               WINNER (AFTER CHAMPIONSHIP)
 # ======================================================
-@app.route("/api/<group_name>/winner")
-@require_group
-def api_winner(group_name):
+def compute_winner(group_name) -> dict:
     # If championship not finished, do not declare winner yet
     if not championship_complete():
         return {"winner": None}
 
-    picks_df = load_picks()
+    picks_df = load_group_picks(group_name)
     picks_df = picks_df[picks_df["group_name"] == group_name]
 
     if picks_df.empty:
         return {"winner": None}
 
     games_df = load_games()
-    games_df["game_id"] = games_df["game_id"].astype(str)
-    picks_df["game_id"] = picks_df["game_id"].astype(str)
 
     # Merge picks with results
     merged = picks_df.merge(
@@ -1190,10 +1972,7 @@ def api_winner(group_name):
     )
 
     # Score correct picks
-    merged["correct"] = (merged["completed"] == True) & merged.apply(
-        lambda r: normalize_team(r["selected_team"]) == normalize_team(r["winner"]),
-        axis=1
-    )
+    merged["correct"] = correct_picks(merged)
     
     merged["score"] = merged["correct"].astype(int) * merged["point_value"]
 
@@ -1202,29 +1981,16 @@ def api_winner(group_name):
     totals = totals.rename(columns={"score": "total_points"})
 
     # Determine championship actual total points
-    # Find the national championship game (bowl_name contains "National Championship")
-    champ_game = games_df[
-        games_df["bowl_name"].str.contains("National Championship", case=False, na=False)
-    ]
-
-    if champ_game.empty:
-        return {"winner": None}
-
-    champ_row = champ_game.iloc[0]
-
-    # Use home_score and away_score from games.csv
-    try:
-        champ_home = int(champ_row["home_score"])
-        champ_away = int(champ_row["away_score"])
-        champ_total_points = champ_home + champ_away
-    except Exception:
-        # If data not ready, do not declare a winner
+    # If data not ready, do not declare a winner
+    champ_total_points = championship_total_points(games_df)
+    if champ_total_points is None:
         return {"winner": None}
 
     # Load all user tiebreakers
     users_df = load_users()
-    users_df = users_df[users_df["group_name"] == group_name]
-    users_df["username"] = users_df["username"].astype(str).str.lower()
+    users_df = users_df[users_df["group_name"] == group_name].assign(
+        username=lambda d: d["username"].astype(str).str.lower()
+    )
 
     totals["username"] = totals["username"].astype(str).str.lower()
 
@@ -1255,6 +2021,19 @@ def api_winner(group_name):
         }
     }
 
+
+def get_winner(group_name) -> dict:
+    """compute_winner, once per group version and championship state."""
+    version = (group_version(group_name), championship_complete())
+    return COALESCE.do(("winner", group_name), version, lambda: compute_winner(group_name))
+
+
+@app.route("/api/<group_name>/winner")
+@require_group
+@rate_limited
+def api_winner(group_name):
+    return get_winner(group_name)
+
 @app.route("/api/<group_name>/<username>/has-submitted", methods=["GET"])
 @require_group
 def api_has_submitted(group_name, username):
@@ -1262,7 +2041,7 @@ def api_has_submitted(group_name, username):
     if not username:
         return {"submitted": False}
 
-    picks_df = load_picks()
+    picks_df = load_group_picks(group_name)
 
     # Filter just this group + username
     user_picks = picks_df[
@@ -1283,32 +2062,28 @@ def api_has_submitted(group_name, username):
 # ======================================================
 #               UPDATE SPREADS (CFBD odds)
 # ======================================================
-from jobs.update_spreads import update_spreads
-
 @app.post("/internal/update_spreads")
 def internal_update_spreads():
-    result = update_spreads()
-    return {"status": "success", "result": result}, 200
+    return start_job("update_spreads")
 
 
 
 
 # ===== PUBLIC PERMALINK LOOKUP =====
 @app.route("/api/p/<token>")
+@rate_limited
 def api_get_picks_by_token(token):
-    users_df = load_users()
-
-    row = users_df[users_df["token"] == token]
+    row = find_user_by_token(token)
 
-    if row.empty:
+    if row is None:
         return jsonify({"error": "Invalid link"}), 404
 
-    group_name = row.iloc[0]["group_name"]
-    username = row.iloc[0]["username"]
-    name = row.iloc[0]["name"]
-    tiebreaker = row.iloc[0]["tiebreaker"]
+    group_name = row["group_name"]
+    username = row["username"]
+    name = row["name"]
+    tiebreaker = row["tiebreaker"]
 
-    picks_df = load_picks()
+    picks_df = load_group_picks(group_name)
     games_df = load_games()
 
     # Filter picks for this user
@@ -1326,10 +2101,6 @@ def api_get_picks_by_token(token):
             "picks": []
         })
 
-    # Ensure string game_id for merge
-    user_picks["game_id"] = user_picks["game_id"].astype(str)
-    games_df["game_id"] = games_df["game_id"].astype(str)
-
     # Merge to compute correctness server-side
     merged = user_picks.merge(
         games_df[["game_id", "winner", "completed"]],
@@ -1338,10 +2109,7 @@ def api_get_picks_by_token(token):
     )
 
     merged["completed"] = merged["completed"].fillna(False)
-    merged["correct"] = (merged["completed"] == True) & merged.apply(
-        lambda r: normalize_team(r["selected_team"]) == normalize_team(r["winner"]),
-        axis=1
-    )
+    merged["correct"] = correct_picks(merged)
 
     return jsonify({
         "group": group_name,
@@ -1362,10 +2130,207 @@ def permalink_redirect(token):
 # ======================================================
 #               LOGOS / STATIC FILES
 # ======================================================
+# Content-hashed build output (build/logos/<name>.<hash>.png) never changes
+# under the same name → cache forever. Unhashed build files (manifest.json)
+# change on every deploy → always revalidate. Everything else gets a short
+# cache so edits still show up.
+STATIC_IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+STATIC_DEFAULT_MAX_AGE = 60 * 60
+HASHED_ASSET_RE = re.compile(r"^build/.+\.[0-9a-f]{10}\.[A-Za-z0-9]+$")
+
+
 @app.route("/static/<path:filename>")
 def static_files(filename):
-    static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
-    return send_from_directory(static_dir, filename)
+    if HASHED_ASSET_RE.match(filename):
+        response = send_from_directory(
+            STATIC_DIR, filename, max_age=STATIC_IMMUTABLE_MAX_AGE
+        )
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+
+    if filename.startswith("build/"):
+        response = send_from_directory(STATIC_DIR, filename)
+        response.cache_control.no_cache = True
+        return response
+
+    response = send_from_directory(STATIC_DIR, filename, max_age=STATIC_DEFAULT_MAX_AGE)
+    response.cache_control.public = True
+    return response
+
+
+# ======================================================
+#               PRECOMPUTE WORKER
+# Watches the data version (each CSV's shared generation counter plus its
+# mtime/size, so job runs, /internal/* triggers and manual edits all count)
+# and warms every group's derived results as soon as it changes; groups
+# whose shard didn't change are cache hits. Request handlers then find
+# them in COALESCE and only serialize.
+# ======================================================
+PRECOMPUTE_INTERVAL = float(os.getenv("PRECOMPUTE_INTERVAL", "1"))  # seconds; 0 disables
+PRECOMPUTE_WAKE = threading.Event()  # set() to run now instead of at the next tick
+
+
+def precompute_all() -> None:
+    eliminated_cfp_teams()
+    for group_name in ALLOWED_GROUPS.values():
+        get_standings(group_name)
+        get_picks_board(group_name)
+        get_pick_matrix(group_name)
+        get_winner(group_name)
+        get_group_top(group_name)
+
+
+def _precompute_loop():
+    last = None
+    while True:
+        PRECOMPUTE_WAKE.wait(PRECOMPUTE_INTERVAL)
+        PRECOMPUTE_WAKE.clear()
+
+        version = (data_version(), championship_complete())
+        if version == last:
+            continue
+        # Don't retry a failing version every tick; requests compute on demand
+        last = version
+        try:
+            precompute_all()
+        except Exception as e:
+            print(f"⚠️ precompute failed: {e}", flush=True)
+
+
+if PRECOMPUTE_INTERVAL > 0:
+    threading.Thread(target=_precompute_loop, name="precompute", daemon=True).start()
+
+
+# ======================================================
+#               LIVE SCORES (in-game)
+# One worker (whoever holds the live_scores lock) polls the CFBD
+# scoreboard while games are on and mirrors in-progress scores to
+# live_scores.json; games.csv only gets them in batches (jobs/live_scores.py).
+# Every worker reads that file for the provisional leaderboard.
+# ======================================================
+LIVE_POLL_INTERVAL = float(os.getenv("LIVE_POLL_INTERVAL", "30"))     # seconds; 0 disables
+LIVE_FLUSH_INTERVAL = float(os.getenv("LIVE_FLUSH_INTERVAL", "300"))  # seconds between games.csv writes
+LIVE_SCORES = LiveScores(GAMES_PATH, f"{DISK_DIR}/live_scores.json", flush_interval=LIVE_FLUSH_INTERVAL)
+
+_LIVE_STATE = (None, {})  # (file_version, state)
+
+
+def live_version():
+    return file_version(LIVE_SCORES.state_path)
+
+
+def live_state() -> dict:
+    """Parsed live_scores.json, re-read only when the file changes."""
+    global _LIVE_STATE
+    version = live_version()
+    if _LIVE_STATE[0] != version:
+        _LIVE_STATE = (version, read_state(LIVE_SCORES.state_path))
+    return _LIVE_STATE[1]
+
+
+def games_in_progress() -> bool:
+    """Any game kicked off but not completed — the only time polling is worth it."""
+    return any(
+        game_locked(game) and game["completed"] != True
+        for game in load_games().to_dict(orient="records")
+    )
+
+
+def provisional_games(games_df, live_games) -> pd.DataFrame:
+    """
+    games_df as if every live game ended at its current score: the team
+    ahead wins, tied games stay undecided.
+    """
+    if not live_games:
+        return games_df
+
+    key = pd.to_numeric(games_df["cfbd_game_id"], errors="coerce").map(
+        lambda x: None if pd.isna(x) else str(int(x))
+    )
+    home = pd.to_numeric(key.map(lambda k: live_games.get(k, {}).get("home_score")), errors="coerce")
+    away = pd.to_numeric(key.map(lambda k: live_games.get(k, {}).get("away_score")), errors="coerce")
+
+    decided = home.notna() & away.notna() & (home != away) & (games_df["completed"] != True)
+    leader = games_df["home_team"].where(home > away, games_df["away_team"])
+    return games_df.assign(
+        winner=games_df["winner"].mask(decided, leader),
+        completed=games_df["completed"].mask(decided, True),
+        # Current scores, not the last batch flushed to games.csv (tiebreaker)
+        home_score=pd.to_numeric(games_df["home_score"], errors="coerce").mask(decided, home),
+        away_score=pd.to_numeric(games_df["away_score"], errors="coerce").mask(decided, away),
+    )
+
+
+def get_provisional_standings(group_name) -> pd.DataFrame:
+    """Standings if current scores hold, once per group + live-state version."""
+    def compute():
+        games_df = provisional_games(load_games(), live_state().get("games", {}))
+        return compute_standings(group_name, load_group_picks(group_name), games_df, load_users())
+
+    version = (group_version(group_name), live_version())
+    return COALESCE.do(("provisional_standings", group_name), version, compute)
+
+
+@app.get("/api/<group_name>/leaderboard/provisional")
+@require_group
+def api_provisional_leaderboard(group_name):
+    state = live_state()
+    live_games = state.get("games", {})
+
+    games = []
+    for game in load_games().to_dict(orient="records"):
+        cfbd_id = pd.to_numeric(game["cfbd_game_id"], errors="coerce")
+        live = None if pd.isna(cfbd_id) else live_games.get(str(int(cfbd_id)))
+        if live is not None:
+            games.append({
+                "game_id": game["game_id"],
+                "bowl_name": game["bowl_name"],
+                "away_team": game["away_team"],
+                "home_team": game["home_team"],
+                **live,
+            })
+
+    provisional = get_provisional_standings(group_name)
+    if provisional.empty:
+        return {"leaderboard": [], "live_games": games, "as_of": state.get("updated_at")}
+
+    official = get_standings(group_name)
+    official_points = dict(zip(official["username"], official["total_points"]))
+    official_rank = dict(zip(official["username"], official["rank"]))
+
+    offset, limit = page_args()
+    end = None if limit is None else offset + limit
+
+    leaderboard = [
+        {
+            "username": username,
+            "name": name,
+            "total_points": int(points),
+            "rank": int(rank),
+            "official_points": int(official_points.get(username, 0)),
+            "official_rank": int(official_rank.get(username, rank)),
+        }
+        for username, name, points, rank in zip(
+            provisional["username"], provisional["name"], provisional["total_points"], provisional["rank"]
+        )
+    ][offset:end]
+
+    return {
+        "leaderboard": leaderboard,
+        "total_users": len(provisional),
+        "live_games": games,
+        "as_of": state.get("updated_at"),
+    }
+
+
+if LIVE_POLL_INTERVAL > 0:
+    threading.Thread(
+        target=LIVE_SCORES.run_forever,
+        args=(LIVE_POLL_INTERVAL, f"{DISK_DIR}/.locks/live_scores.lock", games_in_progress),
+        name="live-scores",
+        daemon=True,
+    ).start()
 
 
 # ======================================================
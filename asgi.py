@@ -0,0 +1,174 @@
+"""
+ASGI serving mode for high-concurrency polling (championship night):
+
+    uvicorn asgi:app --host 0.0.0.0 --port $PORT --timeout-keep-alive 75
+
+Every Flask route is served unchanged. Requests run on a bounded thread
+pool, so idle or slow keep-alive connections cost an event-loop socket
+instead of a worker thread. The polling endpoints (leaderboard,
+leaderboard_top5, provisional leaderboard, winner) are answered straight
+from the event loop with a cached response while the data hasn't
+changed. Only the first poll after a write touches the thread pool.
+Cached answers still count against the route's @rate_limited buckets;
+a caller over the limit is passed through to Flask for its 429.
+
+No dependencies beyond the ASGI server itself.
+"""
+import asyncio
+import io
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from app import app as flask_app
+from app import championship_complete, client_ip, group_version, live_version, rate_limit_wait
+
+THREADS = int(os.getenv("ASGI_THREADS", "16"))
+EXECUTOR = ThreadPoolExecutor(max_workers=THREADS, thread_name_prefix="wsgi")
+
+# GET routes whose response depends only on the CSVs (and the clock, for winner)
+POLL_ROUTES = re.compile(r"^/api/([^/]+)/(leaderboard|leaderboard_top5|leaderboard/provisional|winner)$")
+
+# (path, query, origin) → (version, status, headers, body)
+_POLL_CACHE = {}
+POLL_CACHE_MAX = 1024  # distinct query strings are client-controlled
+
+
+def poll_version(group_name):
+    """Changes whenever a cached poll response for the group could change."""
+    return (group_version(group_name), championship_complete(), live_version())
+
+
+_URLS = flask_app.url_map.bind("localhost")
+
+
+def rate_limit_allows(scope) -> bool:
+    """Same bucket check as the route's @rate_limited, for a request answered from cache."""
+    endpoint, _ = _URLS.match(scope["path"], method="GET")
+    if not getattr(flask_app.view_functions[endpoint], "rate_limited", False):
+        return True
+
+    forwarded = b",".join(v for k, v in scope["headers"] if k == b"x-forwarded-for").decode("latin-1")
+    remote = (scope.get("client") or ("", 0))[0]
+    return not rate_limit_wait(endpoint, client_ip(forwarded, remote))
+
+
+# ======================================================
+#               WSGI BRIDGE
+# ======================================================
+
+def _environ(scope, body: bytes) -> dict:
+    headers = {}
+    for name, value in scope["headers"]:
+        key = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        headers[key] = f"{headers[key]},{value}" if key in headers else value
+
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope["query_string"].decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope['http_version']}",
+        "REMOTE_ADDR": client[0],
+        "CONTENT_TYPE": headers.pop("CONTENT_TYPE", ""),
+        "CONTENT_LENGTH": headers.pop("CONTENT_LENGTH", str(len(body))),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for key, value in headers.items():
+        environ[f"HTTP_{key}"] = value
+    return environ
+
+
+def _run_wsgi(environ):
+    """Call the Flask app synchronously (on a pool thread); buffer the response."""
+    started = {}
+
+    def start_response(status, headers, exc_info=None):
+        started["status"] = int(status.split(" ", 1)[0])
+        started["headers"] = headers
+
+    result = flask_app(environ, start_response)
+    try:
+        body = b"".join(result)
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+
+    headers = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in started["headers"]]
+    return started["status"], headers, body
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    return b"".join(chunks)
+
+
+async def _send(send, status, headers, body):
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+# ======================================================
+#               ASGI APP
+# ======================================================
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            EXECUTOR.shutdown(wait=False)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        return await _lifespan(receive, send)
+    if scope["type"] != "http":
+        return
+
+    body = await _read_body(receive)
+    loop = asyncio.get_running_loop()
+
+    cache_key = None
+    poll = POLL_ROUTES.match(scope["path"]) if scope["method"] == "GET" else None
+    if poll:
+        origin = dict(scope["headers"]).get(b"origin", b"")
+        cache_key = (scope["path"], scope["query_string"], origin)
+        # group_version() stats the CSVs and re-reads users.csv on a miss: keep it off the loop
+        version = await loop.run_in_executor(EXECUTOR, poll_version, poll.group(1))
+
+        cached = _POLL_CACHE.get(cache_key)
+        if cached is not None and cached[0] == version and rate_limit_allows(scope):
+            return await _send(send, *cached[1:])
+
+    status, headers, out = await loop.run_in_executor(EXECUTOR, _run_wsgi, _environ(scope, body))
+
+    if cache_key is not None and status == 200:
+        if len(_POLL_CACHE) >= POLL_CACHE_MAX:
+            _POLL_CACHE.clear()
+        _POLL_CACHE[cache_key] = (version, status, headers, out)
+
+    await _send(send, status, headers, out)
@@ -0,0 +1,165 @@
+"""
+Offline benchmark of the CFBD jobs against the local mock server.
+
+    python bench_jobs.py --runs 20
+    python bench_jobs.py --fixtures fixtures/cfbd --latency 150 --jitter 100
+    python bench_jobs.py --budget update_spreads=500   # exit 1 if p95 is over
+
+--games (default storage/real_games.csv) must have final scores: the mock
+serves results from it, and update_winners_live has nothing to do without
+them. --fixtures replays payloads recorded with mock_cfbd.py --record and
+synthesizes whatever the directory lacks.
+
+Each run starts from a cold copy of games.csv in a temp dir (no CFBD ids,
+results or spreads, so every job has real work to do), then runs
+assign_cfbd_ids_live → update_winners_live → update_spreads in game-day
+order and times each end to end. Nothing under storage/ is touched.
+
+Exits 1 if any job raised or left games.csv unchanged in any run (a
+no-op run times nothing useful), or if a --budget is exceeded.
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+from load_test import pct
+from mock_cfbd import serve
+
+
+def write_cold_games(src, dst):
+    """games.csv as it looks before any job has run."""
+    df = pd.read_csv(src)
+    df["cfbd_game_id"] = pd.NA
+    for col in ("winner", "away_score", "home_score", "spread"):
+        df[col] = pd.NA
+    df["completed"] = False
+    df.to_csv(dst, index=False)
+
+
+def load_jobs():
+    """(name, fn(games_csv, spreads_csv)) in run order. Import after CFBD_BASE_URL is set."""
+    from jobs import assign_cfb_ids_live, update_winners_live
+    from jobs.update_spreads import update_spreads
+
+    return [
+        ("assign_cfbd_ids_live", lambda games, spreads: assign_cfb_ids_live.main(games)),
+        ("update_winners_live", lambda games, spreads: update_winners_live.main(games)),
+        ("update_spreads", lambda games, spreads: update_spreads(games, spreads)),
+    ]
+
+
+def changed_rows(before, after) -> int:
+    """games.csv rows a job changed, in any column (columns it added count too)."""
+    columns = before.columns.union(after.columns)
+    # NaN != NaN, so blank cells are compared as ""
+    before = before.reindex(columns=columns).astype(object).fillna("").astype(str)
+    after = after.reindex(columns=columns).astype(object).fillna("").astype(str)
+    if len(before) != len(after):
+        return max(len(before), len(after))
+    return int(before.ne(after).any(axis=1).sum())
+
+
+def parse_budgets(items) -> dict:
+    budgets = {}
+    for item in items or []:
+        name, _, ms = item.partition("=")
+        budgets[name] = float(ms)
+    return budgets
+
+
+def main(args):
+    server = serve(
+        args.games, port=0, fixtures_dir=args.fixtures,
+        latency_ms=args.latency, jitter_ms=args.jitter, error_rate=args.error_rate,
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+
+    os.environ["CFBD_BASE_URL"] = f"http://{host}:{port}"
+    os.environ.setdefault("CFBD_API_KEY", "mock")
+    jobs = load_jobs()
+
+    timings = {name: [] for name, _ in jobs}
+    failures = {name: 0 for name, _ in jobs}
+    calls = {name: 0 for name, _ in jobs}
+    updates = {name: [] for name, _ in jobs}  # games.csv rows changed, per run
+
+    work_dir = tempfile.mkdtemp(prefix="bench_jobs_")
+    games_csv = os.path.join(work_dir, "games.csv")
+    spreads_csv = os.path.join(work_dir, "spreads.csv")
+    try:
+        for _ in range(args.runs):
+            write_cold_games(args.games, games_csv)
+            if os.path.exists(spreads_csv):
+                os.remove(spreads_csv)
+
+            for name, fn in jobs:
+                before = pd.read_csv(games_csv)
+                hits_before = sum(server.hits.values())
+                out = sys.stdout if args.verbose else io.StringIO()
+                start = time.perf_counter()
+                try:
+                    with contextlib.redirect_stdout(out):
+                        fn(games_csv, spreads_csv)
+                except Exception as e:
+                    failures[name] += 1
+                    if args.verbose:
+                        print(f"❌ {name}: {e}")
+                timings[name].append((time.perf_counter() - start) * 1000)
+                calls[name] += sum(server.hits.values()) - hits_before
+                updates[name].append(changed_rows(before, pd.read_csv(games_csv)))
+    finally:
+        server.shutdown()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    budgets = parse_budgets(args.budget)
+    over = []
+    broken = []
+    print(f"🏈 {args.runs} runs against mock CFBD ({args.fixtures or args.games})")
+    for name, _ in jobs:
+        ms = sorted(timings[name])
+        p95 = pct(ms, 95)
+        idle = sum(n == 0 for n in updates[name])
+        print(
+            f"⏱️ {name:<22} p50 {pct(ms, 50):7.1f}  p95 {p95:7.1f}  max {ms[-1]:7.1f} ms  "
+            f"{calls[name] / args.runs:.1f} calls/run  {min(updates[name])}-{max(updates[name])} rows/run  "
+            f"{failures[name]} failed"
+        )
+        if failures[name]:
+            broken.append(f"{name} failed in {failures[name]}/{args.runs} runs")
+        if idle:
+            broken.append(f"{name} changed nothing in {idle}/{args.runs} runs")
+        if name in budgets and p95 > budgets[name]:
+            over.append(f"{name} p95 {p95:.1f} ms > {budgets[name]:.0f} ms")
+
+    for line in broken:
+        print(f"🚨 not measuring real work: {line}")
+    for line in over:
+        print(f"🚨 over budget: {line}")
+    return 1 if over or broken else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--games", default="storage/real_games.csv",
+        help="games with final scores; the mock serves results from it",
+    )
+    parser.add_argument("--fixtures", help="recorded payloads to replay (see mock_cfbd.py --record)")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0, help="mock ms per response")
+    parser.add_argument("--jitter", type=float, default=0, help="extra random mock ms")
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of mock requests that fail")
+    parser.add_argument("--budget", action="append", metavar="JOB=MS", help="fail if the job's p95 exceeds MS")
+    parser.add_argument("--verbose", action="store_true", help="show job output")
+    args = parser.parse_args()
+
+    raise SystemExit(main(args))
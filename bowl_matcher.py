@@ -0,0 +1,138 @@
+"""
+Match games.csv rows to CFBD games.
+
+All CFBD candidates (any number of seasons) are indexed once: exact bowl
+notes, canonical team pair, kickoff minute and an inverted index of note
+tokens. A lookup touches only candidates that share at least one signal
+and returns the best one with a confidence score.
+"""
+import re
+from collections import defaultdict
+
+from team_names import team_id
+
+# Weights per signal. Exact notes outrank a team-pair match, which
+# outranks kickoff time; fuzzy notes similarity fills in the rest.
+WEIGHT_NOTES = 0.55
+WEIGHT_TEAMS = 0.30
+WEIGHT_KICKOFF = 0.15
+WEIGHT_FUZZY = 0.50
+
+# Old matcher accepted Jaccard >= 0.35 on its own
+MIN_CONFIDENCE = 0.35 * WEIGHT_FUZZY
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def notes_key(s) -> str:
+    """Alphanumeric-only lowercase string, for exact bowl-name comparison."""
+    if not isinstance(s, str):
+        return ""
+    return "".join(c.lower() for c in s if c.isalnum())
+
+
+def tokens(s) -> frozenset:
+    if not isinstance(s, str):
+        return frozenset()
+    return frozenset(_TOKEN.findall(s.lower()))
+
+
+def kickoff_key(s) -> str:
+    """'YYYY-MM-DDTHH:MM' from either CSV or CFBD datetime strings."""
+    if not isinstance(s, str):
+        return ""
+    return s.replace(" ", "T").replace("Z", "")[:16]
+
+
+class BowlMatcher:
+    def __init__(self, games):
+        self.games = [g for g in games if g.get("id")]
+
+        # Every index is keyed by (season, ...) so a lookup for one season
+        # never walks candidates from the others
+        self.by_notes = defaultdict(list)
+        self.by_teams = defaultdict(list)
+        self.by_kickoff = defaultdict(list)
+        self.by_token = defaultdict(list)
+        self.token_counts = []
+        self.seasons = set()
+
+        for i, g in enumerate(self.games):
+            season = g.get("season")
+            self.seasons.add(season)
+            notes = g.get("notes")
+
+            key = notes_key(notes)
+            if key:
+                self.by_notes[(season, key)].append(i)
+
+            home, away = team_id(g.get("homeTeam")), team_id(g.get("awayTeam"))
+            if home is not None and away is not None:
+                self.by_teams[(season, home, away)].append(i)
+
+            kickoff = kickoff_key(g.get("startDate"))
+            if kickoff:
+                self.by_kickoff[(season, kickoff)].append(i)
+
+            toks = tokens(notes)
+            for tok in toks:
+                self.by_token[(season, tok)].append(i)
+            self.token_counts.append(len(toks))
+
+    def rank(self, bowl_name, home_team=None, away_team=None, kickoff=None, season=None):
+        """
+        All candidates sharing at least one signal, best first, as
+        (confidence, cfbd_game, signals) tuples. Games without a season
+        are considered for every season.
+        """
+        seasons = self.seasons if season is None else {season, None} & self.seasons
+
+        scores = defaultdict(float)
+        signals = defaultdict(list)
+
+        notes = notes_key(bowl_name)
+        home, away = team_id(home_team), team_id(away_team)
+        kick = kickoff_key(kickoff)
+        query = tokens(bowl_name)
+        shared = defaultdict(int)
+
+        for s in seasons:
+            for i in self.by_notes.get((s, notes), []) if notes else []:
+                scores[i] += WEIGHT_NOTES
+                signals[i].append("notes")
+
+            if home is not None and away is not None:
+                for i in self.by_teams.get((s, home, away), []):
+                    scores[i] += WEIGHT_TEAMS
+                    signals[i].append("teams")
+
+            for i in self.by_kickoff.get((s, kick), []) if kick else []:
+                scores[i] += WEIGHT_KICKOFF
+                signals[i].append("kickoff")
+
+            # Sparse Jaccard: count shared tokens through the inverted index
+            for tok in query:
+                for i in self.by_token.get((s, tok), []):
+                    shared[i] += 1
+
+        for i, inter in shared.items():
+            if "notes" in signals[i]:
+                continue
+            jaccard = inter / (len(query) + self.token_counts[i] - inter)
+            scores[i] += WEIGHT_FUZZY * jaccard
+            signals[i].append(f"fuzzy:{jaccard:.2f}")
+
+        ranked = [
+            (min(score, 1.0), self.games[i], signals[i])
+            for i, score in scores.items()
+        ]
+        ranked.sort(key=lambda r: r[0], reverse=True)
+        return ranked
+
+    def match(self, bowl_name, home_team=None, away_team=None, kickoff=None, season=None,
+              min_confidence=MIN_CONFIDENCE):
+        """Best (confidence, cfbd_game, signals) above min_confidence, or None."""
+        ranked = self.rank(bowl_name, home_team, away_team, kickoff, season)
+        if ranked and ranked[0][0] >= min_confidence:
+            return ranked[0]
+        return None
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import shutil
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional locally; WebP variants are skipped
+    Image = None
+
+# ======================================================
+#               CONFIG
+# ======================================================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOGO_DIR = os.path.join(BASE_DIR, "static", "logos")
+BUILD_DIR = os.path.join(BASE_DIR, "static", "build")
+MANIFEST_PATH = os.path.join(BUILD_DIR, "manifest.json")
+
+WEBP_QUALITY = 80
+# Bowl-list logos are small; 128px stays sharp even on 2x screens
+WEBP_MAX_PX = 128
+
+
+# ======================================================
+#               HELPERS
+# ======================================================
+
+def content_hash(path, length=10):
+    """Short sha256 of a file's bytes — changes whenever the logo changes."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()[:length]
+
+
+def write_webp(src, dst):
+    """Write a downscaled WebP copy of a PNG logo (keeps transparency)."""
+    with Image.open(src) as img:
+        img.thumbnail((WEBP_MAX_PX, WEBP_MAX_PX))
+        img.save(dst, "WEBP", quality=WEBP_QUALITY, method=4)
+
+
+# ======================================================
+#               MAIN
+# ======================================================
+
+def build():
+    """
+    Copy every logo to static/build/logos/<name>.<hash>.png (plus a .webp
+    variant when Pillow is installed) and write manifest.json mapping the
+    original /static/logos/... URLs to the hashed ones.
+    """
+    out_dir = os.path.join(BUILD_DIR, "logos")
+    shutil.rmtree(BUILD_DIR, ignore_errors=True)
+    os.makedirs(out_dir, exist_ok=True)
+
+    if Image is None:
+        print("⚠️ Pillow not installed — skipping WebP variants.")
+
+    manifest = {}
+    png_bytes = 0
+    webp_bytes = 0
+
+    for filename in sorted(os.listdir(LOGO_DIR)):
+        if not filename.lower().endswith(".png"):
+            continue
+
+        src = os.path.join(LOGO_DIR, filename)
+        stem = os.path.splitext(filename)[0]
+        hashed = f"{stem}.{content_hash(src)}"
+
+        shutil.copyfile(src, os.path.join(out_dir, f"{hashed}.png"))
+        entry = {"png": f"/static/build/logos/{hashed}.png"}
+        png_bytes += os.path.getsize(src)
+
+        if Image is not None:
+            webp_path = os.path.join(out_dir, f"{hashed}.webp")
+            write_webp(src, webp_path)
+            entry["webp"] = f"/static/build/logos/{hashed}.webp"
+            webp_bytes += os.path.getsize(webp_path)
+
+        manifest[f"/static/logos/{filename}"] = entry
+
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    print(f"✅ Built {len(manifest)} logos → {BUILD_DIR}")
+    if webp_bytes:
+        print(f"   PNG {png_bytes / 1024:.0f} KB → WebP {webp_bytes / 1024:.0f} KB")
+
+    return manifest
+
+
+if __name__ == "__main__":
+    build()
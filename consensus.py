@@ -0,0 +1,162 @@
+"""
+Per-game pick distribution ("consensus") for every group, kept in a small
+SQLite table shared by all workers.
+
+confirm_picks applies each submission as a delta (the user's old picks
+out, new picks in), so reading the consensus never scans the picks. The
+table records which version of each group's picks shard it matches; if a
+shard changed some other way (manual edit, restore), the next read for
+that group rebuilds that group once.
+"""
+import json
+import os
+import sqlite3
+from collections import Counter
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS consensus (
+    group_name TEXT NOT NULL,
+    game_id    TEXT NOT NULL,
+    team       TEXT NOT NULL,
+    picks      INTEGER NOT NULL,
+    points     INTEGER NOT NULL,
+    PRIMARY KEY (group_name, game_id, team)
+);
+CREATE TABLE IF NOT EXISTS consensus_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+UPSERT = """
+INSERT INTO consensus (group_name, game_id, team, picks, points)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (group_name, game_id, team) DO UPDATE SET
+    picks = picks + excluded.picks,
+    points = points + excluded.points
+"""
+
+
+def _file_version(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+class ConsensusStore:
+    def __init__(self, path, shard_path):
+        self.path = path
+        self.shard_path = shard_path  # group_name → its picks CSV
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    def _mark_synced(self, conn, group_name, version=None):
+        """Record that the table matches `version` of the shard (default: as it is now)."""
+        if version is None:
+            version = _file_version(self.shard_path(group_name))
+        conn.execute(
+            "INSERT OR REPLACE INTO consensus_meta (key, value) VALUES (?, ?)",
+            (f"picks_version:{group_name}", json.dumps(version)),
+        )
+
+    def _synced(self, conn, group_name, version=None) -> bool:
+        """Whether the table matches `version` of the shard (default: as it is now)."""
+        if version is None:
+            version = _file_version(self.shard_path(group_name))
+        row = conn.execute(
+            "SELECT value FROM consensus_meta WHERE key = ?", (f"picks_version:{group_name}",)
+        ).fetchone()
+        return row is not None and json.loads(row[0]) == version
+
+    def shard_version(self, group_name):
+        """Take just before and just after writing a shard; pass both to apply()."""
+        return _file_version(self.shard_path(group_name))
+
+    def apply(self, group_name, removed, added, previous_version, new_version) -> None:
+        """
+        Call right after writing the group's picks shard, still holding its
+        file lock. `removed`/`added` are iterables of (game_id, team,
+        point_value) for one user's replaced/new picks; previous_version and
+        new_version are shard_version() from just before and just after the
+        write. The table is then marked synced at new_version, the shard
+        this delta produced, whatever is on disk by now. A delta on top of
+        a table that didn't match previous_version (never built, or edited
+        out of band) would be wrong, so then nothing is applied and the
+        next read rebuilds the group.
+        """
+        delta = Counter()
+        points = Counter()
+        for sign, picks in ((-1, removed), (1, added)):
+            for game_id, team, point_value in picks:
+                key = (str(game_id), str(team))
+                delta[key] += sign
+                points[key] += sign * int(point_value)
+
+        rows = [
+            (group_name, game_id, team, n, points[(game_id, team)])
+            for (game_id, team), n in delta.items()
+            if n or points[(game_id, team)]
+        ]
+
+        with self._connect() as conn:
+            if not self._synced(conn, group_name, previous_version):
+                return
+            conn.executemany(UPSERT, rows)
+            conn.execute("DELETE FROM consensus WHERE picks <= 0")
+            self._mark_synced(conn, group_name, new_version)
+
+    def rebuild(self, group_name, picks_df, version=None) -> None:
+        """
+        Recount one group from its picks frame (only after out-of-band edits).
+        `version` is shard_version() taken before picks_df was read; without
+        it the table is marked synced at the shard as it is now, which is only
+        right if nothing can have written the shard since the read.
+        """
+        picks_df = picks_df[picks_df["group_name"] == group_name]
+        grouped = (
+            picks_df.assign(
+                game_id=picks_df["game_id"].astype(str),
+                team=picks_df["selected_team"].astype(str),
+            )
+            .groupby(["group_name", "game_id", "team"], as_index=False)
+            .agg(picks=("team", "size"), points=("point_value", "sum"))
+        )
+        rows = [
+            (g, gid, team, int(n), int(p))
+            for g, gid, team, n, p in grouped.itertuples(index=False)
+        ]
+        with self._connect() as conn:
+            conn.execute("DELETE FROM consensus WHERE group_name = ?", (group_name,))
+            conn.executemany(UPSERT, rows)
+            self._mark_synced(conn, group_name, version)
+
+    def counts(self, group_name, load_picks):
+        """
+        {game_id: {team: (picks, points)}} for a group. `load_picks` returns
+        the group's picks and is only called if its shard changed without
+        going through apply().
+        """
+        # Taken before reading the picks: a submit landing after the read
+        # leaves the table marked at this older version, so the next call
+        # rebuilds again instead of trusting counts that miss it
+        version = self.shard_version(group_name)
+        with self._connect() as conn:
+            synced = self._synced(conn, group_name, version)
+        if not synced:
+            print(f"🔄 consensus out of sync with {group_name}'s picks — rebuilding", flush=True)
+            self.rebuild(group_name, load_picks(), version)
+
+        out = {}
+        with self._connect() as conn:
+            for game_id, team, picks, points in conn.execute(
+                "SELECT game_id, team, picks, points FROM consensus WHERE group_name = ?",
+                (group_name,),
+            ):
+                out.setdefault(game_id, {})[team] = (picks, points)
+        return out
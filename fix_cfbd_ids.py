@@ -3,6 +3,8 @@ import requests
 import os
 from dotenv import load_dotenv
 
+from bowl_matcher import BowlMatcher
+
 load_dotenv()
 
 API_KEY = os.getenv("CFBD_API_KEY")
@@ -10,30 +12,6 @@ HEADERS = {"Authorization": f"Bearer " + API_KEY}
 
 CSV_PATH = "storage_seed/games.csv"
 
-# -----------------------------
-# Normalization Helpers
-# -----------------------------
-def normalize(s):
-    if not isinstance(s, str):
-        return ""
-    return "".join(c.lower() for c in s if c.isalnum())
-
-
-def tokenize(s):
-    return set(normalize(s).split())
-
-
-def similarity(a, b):
-    """Simple fuzzy similarity: Jaccard between word sets."""
-    if not a or not b:
-        return 0
-    ta = set(a.lower().split())
-    tb = set(b.lower().split())
-    if not ta or not tb:
-        return 0
-    return len(ta & tb) / len(ta | tb)
-
-
 # -----------------------------
 # CFBD Fetch
 # -----------------------------
@@ -53,86 +31,43 @@ def fetch_postseason(year):
 def main():
     df = pd.read_csv(CSV_PATH)
 
-    df["year"] = df["kickoff_datetime"].str[:4].astype(int)
-    years = df["year"].unique()
+    # CFBD seasons start in August: January bowls belong to the prior year
+    kickoff = pd.to_datetime(df["kickoff_datetime"])
+    df["season"] = kickoff.dt.year - (kickoff.dt.month < 8).astype(int)
 
-    cfbd_data = {}
-    for y in years:
+    games = []
+    for y in sorted(df["season"].unique()):
         print(f"Fetching CFBD postseason games for {y}...")
-        cfbd_data[y] = fetch_postseason(y)
+        games.extend(fetch_postseason(int(y)))
+
+    # One index over every season's games
+    matcher = BowlMatcher(games)
 
     if "cfbd_game_id" not in df.columns:
         df["cfbd_game_id"] = ""
 
     for idx, row in df.iterrows():
-        y = row["year"]
         bowl_csv = row["bowl_name"]
-        bowl_norm = normalize(bowl_csv)
-        home_norm = normalize(row["home_team"])
-        away_norm = normalize(row["away_team"])
-        kickoff_csv = row["kickoff_datetime"].replace(" ", "T")
-
-        candidates = cfbd_data[y]
-        matched_id = None
-
-        # --------------------------
-        # 1. Exact bowl name match
-        # --------------------------
-        for g in candidates:
-            if normalize(g.get("notes")) == bowl_norm:
-                matched_id = g["id"]
-                break
-
-        # --------------------------
-        # 2. Exact home/away match
-        # --------------------------
-        if matched_id is None:
-            for g in candidates:
-                if (
-                    normalize(g.get("homeTeam")) == home_norm
-                    and normalize(g.get("awayTeam")) == away_norm
-                ):
-                    matched_id = g["id"]
-                    break
-
-        # --------------------------
-        # 3. Kickoff datetime match
-        # --------------------------
-        if matched_id is None:
-            for g in candidates:
-                api_time = str(g.get("startDate", "")).replace("Z", "")
-                if api_time.startswith(kickoff_csv):
-                    matched_id = g["id"]
-                    break
-
-        # --------------------------
-        # 4. FUZZY bowl-name match
-        # --------------------------
-        if matched_id is None:
-            best_score = 0
-            best_id = None
-
-            for g in candidates:
-                api_bowl = g.get("notes", "")
-                score = similarity(api_bowl, bowl_csv)
-                if score > best_score:
-                    best_score = score
-                    best_id = g["id"]
 
-            # Accept if similarity is high enough
-            if best_score >= 0.35:
-                matched_id = best_id
+        result = matcher.match(
+            bowl_csv,
+            home_team=row["home_team"],
+            away_team=row["away_team"],
+            kickoff=row["kickoff_datetime"],
+            season=int(row["season"]),
+        )
 
         # --------------------------
         # Save result
         # --------------------------
-        if matched_id:
-            print(f"Matched {bowl_csv} → {matched_id}")
-            df.loc[idx, "cfbd_game_id"] = matched_id
+        if result:
+            confidence, game, signals = result
+            print(f"Matched {bowl_csv} → {game['id']} ({confidence:.2f}: {', '.join(signals)})")
+            df.loc[idx, "cfbd_game_id"] = game["id"]
         else:
             print(f"WARNING: Could not match: {bowl_csv}")
 
-    df.drop(columns=["year"], inplace=True)
+    df.drop(columns=["season"], inplace=True)
     df.to_csv(CSV_PATH, index=False)
     print("\nDONE — Fuzzy-matched CFBD game IDs written.\n")
 
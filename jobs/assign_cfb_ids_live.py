@@ -1,53 +1,46 @@
 import pandas as pd
-import requests
-import os
-from datetime import datetime
+import pytz
+from datetime import datetime, timezone
+
+from bowl_matcher import MIN_CONFIDENCE, BowlMatcher
+from jobs import cfbd
+from jobs.runner import file_lock
+from snapshots import publish, write_csv
+from team_names import logo_path, same_team
 
 # ======================================================
 #                CONFIGURATION
 # ======================================================
 
-API_KEY = os.getenv("CFBD_API_KEY")
-HEADERS = {"Authorization": f"Bearer {API_KEY}"}
-
 CSV_PATH = "/opt/render/project/src/storage/games.csv"
-
-LOGO_PATH = "/static/logos"  # Adjust if needed
+PACIFIC = pytz.timezone("US/Pacific")
 
 
 # ======================================================
 #                HELPER FUNCTIONS
 # ======================================================
 
-def normalize(s):
-    """Return lowercase, punctuation-stripped string for matching."""
-    if not isinstance(s, str):
-        return ""
-    return s.lower().replace("'", "").replace(",", "").strip()
-
-
 def parse_dt(dt_str):
-    """Parse datetime safely."""
+    """
+    Parse datetime safely, always timezone-aware so CSV and CFBD times
+    compare: naive games.csv kickoffs are US/Pacific, like the app's locks.
+    """
     try:
-        return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
     except:
         return None
+    if dt.tzinfo is None:
+        dt = PACIFIC.localize(dt)
+    return dt
 
 
 def fetch_postseason_games():
-    """Fetch all postseason games for the year."""
+    """Fetch all postseason games for the year (raises so the runner retries)."""
     try:
-        resp = requests.get(
-            "https://api.collegefootballdata.com/games",
-            params={"year": 2025, "seasonType": "postseason"},
-            headers=HEADERS,
-            timeout=10
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return cfbd.get("/games", year=2025, seasonType="postseason")
     except Exception as e:
         print(f"⚠️ Error fetching CFBD postseason games: {e}")
-        return []
+        raise
 
 
 # ======================================================
@@ -56,10 +49,15 @@ def fetch_postseason_games():
 
 def assign_cfbd_ids(df, games):
     """
-    Assign missing CFBD game IDs by matching kickoff datetime,
-    bowl name (via notes/venue), or location.
+    Assign missing CFBD game IDs with the shared BowlMatcher (bowl name,
+    team pair, kickoff). Each CFBD game is assigned to at most one row:
+    a row whose best candidate is taken gets its next-best one.
     """
     updated = False
+    matcher = BowlMatcher(games)
+
+    ids = pd.to_numeric(df["cfbd_game_id"], errors="coerce")
+    used = set(ids[ids > 0].astype(int))
 
     for idx, row in df.iterrows():
         existing = row.get("cfbd_game_id")
@@ -68,37 +66,28 @@ def assign_cfbd_ids(df, games):
         if pd.notna(existing) and int(existing) != 0:
             continue
 
-        csv_bowl = normalize(row["bowl_name"])
-        csv_loc = normalize(row["location"])
         csv_dt = parse_dt(row["kickoff_datetime"])
 
         if csv_dt is None:
             print(f"⚠️ Row {idx}: invalid kickoff datetime → {row['kickoff_datetime']}")
             continue
 
-        for g in games:
-            cfbd_dt = parse_dt(g.get("startDate"))
-            if cfbd_dt is None:
-                continue
-
-            # 1) Match on datetime
-            datetime_match = abs((cfbd_dt - csv_dt).total_seconds()) < 5
+        # CFBD startDates are UTC
+        kickoff = csv_dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M")
+        ranked = matcher.rank(row["bowl_name"], row["home_team"], row["away_team"], kickoff)
 
-            # 2) Match on bowl name or venue
-            notes = normalize(g.get("notes", ""))
-            venue = normalize(g.get("venue", ""))
-
-            bowl_match = (
-                csv_bowl in notes or notes in csv_bowl or
-                csv_bowl in venue or venue in csv_loc
-            )
-
-            if datetime_match or bowl_match:
-                new_id = g["id"]
-                print(f"✔ Assigned CFBD ID {new_id} → {row['bowl_name']}")
-                df.loc[idx, "cfbd_game_id"] = int(new_id)
-                updated = True
+        for confidence, g, signals in ranked:
+            if confidence < MIN_CONFIDENCE:
                 break
+            if g["id"] in used:
+                continue
+            print(f"✔ Assigned CFBD ID {g['id']} → {row['bowl_name']} ({confidence:.2f}: {', '.join(signals)})")
+            df.loc[idx, "cfbd_game_id"] = int(g["id"])
+            used.add(g["id"])
+            updated = True
+            break
+        else:
+            print(f"⚠️ No CFBD match for {row['bowl_name']}")
 
     return updated
 
@@ -134,7 +123,7 @@ def update_teams_from_cfbd(df, games):
             continue
 
         # Only update if different from CSV
-        if row["home_team"] != home or row["away_team"] != away:
+        if not (same_team(row["home_team"], home) and same_team(row["away_team"], away)):
             print(f"✔ Updating matchup for {row['bowl_name']}: {away} vs {home}")
 
             # Team names
@@ -145,9 +134,9 @@ def update_teams_from_cfbd(df, games):
             df.loc[idx, "home_record"] = match.get("homeRecord", "")
             df.loc[idx, "away_record"] = match.get("awayRecord", "")
 
-            # Logos (assumes team name = logo file name)
-            df.loc[idx, "home_logo"] = f"{LOGO_PATH}/{home.replace(' ', '_')}.png"
-            df.loc[idx, "away_logo"] = f"{LOGO_PATH}/{away.replace(' ', '_')}.png"
+            # Logos
+            df.loc[idx, "home_logo"] = logo_path(home)
+            df.loc[idx, "away_logo"] = logo_path(away)
 
             updated = True
 
@@ -158,31 +147,35 @@ def update_teams_from_cfbd(df, games):
 #                MAIN ENTRYPOINT
 # ======================================================
 
-def main():
+def main(csv_path=CSV_PATH):
+    """Returns a status dict; raises on any failure so the runner records and retries it."""
     print("🔄 Running CFBD ID + team updater...")
 
-    try:
-        df = pd.read_csv(CSV_PATH)
-    except Exception as e:
-        print(f"❌ Could not read games.csv: {e}")
-        return {"status": "error", "details": str(e)}
-
     games = fetch_postseason_games()
     if not games:
         print("⚠️ No postseason games returned from API.")
         return {"status": "no_api_data"}
 
-    id_updates = assign_cfbd_ids(df, games)
-    team_updates = update_teams_from_cfbd(df, games)
-
-    if id_updates or team_updates:
+    # Shared with every games.csv writer; held only for the read-modify-write
+    with file_lock(csv_path):
         try:
-            df.to_csv(CSV_PATH, index=False)
+            df = pd.read_csv(csv_path)
+        except Exception as e:
+            print(f"❌ Could not read games.csv: {e}")
+            raise
+
+        id_updates = assign_cfbd_ids(df, games)
+        team_updates = update_teams_from_cfbd(df, games)
+
+        if id_updates or team_updates:
+            try:
+                write_csv(df, csv_path)
+                publish(csv_path)
+            except Exception as e:
+                print(f"❌ Failed to save CSV: {e}")
+                raise
             print("💾 Saved updates to games.csv")
             return {"status": "updated"}
-        except Exception as e:
-            print(f"❌ Failed to save CSV: {e}")
-            return {"status": "save_error", "details": str(e)}
 
     print("ℹ️ No changes needed.")
     return {"status": "no_changes"}
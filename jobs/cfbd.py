@@ -0,0 +1,26 @@
+import os
+import requests
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# ======================================================
+#               CFBD CLIENT (shared by all jobs)
+# ======================================================
+
+CFBD_BASE_URL = os.getenv("CFBD_BASE_URL", "https://api.collegefootballdata.com").rstrip("/")
+API_KEY = os.getenv("CFBD_API_KEY")
+HEADERS = {"Authorization": f"Bearer {API_KEY}"}
+
+TIMEOUT = 10
+
+# One pooled connection per process instead of a new TLS handshake per call
+session = requests.Session()
+session.headers.update(HEADERS)
+
+
+def get(path, **params):
+    """GET a CFBD endpoint (e.g. "/games") and return the decoded JSON."""
+    resp = session.get(f"{CFBD_BASE_URL}{path}", params=params, timeout=TIMEOUT)
+    resp.raise_for_status()
+    return resp.json()
@@ -0,0 +1,166 @@
+"""
+Live in-game scores from the CFBD scoreboard.
+
+While games are on, one process at a time (whoever holds the live_scores
+lock) polls /scoreboard every poll interval. Scores, period and clock of
+in-progress games are kept in memory and mirrored to a small JSON file
+(live_scores.json) that every web worker reads for the provisional
+leaderboard. games.csv itself is only rewritten in batches, every
+flush_interval seconds, so a touchdown doesn't republish games.csv and
+drop every cached frame. update_winners_live still records final results.
+
+    python -m jobs.live_scores                 # standalone poller
+"""
+import json
+import os
+import time
+
+import pandas as pd
+
+from jobs import cfbd
+from jobs.runner import JobLock, file_lock
+from snapshots import publish, write_csv
+
+CSV_PATH = "/opt/render/project/src/storage/games.csv"
+STATE_PATH = os.path.join(os.path.dirname(CSV_PATH), "live_scores.json")
+LOCK_PATH = os.path.join(os.path.dirname(CSV_PATH), ".locks", "live_scores.lock")
+
+POLL_INTERVAL = 30     # seconds between scoreboard polls
+FLUSH_INTERVAL = 300   # seconds between games.csv writes
+
+LIVE_STATUS = "in_progress"  # CFBD scoreboard status
+CSV_STATUS = "IN_PROGRESS"   # games.csv status while a game is live
+
+
+def fetch_scoreboard():
+    return cfbd.get("/scoreboard", classification="fbs")
+
+
+def read_state(path=STATE_PATH) -> dict:
+    """{"updated_at": ..., "games": {cfbd_game_id (str): {...}}}, empty if nothing is live."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _points(team):
+    points = (team or {}).get("points")
+    return None if points is None else int(points)
+
+
+class LiveScores:
+    def __init__(self, csv_path=CSV_PATH, state_path=STATE_PATH, flush_interval=FLUSH_INTERVAL):
+        self.csv_path = csv_path
+        self.state_path = state_path
+        self.flush_interval = flush_interval
+        self.live = {}     # cfbd_game_id → {"home_score", "away_score", "period", "clock"}
+        self.pending = {}  # cfbd_game_id → (home_score, away_score) not yet in games.csv
+        self.last_flush = time.monotonic()
+        self._state_written = False  # a previous leader may have left a stale file
+
+    def _tracked_ids(self) -> set:
+        ids = pd.to_numeric(pd.read_csv(self.csv_path, usecols=["cfbd_game_id"])["cfbd_game_id"], errors="coerce")
+        # 0 is the placeholder for games CFBD hasn't listed yet
+        return set(ids[ids > 0].astype(int))
+
+    def poll(self) -> int:
+        """One scoreboard poll. Returns how many live games changed."""
+        tracked = self._tracked_ids()
+
+        live = {}
+        for game in fetch_scoreboard():
+            game_id = game.get("id")
+            if game_id not in tracked or game.get("status") != LIVE_STATUS:
+                continue
+            live[game_id] = {
+                "home_score": _points(game.get("homeTeam")),
+                "away_score": _points(game.get("awayTeam")),
+                "period": game.get("period"),
+                "clock": game.get("clock"),
+            }
+
+        changed = [game_id for game_id, g in live.items() if self.live.get(game_id) != g]
+        for game_id in changed:
+            old = self.live.get(game_id) or {}
+            score = (live[game_id]["home_score"], live[game_id]["away_score"])
+            if (old.get("home_score"), old.get("away_score")) != score:
+                self.pending[game_id] = score
+
+        if changed or self.live.keys() - live.keys() or not self._state_written:
+            self.live = live
+            self._write_state()
+        return len(changed)
+
+    def _write_state(self):
+        state = {
+            "updated_at": time.time(),
+            "games": {str(game_id): g for game_id, g in self.live.items()},
+        }
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+        self._state_written = True
+
+    def flush(self, force=False) -> int:
+        """Write pending scores into games.csv if the batch interval is up. Returns rows written."""
+        if not self.pending:
+            return 0
+        if not force and time.monotonic() - self.last_flush < self.flush_interval:
+            return 0
+
+        # The jobs' games.csv writer lock: update_winners_live can't record a
+        # result between our read and write and then have it overwritten
+        with file_lock(self.csv_path):
+            df = pd.read_csv(self.csv_path)
+            if "status" not in df.columns:
+                df["status"] = ""
+            df["status"] = df["status"].astype(object)
+            ids = pd.to_numeric(df["cfbd_game_id"], errors="coerce")
+            # Never overwrite a result update_winners_live already recorded
+            open_games = df["completed"] != True
+
+            written = 0
+            for game_id, (home, away) in self.pending.items():
+                rows = (ids == game_id) & open_games
+                if rows.any():
+                    df.loc[rows, "home_score"] = home
+                    df.loc[rows, "away_score"] = away
+                    df.loc[rows, "status"] = CSV_STATUS
+                    written += int(rows.sum())
+
+            if written:
+                write_csv(df, self.csv_path)
+                publish(self.csv_path)
+                print(f"💾 Persisted live scores for {written} games", flush=True)
+
+        self.pending = {}
+        self.last_flush = time.monotonic()
+        return written
+
+    def run_forever(self, poll_interval=POLL_INTERVAL, lock_path=LOCK_PATH, active=None):
+        """
+        Poll + batch-flush loop. Only the process holding lock_path polls;
+        the others keep retrying the lock so one takes over if it dies.
+        `active()` (optional) skips polls while no game is on.
+        """
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        lock = JobLock(lock_path)
+        leader = False
+        while True:
+            leader = leader or lock.acquire()
+            if leader:
+                try:
+                    if active is None or active():
+                        self.poll()
+                    self.flush(force=not self.live)
+                except Exception as e:
+                    print(f"⚠️ live score poll failed: {e}", flush=True)
+            time.sleep(poll_interval)
+
+
+if __name__ == "__main__":
+    print("🏈 Polling live scores...")
+    LiveScores().run_forever()
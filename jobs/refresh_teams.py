@@ -0,0 +1,126 @@
+import pandas as pd
+
+from jobs import cfbd
+from jobs.runner import file_lock
+from snapshots import publish, write_csv
+from team_names import team_id
+
+# ======================================================
+#               CONFIG
+# ======================================================
+
+CSV_PATH = "/opt/render/project/src/storage/games.csv"
+
+CFP_POLL = "College Football Playoff Rankings"
+
+
+# ======================================================
+#               FETCH (once per season)
+# ======================================================
+
+def fetch_cfp_rankings(year) -> pd.DataFrame:
+    """team_id → CFP rank from the latest CFP poll of the season."""
+    ranks = {}
+    for week in cfbd.get("/rankings", year=year):
+        for poll in week["polls"]:
+            if poll["poll"] == CFP_POLL:
+                # Later weeks overwrite earlier ones
+                ranks = {team_id(e["school"]): e["rank"] for e in poll["ranks"]}
+    return pd.DataFrame(list(ranks.items()), columns=["team_id", "cfp_rank"])
+
+
+def fetch_team_records(year) -> pd.DataFrame:
+    """team_id, team, wins, losses, ties, record for every team CFBD has."""
+    df = pd.json_normalize(cfbd.get("/records", year=year))
+    df = df[["team", "total.wins", "total.losses", "total.ties"]].rename(columns={
+        "total.wins": "wins",
+        "total.losses": "losses",
+        "total.ties": "ties",
+    })
+    df["team_id"] = df["team"].map(team_id)
+    df["record"] = df["wins"].astype(str) + "-" + df["losses"].astype(str)
+    return df
+
+
+# ======================================================
+#               JOIN
+# ======================================================
+
+def _as_str(series) -> pd.Series:
+    """Ranks/records as the strings games.csv stores ("" when missing, 9.0 → "9")."""
+    numeric = pd.to_numeric(series, errors="coerce")
+    as_int = numeric.dropna().astype(int).astype(str)
+    out = series.fillna("").astype(str)
+    out[as_int.index] = as_int
+    return out
+
+
+def _apply_by_team(df, column, values, keep_missing):
+    """
+    Set <side>_<column> for both sides from a team_id-indexed Series.
+    Returns the column names whose values actually changed.
+    """
+    changed = []
+    for side in ("away", "home"):
+        col = f"{side}_{column}"
+        old = _as_str(df[col]) if col in df else pd.Series("", index=df.index)
+
+        new = df[f"{side}_team"].map(team_id).map(values)
+        new = old.where(new.isna(), _as_str(new)) if keep_missing else _as_str(new)
+
+        if col not in df or not old.equals(new):
+            df[col] = new
+            changed.append(col)
+    return changed
+
+
+def apply_rankings(df, rankings):
+    """CFP rank per side by canonical team ID; unranked teams get ""."""
+    return _apply_by_team(
+        df, "rank", rankings.set_index("team_id")["cfp_rank"], keep_missing=False
+    )
+
+
+def apply_records(df, records):
+    """W-L record per side; teams CFBD doesn't report (e.g. TBD) keep theirs."""
+    return _apply_by_team(
+        df, "record", records.set_index("team_id")["record"], keep_missing=True
+    )
+
+
+# ======================================================
+#               MAIN
+# ======================================================
+
+def main(csv_path=CSV_PATH):
+    print("🔄 Refreshing CFP rankings + team records...")
+
+    df = pd.read_csv(csv_path)
+
+    # CFBD seasons start in August: January bowls belong to the prior year
+    kickoff = pd.to_datetime(df["kickoff_datetime"])
+    seasons = sorted(set(kickoff.dt.year - (kickoff.dt.month < 8).astype(int)))
+    season = int(seasons[-1])
+    if len(seasons) > 1:
+        print(f"⚠️ games.csv spans seasons {seasons} — using {season}")
+
+    rankings = fetch_cfp_rankings(season)
+    records = fetch_team_records(season)
+
+    # Shared with every games.csv writer; re-read under it in case another
+    # job wrote while we were fetching
+    with file_lock(csv_path):
+        df = pd.read_csv(csv_path)
+        changed = apply_rankings(df, rankings) + apply_records(df, records)
+        if changed:
+            write_csv(df, csv_path)
+            publish(csv_path)
+            print(f"💾 Updated columns: {', '.join(changed)}")
+        else:
+            print("ℹ️ Rankings and records unchanged.")
+
+    return {"status": "ok", "changed_columns": changed}
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Runs the CFBD jobs with at most one run per job at a time, across every
+process, and keeps a run history.
+
+    python -m jobs.runner update_winners     # cron / scheduler: runs in place
+    POST /internal/update_winners            # web: returns a job ID at once
+
+A run holds an flock on <lock_dir>/<job>.lock from start to finish, so
+the same job never runs twice at once (cron, the scheduler and a web
+trigger included); a second start is refused while the lock is held.
+Different jobs may run side by side, but every writer of games.csv
+(all four jobs and the live-score flush) takes file_lock(games.csv)
+around its read-modify-write, so their rewrites are serialized and none
+overwrites another's changes. A run fails (and is retried) when the job
+raises; jobs re-raise their own errors rather than swallowing them.
+Every run (status, attempts, duration, result) is recorded in a small
+SQLite table shared by all workers, which backs the status endpoints
+and the p50/p95 durations.
+"""
+import argparse
+import contextlib
+import fcntl
+import importlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+DISK_DIR = "/opt/render/project/src/storage"
+
+# job name → (module, function)
+JOBS = {
+    "update_winners": ("jobs.update_winners_live", "main"),
+    "update_cfbd_ids": ("jobs.assign_cfb_ids_live", "main"),
+    "update_spreads": ("jobs.update_spreads", "update_spreads"),
+    "refresh_teams": ("jobs.refresh_teams", "main"),
+}
+
+RETRIES = 2          # extra attempts after a run raises
+RETRY_BACKOFF = 5    # seconds × attempt number between attempts
+STATS_WINDOW = 100   # recent finished runs per job behind p50/p95
+HISTORY_LIMIT = 1000 # runs kept in total
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_runs (
+    id          TEXT PRIMARY KEY,
+    job         TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    source      TEXT,
+    pid         INTEGER,
+    started_at  REAL NOT NULL,
+    finished_at REAL,
+    duration_ms REAL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    result      TEXT,
+    error       TEXT
+);
+CREATE INDEX IF NOT EXISTS job_runs_by_job ON job_runs (job, started_at);
+"""
+
+COLUMNS = [
+    "id", "job", "status", "source", "pid", "started_at", "finished_at",
+    "duration_ms", "attempts", "result", "error",
+]
+
+
+def resolve(job):
+    """The function behind a job name (KeyError if unknown)."""
+    module, attr = JOBS[job]
+    return getattr(importlib.import_module(module), attr)
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+class JobLock:
+    """Non-blocking flock held for one run of a job, released on exit even if the process dies."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def acquire(self) -> bool:
+        f = open(self.path, "a")
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            f.close()
+            return False
+        self._file = f
+        return True
+
+    def release(self):
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """
+    Exclusive flock for one read-modify-write of `path`, held on
+    <dir>/.locks/<name>.lock; blocks until the previous writer is done.
+    Every writer of the file has to take it.
+    """
+    lock_dir = os.path.join(os.path.dirname(path) or ".", ".locks")
+    os.makedirs(lock_dir, exist_ok=True)
+    with open(os.path.join(lock_dir, f"{os.path.basename(path)}.lock"), "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class JobRunner:
+    def __init__(self, db_path, lock_dir, retries=RETRIES, retry_backoff=RETRY_BACKOFF, on_success=None):
+        self.db_path = db_path
+        self.lock_dir = lock_dir
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.on_success = on_success  # called with the job name after a successful run
+        os.makedirs(lock_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _lock(self, job) -> JobLock:
+        return JobLock(os.path.join(self.lock_dir, f"{job}.lock"))
+
+    # ------------------------------
+    # Starting runs
+    # ------------------------------
+    def start(self, job, source="web"):
+        """
+        Start a run on a background thread. Returns (run_id, None), or
+        (None, running_run_id) if the job is already running anywhere.
+        """
+        fn = resolve(job)
+        lock = self._lock(job)
+        if not lock.acquire():
+            return None, self._running_id(job)
+
+        run_id = self._begin(job, source)
+        threading.Thread(
+            target=self._run, args=(run_id, job, fn, lock), name=f"job-{job}", daemon=True
+        ).start()
+        return run_id, None
+
+    def run(self, job, source="cli"):
+        """Run in the calling thread. Returns the finished run, or None if already running."""
+        fn = resolve(job)
+        lock = self._lock(job)
+        if not lock.acquire():
+            return None
+
+        run_id = self._begin(job, source)
+        self._run(run_id, job, fn, lock)
+        return self.get(run_id)
+
+    def _begin(self, job, source) -> str:
+        run_id = uuid.uuid4().hex[:12]
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO job_runs (id, job, status, source, pid, started_at) VALUES (?, ?, 'running', ?, ?, ?)",
+                (run_id, job, source, os.getpid(), time.time()),
+            )
+        return run_id
+
+    def _run(self, run_id, job, fn, lock):
+        """Call fn with retries and record the outcome; always releases the lock."""
+        start = time.perf_counter()
+        attempts = 0
+        result = error = None
+        try:
+            while True:
+                attempts += 1
+                try:
+                    result = fn()
+                    error = None
+                    break
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                    print(f"⚠️ {job} attempt {attempts} failed: {error}", flush=True)
+                    if attempts > self.retries:
+                        break
+                    time.sleep(self.retry_backoff * attempts)
+
+            duration_ms = (time.perf_counter() - start) * 1000
+            self._finish(run_id, "failed" if error else "succeeded", attempts, duration_ms, result, error)
+            print(f"⏱️ {job} {'failed' if error else 'succeeded'} in {duration_ms:.0f} ms", flush=True)
+        finally:
+            # The row is final before the lock is free: a running row with a
+            # free lock means its process died (see get())
+            lock.release()
+
+        if error is None and self.on_success is not None:
+            self.on_success(job)
+
+    def _finish(self, run_id, status, attempts, duration_ms, result, error):
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE job_runs
+                SET status = ?, finished_at = ?, duration_ms = ?, attempts = ?, result = ?, error = ?
+                WHERE id = ?
+                """,
+                (status, time.time(), duration_ms, attempts, json.dumps(result, default=str), error, run_id),
+            )
+            conn.execute(
+                "DELETE FROM job_runs WHERE id IN "
+                "(SELECT id FROM job_runs ORDER BY started_at DESC LIMIT -1 OFFSET ?)",
+                (HISTORY_LIMIT,),
+            )
+
+    # ------------------------------
+    # Status
+    # ------------------------------
+    def _row(self, values) -> dict:
+        row = dict(zip(COLUMNS, values))
+        if row["result"] is not None:
+            row["result"] = json.loads(row["result"])
+        return row
+
+    def _running_id(self, job):
+        with self._connect() as conn:
+            found = conn.execute(
+                "SELECT id FROM job_runs WHERE job = ? AND status = 'running' ORDER BY started_at DESC LIMIT 1",
+                (job,),
+            ).fetchone()
+        return found[0] if found else None
+
+    def get(self, run_id):
+        """One run as a dict, or None."""
+        with self._connect() as conn:
+            values = conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM job_runs WHERE id = ?", (run_id,)
+            ).fetchone()
+        if values is None:
+            return None
+
+        row = self._row(values)
+        if row["status"] == "running":
+            # Nobody holds the lock → the process running it is gone
+            lock = self._lock(row["job"])
+            if lock.acquire():
+                lock.release()
+                row.update(status="abandoned", error="process exited mid-run")
+                with self._connect() as conn:
+                    conn.execute(
+                        "UPDATE job_runs SET status = 'abandoned', error = ? WHERE id = ? AND status = 'running'",
+                        (row["error"], run_id),
+                    )
+        return row
+
+    def stats(self) -> dict:
+        """Per job: recent outcome counts, p50/p95 duration and the latest run."""
+        out = {}
+        with self._connect() as conn:
+            for job in JOBS:
+                recent = conn.execute(
+                    f"SELECT {', '.join(COLUMNS)} FROM job_runs WHERE job = ? "
+                    "ORDER BY started_at DESC LIMIT ?",
+                    (job, STATS_WINDOW),
+                ).fetchall()
+                runs = [self._row(values) for values in recent]
+                durations = sorted(r["duration_ms"] for r in runs if r["status"] == "succeeded")
+                out[job] = {
+                    "runs": len(runs),
+                    "succeeded": sum(r["status"] == "succeeded" for r in runs),
+                    "failed": sum(r["status"] == "failed" for r in runs),
+                    "p50_ms": percentile(durations, 50),
+                    "p95_ms": percentile(durations, 95),
+                    "last": runs[0] if runs else None,
+                }
+        return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run one job under its cross-process lock.")
+    parser.add_argument("job", choices=sorted(JOBS))
+    parser.add_argument("--disk", default=DISK_DIR, help="directory holding job_runs.db and .locks/")
+    args = parser.parse_args()
+
+    runner = JobRunner(os.path.join(args.disk, "job_runs.db"), os.path.join(args.disk, ".locks"))
+    run = runner.run(args.job, source="cli")
+    if run is None:
+        print(f"⏭️ {args.job} is already running — skipping.")
+        raise SystemExit(0)
+    raise SystemExit(0 if run["status"] == "succeeded" else 1)
@@ -1,99 +1,155 @@
 import os
-import requests
+import statistics
+from datetime import datetime, timezone
+
 import pandas as pd
 
+from jobs import cfbd
+from jobs.runner import file_lock
+from snapshots import publish, write_csv
+
 # ---- Paths ----
 CSV_PATH = "/opt/render/project/src/storage/games.csv"
+SPREADS_PATH = os.path.join(os.path.dirname(CSV_PATH), "spreads.csv")
 
-# ---- CFBD Key ----
-CFBD_KEY = os.getenv("CFBD_API_KEY")
-HEADERS = {"Authorization": f"Bearer {CFBD_KEY}"}
+YEAR = 2025
 
-# ---- Provider Priority ----
-PROVIDER_PRIORITY = ["DraftKings", "Bovada"]
+# One row per (game, provider) each time that provider's line moves
+HISTORY_COLUMNS = ["cfbd_game_id", "provider", "spread", "over_under", "recorded_at"]
 
 
-def choose_spread(lines):
+def consensus_spread(lines):
     """
-    Select spread using priority (DraftKings -> Bovada -> first available).
-    Each 'line' item is a dict with keys: provider, spread, formattedSpread, etc.
+    Median spread across every provider that posted one, rounded to the
+    nearest half point. Each 'line' item is a dict with keys: provider,
+    spread, formattedSpread, etc. Returns None if no provider has a spread.
     """
-    # Try priority list first
-    for provider in PROVIDER_PRIORITY:
-        for item in lines:
-            if item.get("provider") == provider and item.get("spread") is not None:
-                return item["spread"]
-
-    # Otherwise choose first available spread
-    for item in lines:
-        if item.get("spread") is not None:
-            return item["spread"]
+    spreads = [float(item["spread"]) for item in lines if item.get("spread") is not None]
+    if not spreads:
+        return None
+    return round(statistics.median(spreads) * 2) / 2
 
-    return None
 
+def fetch_postseason_lines(year=YEAR):
+    """All providers' lines for every postseason game, in one call."""
+    return cfbd.get("/lines", year=year, seasonType="postseason")
 
-def update_spreads():
-    """
-    Fetch CFBD lines for each game in games.csv and update the 'spread' column.
-    This function is designed so Flask can import it cleanly.
-    """
-    if CFBD_KEY is None:
-        raise RuntimeError("CFBD_API_KEY is missing in environment.")
-
-    if not os.path.exists(CSV_PATH):
-        raise FileNotFoundError(f"CSV not found at {CSV_PATH}")
 
-    df = pd.read_csv(CSV_PATH)
+def _same(a, b):
+    """Equality that treats two missing values as equal."""
+    return a == b or (pd.isna(a) and pd.isna(b))
 
-    updated_count = 0
 
-    for idx, row in df.iterrows():
-        game_id = row.get("cfbd_game_id")
+def load_line_history(spreads_path=SPREADS_PATH) -> pd.DataFrame:
+    if not os.path.exists(spreads_path):
+        return pd.DataFrame(columns=HISTORY_COLUMNS)
 
-        # Skip if no CFBD ID
-        if pd.isna(game_id):
-            print(f"Skipping row {idx}: No CFBD ID")
-            continue
+    history = pd.read_csv(spreads_path)
+    if list(history.columns) != HISTORY_COLUMNS:
+        # Old single-spread layout — start the time series fresh
+        return pd.DataFrame(columns=HISTORY_COLUMNS)
+    return history
 
-        game_id = int(game_id)
-        url = f"https://api.collegefootballdata.com/lines?gameId={game_id}"
 
-        try:
-            response = requests.get(url, headers=HEADERS, timeout=10)
-        except Exception as e:
-            print(f"[{game_id}] Request error: {e}")
-            continue
-
-        if response.status_code != 200:
-            print(f"[{game_id}] CFBD ERROR {response.status_code}: {response.text[:200]}")
+def record_line_history(lines_data, recorded_at, spreads_path=SPREADS_PATH):
+    """
+    Append a history row for every (game, provider) whose spread or total
+    changed since the last recorded value. Returns the number of rows added.
+    """
+    history = load_line_history(spreads_path)
+
+    last = {}
+    if not history.empty:
+        latest = history.drop_duplicates(["cfbd_game_id", "provider"], keep="last")
+        for row in latest.itertuples(index=False):
+            last[(int(row.cfbd_game_id), row.provider)] = (row.spread, row.over_under)
+
+    new_rows = []
+    for game in lines_data:
+        game_id = game.get("id")
+        if not game_id:
             continue
 
-        data = response.json()
+        for item in game.get("lines") or []:
+            spread = item.get("spread")
+            over_under = item.get("overUnder")
+            if spread is None and over_under is None:
+                continue
+
+            key = (int(game_id), item.get("provider"))
+            current = (
+                float("nan") if spread is None else float(spread),
+                float("nan") if over_under is None else float(over_under),
+            )
+            if key in last and all(_same(a, b) for a, b in zip(last[key], current)):
+                continue
+
+            new_rows.append({
+                "cfbd_game_id": key[0],
+                "provider": key[1],
+                "spread": current[0],
+                "over_under": current[1],
+                "recorded_at": recorded_at,
+            })
+
+    if not new_rows:
+        return 0
+
+    new_df = pd.DataFrame(new_rows, columns=HISTORY_COLUMNS)
+    if history.empty:
+        # (Re)write with the current header
+        new_df.to_csv(spreads_path, index=False)
+    else:
+        new_df.to_csv(spreads_path, mode="a", header=False, index=False)
+
+    return len(new_rows)
+
+
+def update_spreads(csv_path=CSV_PATH, spreads_path=SPREADS_PATH):
+    """
+    Pull every provider's postseason lines in one CFBD call, append line
+    movements to spreads.csv and write the consensus spread into games.csv.
+    This function is designed so Flask can import it cleanly.
+    """
+    if cfbd.API_KEY is None:
+        raise RuntimeError("CFBD_API_KEY is missing in environment.")
 
-        if not data:
-            print(f"[{game_id}] No data returned")
-            continue
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"CSV not found at {csv_path}")
 
-        game_obj = data[0]
+    lines_data = fetch_postseason_lines()
+    recorded_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    history_rows = record_line_history(lines_data, recorded_at, spreads_path)
 
-        if "lines" not in game_obj or not game_obj["lines"]:
-            print(f"[{game_id}] No lines available")
-            continue
+    consensus = {
+        int(game["id"]): consensus_spread(game.get("lines") or [])
+        for game in lines_data
+        if game.get("id")
+    }
 
-        lines = game_obj["lines"]
+    # Shared with every games.csv writer; held only for the read-modify-write
+    with file_lock(csv_path):
+        df = pd.read_csv(csv_path)
 
-        spread = choose_spread(lines)
+        cfbd_ids = pd.to_numeric(df["cfbd_game_id"], errors="coerce")
+        new_spreads = cfbd_ids.map(consensus)
 
-        print(f"{row['away_team']} vs {row['home_team']} -> spread chosen: {spread}")
+        # Only touch rows where CFBD has a line and it differs from games.csv
+        changed = new_spreads.notna() & (
+            pd.to_numeric(df["spread"], errors="coerce") != new_spreads
+        )
+        updated_count = int(changed.sum())
 
-        df.at[idx, "spread"] = spread
-        updated_count += 1
+        if updated_count:
+            for idx in df.index[changed]:
+                print(f"{df.at[idx, 'away_team']} vs {df.at[idx, 'home_team']} -> consensus spread: {new_spreads[idx]}")
+            df.loc[changed, "spread"] = new_spreads[changed]
+            write_csv(df, csv_path)
+            publish(csv_path)
 
-    # Write back to CSV
-    df.to_csv(CSV_PATH, index=False)
-    print(f"Completed spread update for {updated_count} games.")
+    print(f"Completed spread update for {updated_count} games ({history_rows} line moves recorded).")
 
-    return {"updated": updated_count}
+    return {"updated": updated_count, "line_moves": history_rows}
 
 
 # Allow running manually from command line
@@ -1,14 +1,14 @@
 import pandas as pd
-import requests
-import os
+
+from jobs import cfbd
+from jobs.runner import file_lock
+from snapshots import publish, write_csv
+from team_names import normalize_team, same_team
 
 # ======================================================
 #               CONFIG
 # ======================================================
 
-API_KEY = os.getenv("CFBD_API_KEY")
-HEADERS = {"Authorization": f"Bearer {API_KEY}"}
-
 CSV_PATH = "/opt/render/project/src/storage/games.csv"
 
 
@@ -16,135 +16,121 @@ CSV_PATH = "/opt/render/project/src/storage/games.csv"
 #               HELPERS
 # ======================================================
 
-def normalize_team(name: str) -> str:
-    """
-    Normalize team names so punctuation differences
-    (e.g. Hawai'i vs Hawaii) never break scoring.
-    """
-    if not isinstance(name, str):
-        return ""
-    return (
-        name.lower()
-        .replace("’", "'")
-        .replace("'", "")
-        .replace(".", "")
-        .strip()
-    )
-
-
 def fetch_postseason_games():
     """
     Fetch ALL postseason games for 2025.
     CFBD assigns postseason games a seasonType of 'postseason'.
+    Raises on failure so the runner records it and retries.
     """
     try:
-        resp = requests.get(
-            "https://api.collegefootballdata.com/games",
-            params={"year": 2025, "seasonType": "postseason"},
-            headers=HEADERS,
-            timeout=10,
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return cfbd.get("/games", year=2025, seasonType="postseason")
     except Exception as e:
         print(f"⚠️ Error contacting CFBD API: {e}")
-        return None
+        raise
 
 
 # ======================================================
 #               MAIN
 # ======================================================
 
-def main():
+def main(csv_path=CSV_PATH):
+    """Returns a status dict; raises on any failure so the runner records and retries it."""
     print("🔄 Running update_winners_live for POSTSEASON 2025...")
 
-    # Load games.csv
-    try:
-        df = pd.read_csv(CSV_PATH)
-    except Exception as e:
-        print(f"❌ Failed to read CSV: {CSV_PATH} → {e}")
-        return
-
-    # Defensive column setup
-    for col in ["winner", "completed", "home_score", "away_score"]:
-        if col not in df.columns:
-            df[col] = ""
-
-    df["completed"] = df["completed"].astype(bool)
-
     # Fetch CFBD data
     games = fetch_postseason_games()
     if not games:
         print("⚠️ No API data returned.")
-        return
-
-    # Lookup by CFBD ID
-    cfbd_lookup = {g["id"]: g for g in games}
-
-    updated_any = False
-
-    for idx, row in df.iterrows():
-        cfbd_id = row.get("cfbd_game_id")
-
-        if pd.isna(cfbd_id):
-            continue
-
-        try:
-            cfbd_id = int(cfbd_id)
-        except Exception:
-            continue
-
-        match = cfbd_lookup.get(cfbd_id)
-        if match is None:
-            continue
-
-        # Skip unplayed games
-        if not match.get("completed", False):
-            continue
-
-        home = match.get("homeTeam")
-        away = match.get("awayTeam")
-        home_pts = match.get("homePoints")
-        away_pts = match.get("awayPoints")
-
-        if home_pts is None or away_pts is None:
-            continue
-
-        # Determine raw winner
-        raw_winner = home if home_pts > away_pts else away
-
-        # ✅ NORMALIZE BEFORE WRITING
-        winner = normalize_team(raw_winner)
-
-        # Normalize existing CSV value for comparison
-        existing_winner = normalize_team(df.loc[idx, "winner"])
-
-        if (
-            existing_winner != winner
-            or df.loc[idx, "completed"] is False
-            or df.loc[idx, "home_score"] != home_pts
-            or df.loc[idx, "away_score"] != away_pts
-        ):
-            print(f"✔ UPDATED: {away} vs {home} → {raw_winner}")
-
-            df.loc[idx, "winner"] = winner
-            df.loc[idx, "completed"] = True
-            df.loc[idx, "home_score"] = home_pts
-            df.loc[idx, "away_score"] = away_pts
-
-            updated_any = True
+        return {"status": "no_api_data"}
 
-    # Save updates
-    if updated_any:
+    # Shared with every games.csv writer; held only for the read-modify-write
+    with file_lock(csv_path):
+        # Load games.csv
         try:
-            df.to_csv(CSV_PATH, index=False)
-            print("💾 CSV updated successfully.")
+            df = pd.read_csv(csv_path)
         except Exception as e:
-            print(f"❌ Failed to save CSV: {e}")
-    else:
-        print("ℹ️ No updates needed.")
+            print(f"❌ Failed to read CSV: {csv_path} → {e}")
+            raise
+
+        # Defensive column setup
+        for col in ["winner", "completed", "home_score", "away_score"]:
+            if col not in df.columns:
+                df[col] = ""
+
+        df["completed"] = df["completed"].astype(bool)
+        # Before the first result every winner is blank, which reads as float64
+        df["winner"] = df["winner"].astype(object)
+
+        # Lookup by CFBD ID
+        cfbd_lookup = {g["id"]: g for g in games}
+
+        updated_any = False
+
+        for idx, row in df.iterrows():
+            cfbd_id = row.get("cfbd_game_id")
+
+            if pd.isna(cfbd_id):
+                continue
+
+            try:
+                cfbd_id = int(cfbd_id)
+            except Exception:
+                continue
+
+            match = cfbd_lookup.get(cfbd_id)
+            if match is None:
+                continue
+
+            # Skip unplayed games
+            if not match.get("completed", False):
+                continue
+
+            home = match.get("homeTeam")
+            away = match.get("awayTeam")
+            home_pts = match.get("homePoints")
+            away_pts = match.get("awayPoints")
+
+            if home_pts is None or away_pts is None:
+                continue
+
+            # Determine raw winner
+            raw_winner = home if home_pts > away_pts else away
+
+            # ✅ NORMALIZE BEFORE WRITING
+            winner = normalize_team(raw_winner)
+
+            if (
+                not same_team(df.loc[idx, "winner"], raw_winner)
+                or df.loc[idx, "completed"] is False
+                or df.loc[idx, "home_score"] != home_pts
+                or df.loc[idx, "away_score"] != away_pts
+            ):
+                print(f"✔ UPDATED: {away} vs {home} → {raw_winner}")
+
+                df.loc[idx, "winner"] = winner
+                df.loc[idx, "completed"] = True
+                df.loc[idx, "home_score"] = home_pts
+                df.loc[idx, "away_score"] = away_pts
+                if "status" in df.columns:
+                    # live_scores leaves IN_PROGRESS behind
+                    df.loc[idx, "status"] = "FINAL"
+
+                updated_any = True
+
+        # Save updates
+        if updated_any:
+            try:
+                write_csv(df, csv_path)
+                publish(csv_path)
+                print("💾 CSV updated successfully.")
+            except Exception as e:
+                print(f"❌ Failed to save CSV: {e}")
+                raise
+        else:
+            print("ℹ️ No updates needed.")
 
     print("✅ update_winners_live POSTSEASON completed.")
+    return {"status": "updated" if updated_any else "no_changes"}
 
 
 if __name__ == "__main__":
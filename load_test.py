@@ -0,0 +1,153 @@
+"""
+Polling load test: many phones holding keep-alive connections and polling
+the leaderboard/winner endpoints.
+
+    python mock_cfbd.py --port 8081 &
+    TRUSTED_PROXY_HOPS=1 CFBD_BASE_URL=http://127.0.0.1:8081 uvicorn asgi:app --port 8000 --timeout-keep-alive 75 &
+    python load_test.py --url http://127.0.0.1:8000 --connections 500 --interval 5
+
+Compare against the WSGI server by starting `gunicorn app:app ...` on the
+same port instead. Stdlib only, so it runs anywhere the app does.
+
+Measured with uvicorn asgi:app (one process) on a single vCPU shared with
+the load generator, sample data (2 groups × 12 users × 47 games),
+leaderboard + winner polled every 5 s for 30 s. Not yet re-run on a
+Render starter instance (0.5 CPU); expect roughly half.
+
+    phones   req/s   errors   p50 ms   p95 ms   p99 ms
+       500      99        0     16.9    145.0    168.9
+      1000     199        0     12.8     45.3     66.7
+      2000     397        0     12.8     99.6    114.7
+      4000     785        0     13.7    376.6    420.1
+
+uvicorn's default 5 s keep-alive timeout closes every phone polling at a
+5 s interval (≈100% dropped connections in the same run), hence
+--timeout-keep-alive.
+"""
+import argparse
+import asyncio
+import time
+from urllib.parse import quote, urlparse
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+        self.connected = 0
+        self.connect_failed = 0
+        self.dropped = 0
+
+
+async def _request(reader, writer, host, path, client_addr):
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n"
+        f"X-Forwarded-For: {client_addr}\r\n\r\n".encode()
+    )
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(int(headers.get("content-length", 0)))
+
+    if headers.get("connection", "").lower() == "close":
+        raise ConnectionResetError("server closed keep-alive connection")
+    return status
+
+
+async def client(n, args, stats, deadline):
+    url = urlparse(args.url)
+    host, port = url.hostname, url.port or 80
+
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), args.timeout)
+    except Exception:
+        stats.connect_failed += 1
+        return
+    stats.connected += 1
+
+    paths = args.paths
+    # Each phone is its own client to the per-IP rate limits, as it would be
+    # behind Render's proxy, which appends the caller's address to
+    # X-Forwarded-For (run the server with TRUSTED_PROXY_HOPS=1)
+    client_addr = f"10.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}"
+    i = n  # stagger which endpoint each phone polls first
+    try:
+        while time.monotonic() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            start = time.monotonic()
+            try:
+                status = await asyncio.wait_for(_request(reader, writer, url.netloc, path, client_addr), args.timeout)
+            except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError):
+                stats.errors += 1
+                stats.dropped += 1
+                return
+            stats.latencies.append(time.monotonic() - start)
+            if status != 200:
+                stats.errors += 1
+            await asyncio.sleep(args.interval)
+    finally:
+        writer.close()
+
+
+def pct(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+async def main(args):
+    stats = Stats()
+    deadline = time.monotonic() + args.duration
+
+    tasks = []
+    for n in range(args.connections):
+        tasks.append(asyncio.create_task(client(n, args, stats, deadline)))
+        # Ramp up instead of opening every socket in the same millisecond
+        if n % args.ramp_batch == args.ramp_batch - 1:
+            await asyncio.sleep(0.05)
+
+    started = time.monotonic()
+    await asyncio.gather(*tasks)
+    elapsed = time.monotonic() - started
+
+    lat = sorted(x * 1000 for x in stats.latencies)
+    print(f"🔌 connections: {stats.connected} open, {stats.connect_failed} failed, {stats.dropped} dropped")
+    print(f"📨 requests: {len(lat)} responses, {stats.errors} errors, {len(lat) / elapsed:.1f} req/s")
+    if lat:
+        print(
+            f"⏱️ latency ms: p50 {pct(lat, 50):.1f}  p95 {pct(lat, 95):.1f}  "
+            f"p99 {pct(lat, 99):.1f}  max {lat[-1]:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--group", default="MacFarlane")
+    parser.add_argument("--paths", nargs="*", help="defaults to the group's leaderboard and winner")
+    parser.add_argument("--connections", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--interval", type=float, default=5, help="seconds between polls per phone")
+    parser.add_argument("--timeout", type=float, default=10)
+    parser.add_argument("--ramp-batch", type=int, default=50)
+    args = parser.parse_args()
+
+    if not args.paths:
+        group = quote(args.group)
+        args.paths = [f"/api/{group}/leaderboard", f"/api/{group}/winner"]
+
+    asyncio.run(main(args))
@@ -0,0 +1,297 @@
+"""
+Local stand-in for the CFBD API.
+
+    python mock_cfbd.py --games storage/games.csv --port 8081
+    CFBD_BASE_URL=http://127.0.0.1:8081 gunicorn app:app
+
+Serves /games, /lines, /rankings, /records and /scoreboard in the shapes
+the jobs read, so jobs and load tests can run without an API key or
+network. Payloads are replayed from a fixtures directory recorded off the
+real API (--record, then --fixtures), with anything missing synthesized
+from a games.csv. --live N plays N unfinished games on the scoreboard,
+scoring every --tick seconds. --latency/--jitter/--error-rate make it
+slow or flaky on purpose.
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pandas as pd
+
+ENDPOINTS = ("/games", "/lines", "/rankings", "/records", "/scoreboard")
+
+CFP_POLL = "College Football Playoff Rankings"
+
+
+def _num(value):
+    value = pd.to_numeric(value, errors="coerce")
+    return None if pd.isna(value) else float(value)
+
+
+def _season(kickoff):
+    # CFBD seasons start in August: January bowls belong to the prior year
+    return kickoff.year - (1 if kickoff.month < 8 else 0)
+
+
+# ======================================================
+#               FIXTURES
+# ======================================================
+
+def live_scoreboard(games, live_count=0, tick_seconds=10):
+    """
+    /scoreboard payload builder: finished games as completed, the first
+    live_count unfinished ones in progress with scores that go up every
+    tick_seconds, the rest scheduled.
+    """
+    started = time.monotonic()
+    live_ids = {g["id"] for g in games if not g["completed"]}
+    live_ids = set(sorted(live_ids)[:live_count])
+
+    def payload():
+        tick = int((time.monotonic() - started) / tick_seconds)
+        board = []
+        for i, g in enumerate(games):
+            home_pts, away_pts = g["homePoints"], g["awayPoints"]
+            entry = {
+                "id": g["id"],
+                "startDate": g["startDate"],
+                "status": "completed" if g["completed"] else "scheduled",
+                "period": None,
+                "clock": None,
+                "homeTeam": {"name": g["homeTeam"], "points": None if home_pts is None else int(home_pts)},
+                "awayTeam": {"name": g["awayTeam"], "points": None if away_pts is None else int(away_pts)},
+            }
+            if g["id"] in live_ids:
+                entry["status"] = "in_progress"
+                entry["period"] = min(4, 1 + tick // 4)
+                entry["clock"] = f"{15 - (tick % 4) * 3}:00"
+                entry["homeTeam"]["points"] = 7 * ((tick + i) // 3)
+                entry["awayTeam"]["points"] = 3 * ((tick + 2 * i) // 2)
+            board.append(entry)
+        return board
+
+    return payload
+
+
+def build_fixtures(games_csv, live_games=0, tick_seconds=10) -> dict:
+    """path → JSON-ready payload (or a callable building one), synthesized from a games.csv."""
+    df = pd.read_csv(games_csv)
+    df = df[pd.to_numeric(df["cfbd_game_id"], errors="coerce").notna()]
+
+    games = []
+    lines = []
+    ranks = {}
+    records = {}
+    season = None
+    for row in df.to_dict(orient="records"):
+        game_id = int(row["cfbd_game_id"])
+        kickoff = pd.Timestamp(row["kickoff_datetime"])
+        season = _season(kickoff)
+        # games.csv kickoffs are US/Pacific (see app.lock_epoch); CFBD sends UTC
+        if kickoff.tzinfo is None:
+            kickoff = kickoff.tz_localize("US/Pacific")
+        start_utc = kickoff.tz_convert("UTC")
+        home_pts, away_pts = _num(row.get("home_score")), _num(row.get("away_score"))
+
+        games.append({
+            "id": game_id,
+            "season": season,
+            "seasonType": "postseason",
+            "startDate": start_utc.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "completed": home_pts is not None and away_pts is not None,
+            "notes": row.get("bowl_name"),
+            "venue": row.get("location"),
+            "homeTeam": row["home_team"],
+            "awayTeam": row["away_team"],
+            "homePoints": home_pts,
+            "awayPoints": away_pts,
+        })
+
+        spread = _num(row.get("spread"))
+        lines.append({
+            "id": game_id,
+            "homeTeam": row["home_team"],
+            "awayTeam": row["away_team"],
+            "lines": [] if spread is None else [
+                {"provider": "mock", "spread": spread, "formattedSpread": f"{spread:+}", "overUnder": None}
+            ],
+        })
+
+        for side in ("home", "away"):
+            team = row[f"{side}_team"]
+            rank = _num(row.get(f"{side}_rank"))
+            if rank is not None:
+                ranks[team] = int(rank)
+
+            wins, _, losses = str(row.get(f"{side}_record") or "").partition("-")
+            if wins.isdigit() and losses.isdigit():
+                records[team] = (int(wins), int(losses))
+
+    rankings = [{
+        "season": season,
+        "seasonType": "regular",
+        "week": 15,
+        "polls": [{
+            "poll": CFP_POLL,
+            "ranks": [
+                {"rank": rank, "school": team, "conference": None, "firstPlaceVotes": 0, "points": 0}
+                for team, rank in sorted(ranks.items(), key=lambda kv: kv[1])
+            ],
+        }],
+    }]
+
+    team_records = [
+        {
+            "year": season,
+            "team": team,
+            "conference": None,
+            "total": {"games": wins + losses, "wins": wins, "losses": losses, "ties": 0},
+        }
+        for team, (wins, losses) in sorted(records.items())
+    ]
+
+    return {
+        "/games": games,
+        "/lines": lines,
+        "/rankings": rankings,
+        "/records": team_records,
+        "/scoreboard": live_scoreboard(games, live_games, tick_seconds),
+    }
+
+
+def load_fixtures(fixtures_dir) -> dict:
+    """Recorded payloads (<dir>/games.json etc.) for whichever endpoints were recorded."""
+    fixtures = {}
+    for path in ENDPOINTS:
+        file_path = os.path.join(fixtures_dir, f"{path.strip('/')}.json")
+        if os.path.exists(file_path):
+            with open(file_path, "r") as f:
+                fixtures[path] = json.load(f)
+    return fixtures
+
+
+def record_fixtures(fixtures_dir, year) -> dict:
+    """Fetch the real postseason payloads (needs CFBD_API_KEY) and save them for replay."""
+    from jobs import cfbd
+
+    params = {
+        "/games": {"year": year, "seasonType": "postseason"},
+        "/lines": {"year": year, "seasonType": "postseason"},
+        "/rankings": {"year": year},
+        "/records": {"year": year},
+        "/scoreboard": {"classification": "fbs"},
+    }
+
+    os.makedirs(fixtures_dir, exist_ok=True)
+    fixtures = {}
+    for path in ENDPOINTS:
+        fixtures[path] = cfbd.get(path, **params[path])
+        with open(os.path.join(fixtures_dir, f"{path.strip('/')}.json"), "w") as f:
+            json.dump(fixtures[path], f)
+        print(f"📼 Recorded {path}: {len(fixtures[path])} items")
+    return fixtures
+
+
+# ======================================================
+#               SERVER
+# ======================================================
+
+def make_handler(fixtures, latency_ms=0, jitter_ms=0, error_rate=0.0, error_status=503):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; with Nagle on, keep-alive
+        # clients wait ~40 ms for a delayed ACK on every response
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            path = urlparse(self.path).path
+            with self.server.hits_lock:
+                self.server.hits[path] += 1
+
+            delay = latency_ms + random.uniform(0, jitter_ms)
+            if delay:
+                time.sleep(delay / 1000)
+
+            if path not in fixtures:
+                self.send_error(404)
+                return
+            if error_rate and random.random() < error_rate:
+                self.send_error(error_status)
+                return
+
+            payload = fixtures[path]
+            body = json.dumps(payload() if callable(payload) else payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def serve(
+    games_csv,
+    host="127.0.0.1",
+    port=8081,
+    fixtures_dir=None,
+    latency_ms=0,
+    jitter_ms=0,
+    error_rate=0.0,
+    error_status=503,
+    live_games=0,
+    tick_seconds=10,
+) -> ThreadingHTTPServer:
+    """
+    Build the server (call .serve_forever() or run it in a thread).
+    port=0 picks a free port; see server.server_address. server.hits
+    counts requests per path.
+    """
+    fixtures = build_fixtures(games_csv, live_games, tick_seconds)
+    if fixtures_dir:
+        fixtures.update(load_fixtures(fixtures_dir))
+
+    handler = make_handler(fixtures, latency_ms, jitter_ms, error_rate, error_status)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.hits = Counter()
+    server.hits_lock = threading.Lock()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", default="storage/games.csv")
+    parser.add_argument("--fixtures", help="directory of recorded payloads to replay")
+    parser.add_argument("--record", metavar="DIR", help="record real CFBD payloads into DIR and exit")
+    parser.add_argument("--year", type=int, default=2025, help="season to --record")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0, help="ms added to every response")
+    parser.add_argument("--jitter", type=float, default=0, help="extra random ms, 0..jitter")
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--live", type=int, default=0, help="unfinished games to play on /scoreboard")
+    parser.add_argument("--tick", type=float, default=10, help="seconds between live score changes")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures(args.record, args.year)
+        raise SystemExit(0)
+
+    server = serve(
+        args.games, args.host, args.port, args.fixtures,
+        args.latency, args.jitter, args.error_rate, args.error_status,
+        args.live, args.tick,
+    )
+    source = args.fixtures or args.games
+    print(f"🏈 Mock CFBD on http://{args.host}:{args.port} ({source})")
+    server.serve_forever()
@@ -0,0 +1,249 @@
+"""
+Per-group pick matrix: one row per user, one column per game.
+
+Built once per data version from the group's picks and games.csv.
+Per-user questions (points, max possible, rank) then become vector ops
+on one precomputed row, O(games), instead of a fresh DataFrame merge.
+
+Picks are also packed into bitsets over games (8 games per byte): a
+"known" mask for picks naming one of the game's two teams, and a "home"
+bit for picking the home team. Head-to-head comparisons are then XOR/AND
+plus popcount over ceil(games / 8) bytes per pair.
+"""
+import numpy as np
+import pandas as pd
+
+from team_names import team_id
+
+NO_TEAM = -1
+
+# Set bits per byte value, for popcount over packed bitsets
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(packed) -> np.ndarray:
+    """Set bits per row of a packed (uint8) bitset array."""
+    return _POPCOUNT[packed].sum(axis=-1, dtype=np.int64)
+
+
+def _team_ids(names) -> np.ndarray:
+    """team_id for a column of names (NO_TEAM for blanks), one lookup per unique name."""
+    codes, uniques = pd.factorize(pd.Series(names, dtype=object), use_na_sentinel=True)
+    ids = np.array([NO_TEAM if (tid := team_id(u)) is None else tid for u in uniques], dtype=np.int64)
+    return np.where(codes >= 0, ids[codes] if len(ids) else NO_TEAM, NO_TEAM)
+
+
+class PickMatrix:
+    def __init__(self, picks_df, games_df, eliminated_teams=()):
+        # ---- games (columns), numeric game_id order like the picks board ----
+        games = games_df.assign(
+            _order=pd.to_numeric(games_df["game_id"], errors="coerce")
+        ).sort_values("_order", kind="stable")
+
+        self.game_ids = games["game_id"].astype(str).tolist()
+        self.game_index = {g: i for i, g in enumerate(self.game_ids)}
+        self.point_values = (
+            pd.to_numeric(games["point_value"], errors="coerce").fillna(0).astype(int).to_numpy()
+        )
+        self.completed = (games["completed"] == True).to_numpy()
+        self.home_teams = games["home_team"].astype(str).tolist()
+        self.away_teams = games["away_team"].astype(str).tolist()
+        self.winner_ids = _team_ids(games["winner"])
+        self.home_ids = _team_ids(games["home_team"])
+        self.away_ids = _team_ids(games["away_team"])
+
+        # ---- users (rows), in first-pick order ----
+        cols = picks_df["game_id"].astype(str).map(self.game_index)
+        picks = picks_df[cols.notna()]
+        cols = cols[cols.notna()].astype(int).to_numpy()
+
+        rows, self.usernames = pd.factorize(picks["username"])
+        self.usernames = list(self.usernames)
+        self.user_index = {u.lower(): i for i, u in reversed(list(enumerate(self.usernames)))}
+        names = picks.groupby(rows, sort=True)["name"].first()
+        self.names = names.fillna("").astype(str).tolist()
+
+        shape = (len(self.usernames), len(self.game_ids))
+        self.picked = np.zeros(shape, dtype=bool)
+        self.pick_team = np.full(shape, NO_TEAM, dtype=np.int64)
+        self.pick_points = np.zeros(shape, dtype=np.int64)
+
+        self.picked[rows, cols] = True
+        self.pick_team[rows, cols] = _team_ids(picks["selected_team"])
+        self.pick_points[rows, cols] = (
+            pd.to_numeric(picks["point_value"], errors="coerce").fillna(0).astype(int).to_numpy()
+        )
+
+        # ---- derived per-user vectors ----
+        eliminated_ids = _team_ids(list(eliminated_teams))
+        self.correct = (
+            self.picked
+            & self.completed
+            & (self.winner_ids != NO_TEAM)
+            & (self.pick_team == self.winner_ids)
+        )
+        # Still worth points: game not played yet and the picked team not
+        # already knocked out of the CFP
+        self.alive = self.picked & ~self.completed & ~np.isin(self.pick_team, eliminated_ids)
+
+        self.points = (self.correct * self.pick_points).sum(axis=1)
+        self.max_possible = self.points + (self.alive * self.pick_points).sum(axis=1)
+
+        # rank method="min": 1 + number of users with more points
+        desc = -np.sort(self.points)[::-1]
+        self.rank = np.searchsorted(desc, -self.points, side="left") + 1
+        self.leader_points = int(self.points.max()) if len(self.points) else 0
+
+        # Decided picks as a W-L record, for standings-style games behind
+        decided = self.picked & self.completed & (self.winner_ids != NO_TEAM)
+        self.wins = self.correct.sum(axis=1)
+        self.losses = (decided & ~self.correct).sum(axis=1)
+        # Leader: best record among the users tied on the most points
+        net = np.where(self.points == self.leader_points, self.wins - self.losses, np.iinfo(np.int64).min)
+        self.leader_row = int(np.argmax(net)) if len(self.points) else None
+
+        # ---- bitsets ----
+        picked_home = self.picked & (self.pick_team == self.home_ids)
+        picked_away = self.picked & (self.pick_team == self.away_ids)
+        self.known_bits = np.packbits(picked_home | picked_away, axis=1)
+        self.home_bits = np.packbits(picked_home, axis=1)
+
+    def __len__(self):
+        return len(self.usernames)
+
+    def row(self, username):
+        """Matrix row for a username (case-insensitive), or None."""
+        return self.user_index.get(str(username).lower())
+
+    def summary(self, username):
+        """Points / projection card for one user, or None if they have no picks."""
+        i = self.row(username)
+        if i is None:
+            return None
+
+        points = int(self.points[i])
+        max_possible = int(self.max_possible[i])
+        pending = self.picked[i] & ~self.completed
+
+        return {
+            "username": self.usernames[i],
+            "name": self.names[i],
+            "total_points": points,
+            "max_possible_points": max_possible,
+            "rank": int(self.rank[i]),
+            "total_users": len(self),
+            "leader_points": self.leader_points,
+            "points_behind_leader": self.leader_points - points,
+            "games_behind_leader": self.games_behind(i),
+            "can_still_win": max_possible >= self.leader_points,
+            "games_remaining": int(pending.sum()),
+            "picks_alive": int(self.alive[i].sum()),
+            "picks_correct": int(self.correct[i].sum()),
+        }
+
+    def games_behind(self, i) -> float:
+        """Standings games behind the leader: ((leader W - W) + (L - leader L)) / 2."""
+        lead = self.leader_row
+        gap = (self.wins[lead] - self.wins[i]) + (self.losses[i] - self.losses[lead])
+        return float(gap) / 2
+
+    def _winner_sides(self):
+        """Per game: 1 = home won, 0 = away won, -1 = not decided."""
+        return np.where(
+            self.completed & (self.winner_ids == self.home_ids), 1,
+            np.where(self.completed & (self.winner_ids == self.away_ids), 0, -1),
+        )
+
+    def compare(self, a, b):
+        """
+        Head-to-head between two users, or None if either has no picks.
+        Only games where both picked one of the listed teams are compared.
+        """
+        i, j = self.row(a), self.row(b)
+        if i is None or j is None:
+            return None
+
+        both = self.known_bits[i] & self.known_bits[j]
+        differ_bits = both & (self.home_bits[i] ^ self.home_bits[j])
+
+        n_games = len(self.game_ids)
+        compared = int(popcount(both))
+        differ = np.unpackbits(differ_bits, count=n_games).astype(bool)
+        a_home = np.unpackbits(self.home_bits[i], count=n_games).astype(bool)
+        sides = self._winner_sides()
+
+        differences = []
+        a_won = b_won = swing_open = 0
+        for g in np.flatnonzero(differ):
+            pv = int(self.point_values[g])
+            a_pick, b_pick = (
+                (self.home_teams[g], self.away_teams[g]) if a_home[g]
+                else (self.away_teams[g], self.home_teams[g])
+            )
+            winner = None
+            if sides[g] >= 0:
+                winner = "a" if (sides[g] == 1) == a_home[g] else "b"
+                a_won += pv if winner == "a" else 0
+                b_won += pv if winner == "b" else 0
+            elif not self.completed[g]:
+                swing_open += pv
+
+            differences.append({
+                "game_id": self.game_ids[g],
+                "a_pick": a_pick,
+                "b_pick": b_pick,
+                "point_value": pv,
+                "completed": bool(self.completed[g]),
+                "won_by": winner,
+            })
+
+        n_differ = len(differences)
+        return {
+            "a": {"username": self.usernames[i], "name": self.names[i], "total_points": int(self.points[i])},
+            "b": {"username": self.usernames[j], "name": self.names[j], "total_points": int(self.points[j])},
+            "games_compared": compared,
+            "agree": compared - n_differ,
+            "differ": n_differ,
+            "agreement_pct": round(100 * (compared - n_differ) / compared, 1) if compared else None,
+            "a_points_from_differences": a_won,
+            "b_points_from_differences": b_won,
+            "swing_points_remaining": swing_open,
+            "differences": differences,
+        }
+
+    def compare_all(self, a):
+        """
+        One user against everyone else in the group, most similar first.
+        A handful of byte ops per rival, so thousands of users are cheap.
+        """
+        i = self.row(a)
+        if i is None:
+            return None
+
+        both = self.known_bits & self.known_bits[i]
+        differ_bits = both & (self.home_bits ^ self.home_bits[i])
+        compared = popcount(both)
+        differ = popcount(differ_bits)
+
+        # Points still open on games where they disagree
+        open_games = np.packbits(~self.completed)
+        open_differ = np.unpackbits(differ_bits & open_games, axis=1, count=len(self.game_ids))
+        swing = open_differ.astype(np.int64) @ self.point_values
+
+        rivals = []
+        for j in np.argsort(-(compared - differ) / np.maximum(compared, 1), kind="stable"):
+            if j == i:
+                continue
+            rivals.append({
+                "username": self.usernames[j],
+                "name": self.names[j],
+                "games_compared": int(compared[j]),
+                "differ": int(differ[j]),
+                "agreement_pct": round(100 * (compared[j] - differ[j]) / compared[j], 1) if compared[j] else None,
+                "swing_points_remaining": int(swing[j]),
+            })
+
+        return {
+            "a": {"username": self.usernames[i], "name": self.names[i], "total_points": int(self.points[i])},
+            "rivals": rivals,
+        }
@@ -4,19 +4,19 @@ import time
 import os
 
 def run_update_script():
-    """Run the update_winners_live.py script every 15 minutes."""
+    """Run update_winners every 15 minutes (under the job runner's lock)."""
     while True:
         try:
-            print("🔄 Running update_winners_live.py...")
+            print("🔄 Running update_winners...")
             # Ensure the script runs from the correct working directory
             subprocess.run(
-                ["python3", "update_winners_live.py"],
+                ["python3", "-m", "jobs.runner", "update_winners"],
                 cwd=os.path.dirname(os.path.abspath(__file__)),
                 check=True
             )
-            print("✅ update_winners_live.py completed successfully.")
+            print("✅ update_winners completed successfully.")
         except subprocess.CalledProcessError as e:
-            print(f"❌ Error running update_winners_live.py: {e}")
+            print(f"❌ Error running update_winners: {e}")
         except Exception as e:
             print(f"⚠️ Unexpected error: {e}")
         
@@ -0,0 +1,208 @@
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from collections import deque
+
+FLUSH_INTERVAL = 30   # seconds between batched writes
+HISTORY_LIMIT = 20    # autosaves kept in memory per user
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_picks (
+    group_key    TEXT NOT NULL,
+    username_key TEXT NOT NULL,
+    group_name   TEXT NOT NULL,
+    username     TEXT NOT NULL,
+    point_value  INTEGER,
+    picks        TEXT NOT NULL,
+    saved_at     REAL NOT NULL,
+    PRIMARY KEY (group_key, username_key)
+)
+"""
+
+# Latest-wins across workers: an older flush never overwrites a newer draft
+UPSERT = """
+INSERT INTO session_picks
+    (group_key, username_key, group_name, username, point_value, picks, saved_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (group_key, username_key) DO UPDATE SET
+    group_name = excluded.group_name,
+    username = excluded.username,
+    point_value = excluded.point_value,
+    picks = excluded.picks,
+    saved_at = excluded.saved_at
+WHERE excluded.saved_at > session_picks.saved_at
+"""
+
+
+class SessionPicksBuffer:
+    """
+    Latest-wins in-memory buffer for autosaved (in-progress) picks, backed
+    by a SQLite table keyed on (group, username).
+
+    save() is O(1) and never touches disk. latest() does one primary-key
+    lookup in the store, since another worker may have flushed a newer
+    draft, and returns whichever of that and this process's copy is newer.
+    Drafts that changed since the last flush are upserted in one
+    transaction every FLUSH_INTERVAL seconds and once more at exit, so the
+    store holds one row per user and never grows with autosave count.
+    Everything is dropped once `expires_at` (epoch seconds) has passed.
+    """
+
+    def __init__(self, path, expires_at=None, flush_interval=FLUSH_INTERVAL,
+                 history_limit=HISTORY_LIMIT):
+        self.path = path
+        self.expires_at = expires_at
+        self.flush_interval = flush_interval
+        self.history_limit = history_limit
+
+        self._lock = threading.Lock()
+        self._latest = {}    # (group_lower, username_lower) → entry
+        self._history = {}   # same key → deque of recent entries
+        self._dirty = set()
+        self._flusher = None
+        self._evicted = False
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(SCHEMA)
+
+        # A process started after the deadline never saves, so never flushes
+        if self.expired():
+            self.evict()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    @staticmethod
+    def _key(group_name, username):
+        return (group_name.lower(), username.lower())
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.time() >= self.expires_at
+
+    def save(self, group_name, username, point_value, picks) -> dict:
+        entry = {
+            "group_name": group_name,
+            "username": username,
+            "point_value": point_value,
+            "picks": picks,
+            "saved_at": time.time(),
+        }
+        key = self._key(group_name, username)
+
+        with self._lock:
+            self._latest[key] = entry
+            if key not in self._history:
+                self._history[key] = deque(maxlen=self.history_limit)
+            self._history[key].append(entry)
+            self._dirty.add(key)
+
+        self._ensure_flusher()
+        return entry
+
+    def latest(self, group_name, username):
+        """
+        Most recent draft for a user, or None: this process's autosave or
+        the stored one (saved before a restart or by another worker),
+        whichever has the later saved_at.
+        """
+        if self.expired():
+            self.evict()
+            return None
+
+        key = self._key(group_name, username)
+        with self._lock:
+            local = self._latest.get(key)
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT group_name, username, point_value, picks, saved_at "
+                "FROM session_picks WHERE group_key = ? AND username_key = ?",
+                key,
+            ).fetchone()
+        if row is None or (local is not None and local["saved_at"] >= row[4]):
+            return local
+
+        # Not cached: the next read has to see the next flush from elsewhere
+        return {
+            "group_name": row[0],
+            "username": row[1],
+            "point_value": row[2],
+            "picks": json.loads(row[3]),
+            "saved_at": row[4],
+        }
+
+    def history(self, group_name, username) -> list:
+        """Up to history_limit recent autosaves (this process only), oldest first."""
+        with self._lock:
+            return list(self._history.get(self._key(group_name, username), ()))
+
+    def flush(self) -> int:
+        """Upsert every user's latest unsaved draft. Returns rows written."""
+        if self.expired():
+            self.evict()
+            return 0
+
+        with self._lock:
+            keys = list(self._dirty)
+            batch = [(key, self._latest[key]) for key in keys]
+            self._dirty.clear()
+
+        if not batch:
+            return 0
+
+        rows = [
+            (
+                key[0],
+                key[1],
+                entry["group_name"],
+                entry["username"],
+                entry["point_value"],
+                json.dumps(entry["picks"], separators=(",", ":")),
+                entry["saved_at"],
+            )
+            for key, entry in batch
+        ]
+
+        try:
+            with self._connect() as conn:
+                conn.executemany(UPSERT, rows)
+        except Exception:
+            # Retry these users on the next flush
+            with self._lock:
+                self._dirty.update(keys)
+            raise
+
+        return len(rows)
+
+    def evict(self) -> None:
+        """Drop every draft (memory and disk) once the pick deadline has passed."""
+        if self._evicted:
+            return
+        with self._lock:
+            self._latest.clear()
+            self._history.clear()
+            self._dirty.clear()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM session_picks")
+        self._evicted = True
+
+    def _ensure_flusher(self):
+        if self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+        atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"⚠️ session picks flush failed: {e}", flush=True)
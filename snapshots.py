@@ -0,0 +1,310 @@
+"""
+Typed columnar snapshots of the storage CSVs.
+
+The first read after a CSV changes parses it once and writes a snapshot
+file, <DISK_DIR>/.snapshots/<name>@<mtime_ns>-<size>.snap: a JSON header
+followed by each column's raw buffer. Every later read, in any worker,
+memory-maps that one file and slices the columns out of it, so numeric
+columns come back zero-copy and there is no text parsing or dtype
+inference. String columns are dictionary-encoded (codes + fixed-width
+uniques) with a null mask, so decoding is one fancy-index per column.
+
+A snapshot is named after the CSV version it was built from, so a stale
+one is never read; it is written to a temp file and renamed into place.
+
+Writers (confirm_picks, the jobs) call publish() after writing a CSV: it
+rebuilds the snapshot right away and bumps that CSV's generation counter,
+kept in an mmap'd file next to the snapshots. Every process attaches to
+the same counter, so one write invalidates all workers' cached frames of
+that CSV at once (and only that CSV: one group's picks shard changing
+leaves every other group's cached frames alone).
+
+What is shared across workers is the parsing, not the frames: the
+snapshot bytes sit once in the page cache, but each worker decodes its
+own string objects, and callers that normalize (e.g. fillna("")) make
+their own copy of the columns they touch.
+"""
+import fcntl
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_DIRNAME = ".snapshots"
+GENERATION_SUFFIX = ".generation"
+MAGIC = b"BPSNAP1\n"
+ALIGN = 64
+
+
+def _version(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return f"{st.st_mtime_ns}-{st.st_size}"
+
+
+def _snapshot_root(csv_path):
+    return os.path.join(os.path.dirname(os.path.abspath(csv_path)), SNAPSHOT_DIRNAME)
+
+
+def _snapshot_path(csv_path, version):
+    return os.path.join(_snapshot_root(csv_path), f"{os.path.basename(csv_path)}@{version}.snap")
+
+
+def _aligned(n):
+    return -(-n // ALIGN) * ALIGN
+
+
+def _temp_file(path, mode):
+    """Open a uniquely named temp file next to path (safe across threads and processes)."""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    os.fchmod(fd, 0o644)
+    return os.fdopen(fd, mode), tmp_path
+
+
+# ======================================================
+#               ENCODE / DECODE COLUMNS
+# ======================================================
+
+def _encode(series):
+    """
+    (kind, data, mask, uniques) for one column, or None if it can't
+    round-trip exactly (e.g. an object column mixing strings and numbers).
+    """
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+        return "num", series.to_numpy(), None, None
+
+    isna = series.isna().to_numpy()
+    mask = isna if isna.any() else None
+    inferred = pd.api.types.infer_dtype(series, skipna=True)
+
+    if inferred in ("string", "empty"):
+        values = series.to_numpy(dtype=object, na_value="").astype(str)
+        uniques, codes = np.unique(values, return_inverse=True)
+        return "str", codes.astype("i4"), mask, uniques
+
+    if inferred == "boolean":
+        # read_csv leaves True/False/blank as an object column
+        data = np.where(isna, -1, series.to_numpy(dtype=object, na_value=False) == True)
+        return "bool_obj", data.astype("i1"), None, None
+
+    return None
+
+
+def _decode(kind, data, mask, uniques):
+    if kind == "num":
+        return data
+
+    if kind == "bool_obj":
+        out = np.where(data == 1, True, False).astype(object)
+        out[data == -1] = np.nan
+        return out
+
+    out = uniques.astype(object)[data]
+    if mask is not None:
+        out[mask] = np.nan
+    return out
+
+
+# ======================================================
+#               WRITE / READ
+# ======================================================
+
+def write_snapshot(df, csv_path, version) -> bool:
+    """Write df as the snapshot for this CSV version. False if unsupported."""
+    buffers = []
+    columns = []
+    offset = 0
+
+    def add(arr):
+        nonlocal offset
+        arr = np.ascontiguousarray(arr)
+        spec = {"dtype": arr.dtype.str, "offset": offset, "nbytes": arr.nbytes}
+        buffers.append((offset, arr))
+        offset = _aligned(offset + arr.nbytes)
+        return spec
+
+    for col in df.columns:
+        enc = _encode(df[col])
+        if enc is None:
+            return False
+        kind, data, mask, uniques = enc
+        columns.append({
+            "name": col,
+            "kind": kind,
+            "data": add(data),
+            "mask": add(mask) if mask is not None else None,
+            "uniques": add(uniques) if uniques is not None else None,
+        })
+
+    header = json.dumps({"rows": len(df), "columns": columns}).encode()
+    body_start = _aligned(len(MAGIC) + 8 + len(header))
+
+    path = _snapshot_path(csv_path, version)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    f, tmp_path = _temp_file(path, "wb")
+
+    with f:
+        f.write(MAGIC + struct.pack("<Q", len(header)) + header)
+        for buf_offset, arr in buffers:
+            f.seek(body_start + buf_offset)
+            f.write(arr.tobytes())
+        f.truncate(body_start + offset)
+
+    os.replace(tmp_path, path)
+    _prune(csv_path, keep=path)
+    return True
+
+
+def _prune(csv_path, keep):
+    """Remove older snapshots of this CSV (open mmaps stay valid on POSIX)."""
+    prefix = f"{os.path.basename(csv_path)}@"
+    root = _snapshot_root(csv_path)
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if name.startswith(prefix) and name.endswith(".snap") and path != keep:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def read_snapshot(csv_path, version):
+    """DataFrame from the snapshot for this CSV version, or None if absent."""
+    path = _snapshot_path(csv_path, version)
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            (header_len,) = struct.unpack("<Q", f.read(8))
+            meta = json.loads(f.read(header_len))
+
+            # Map through the open handle: another thread may prune the path meanwhile
+            body_start = _aligned(len(MAGIC) + 8 + header_len)
+            if os.fstat(f.fileno()).st_size > body_start:
+                body = np.memmap(f, dtype=np.uint8, mode="r", offset=body_start)
+            else:
+                # np.memmap refuses empty regions (e.g. a header-only CSV)
+                body = np.empty(0, dtype=np.uint8)
+    except FileNotFoundError:
+        return None
+
+    def view(spec):
+        if spec is None:
+            return None
+        raw = body[spec["offset"]:spec["offset"] + spec["nbytes"]]
+        return raw.view(np.dtype(spec["dtype"]))
+
+    data = {
+        col["name"]: _decode(
+            col["kind"], view(col["data"]), view(col["mask"]), view(col["uniques"])
+        )
+        for col in meta["columns"]
+    }
+    return pd.DataFrame(data, copy=False)
+
+
+def write_csv(df, csv_path) -> None:
+    """df.to_csv via a temp file + rename, so concurrent readers never see a half-written CSV."""
+    f, tmp_path = _temp_file(csv_path, "w")
+    with f:
+        df.to_csv(f, index=False)
+    os.replace(tmp_path, csv_path)
+
+
+def read_csv_cached(csv_path) -> pd.DataFrame:
+    """
+    pd.read_csv(csv_path), served from the typed snapshot when one exists
+    for the CSV's current version (and building it when it doesn't).
+    """
+    version = _version(csv_path)
+    if version is None:
+        return pd.read_csv(csv_path)
+
+    df = read_snapshot(csv_path, version)
+    if df is not None:
+        return df
+
+    df = pd.read_csv(csv_path)
+    # Only publish if the CSV didn't change underneath the parse
+    if _version(csv_path) == version:
+        try:
+            write_snapshot(df, csv_path, version)
+        except OSError as e:
+            print(f"⚠️ snapshot write failed for {csv_path}: {e}", flush=True)
+    return df
+
+
+# ======================================================
+#               SHARED GENERATION COUNTER
+# ======================================================
+
+class Generation:
+    """A uint64 in an mmap'd file, shared by every process on the same disk."""
+
+    def __init__(self, path):
+        self.path = path
+        self._mm = None
+
+    def _map(self):
+        if self._mm is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if os.fstat(fd).st_size < 8:
+                    os.ftruncate(fd, 8)
+                self._mm = mmap.mmap(fd, 8)
+            finally:
+                os.close(fd)
+        return self._mm
+
+    @property
+    def value(self) -> int:
+        return struct.unpack_from("<Q", self._map())[0]
+
+    def bump(self) -> int:
+        mm = self._map()
+        # flock serializes increments across processes; readers never lock
+        with open(self.path, "rb") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                value = struct.unpack_from("<Q", mm)[0] + 1
+                struct.pack_into("<Q", mm, 0, value)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return value
+
+
+_GENERATIONS = {}
+
+
+def generation(csv_path) -> Generation:
+    """The generation counter for csv_path."""
+    path = os.path.join(_snapshot_root(csv_path), os.path.basename(csv_path) + GENERATION_SUFFIX)
+    if path not in _GENERATIONS:
+        _GENERATIONS[path] = Generation(path)
+    return _GENERATIONS[path]
+
+
+def publish(csv_path) -> int:
+    """
+    Call after writing csv_path: builds its snapshot now (so no web worker
+    has to parse the CSV) and bumps the shared generation. Returns the new
+    generation.
+    """
+    version = _version(csv_path)
+    if version is not None:
+        df = pd.read_csv(csv_path)
+        if _version(csv_path) == version:
+            try:
+                write_snapshot(df, csv_path, version)
+            except OSError as e:
+                print(f"⚠️ snapshot write failed for {csv_path}: {e}", flush=True)
+    return generation(csv_path).bump()
@@ -0,0 +1,154 @@
+"""
+One place for team-name matching.
+
+Every spelling we see (CFBD names, games.csv, user picks, logo filenames,
+"St." vs "State", Hawai'i vs Hawaii...) is reduced to an alias key and
+looked up in a table built once at import from data/team_records.csv and
+static/logos. Scoring, ID matching and logo lookup compare integer team IDs.
+"""
+import itertools
+import os
+import re
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEAM_RECORDS_PATH = os.path.join(BASE_DIR, "data", "team_records.csv")
+LOGO_DIR = os.path.join(BASE_DIR, "static", "logos")
+
+# Spellings that the key normalization alone can't reconcile
+# (alias → name as it appears in team_records.csv)
+EXTRA_ALIASES = {
+    "Appalachian State": "App State",
+    "Connecticut": "UConn",
+    "NM State": "New Mexico State",
+    "Miami (Ohio)": "Miami (OH)",
+    "Southern Mississippi": "Southern Miss",
+}
+
+_STRIP_CHARS = re.compile(r"[’ʻ'.&()]")
+_SPACES = re.compile(r"[\s_]+")
+
+
+# ======================================================
+#               KEYS
+# ======================================================
+
+def normalize_team(name) -> str:
+    """
+    Legacy string form stored in games.csv's winner column
+    (lowercase, no apostrophes or periods). Kept for writers of that column.
+    """
+    if not isinstance(name, str):
+        return ""
+    return (
+        name.lower()
+        .replace("’", "'")   # curly apostrophe
+        .replace("'", "")    # remove apostrophes
+        .replace(".", "")
+        .strip()
+    )
+
+
+def alias_key(name) -> str:
+    """Lookup key: lowercase, punctuation dropped, underscores/whitespace collapsed."""
+    if not isinstance(name, str):
+        return ""
+    return _SPACES.sub(" ", _STRIP_CHARS.sub("", name.lower())).strip()
+
+
+# ======================================================
+#               ALIAS TABLE
+# ======================================================
+
+_next_id = itertools.count(1)
+_ALIASES = {}   # alias_key → team_id
+_NAMES = {}     # team_id → canonical (CFBD) name
+_LOGOS = {}     # team_id → /static/logos/<file>.png
+
+
+def _add_team(name):
+    key = alias_key(name)
+    if not key:
+        return None
+    team_id = _ALIASES.get(key)
+    if team_id is None:
+        team_id = _ALIASES.setdefault(key, next(_next_id))
+        _NAMES.setdefault(team_id, name)
+    return team_id
+
+
+def _add_alias(alias, team_id) -> None:
+    key = alias_key(alias)
+    if key:
+        _ALIASES.setdefault(key, team_id)
+
+
+def _build():
+    if os.path.exists(TEAM_RECORDS_PATH):
+        for name in sorted(pd.read_csv(TEAM_RECORDS_PATH)["team"].dropna().astype(str)):
+            team_id = _add_team(name)
+            # CFBD sometimes abbreviates "State" as "St."
+            if name.endswith(" State"):
+                _add_alias(name[: -len("State")] + "St.", team_id)
+
+    for alias, name in EXTRA_ALIASES.items():
+        _add_alias(alias, _add_team(name))
+
+    if os.path.isdir(LOGO_DIR):
+        for filename in sorted(os.listdir(LOGO_DIR)):
+            stem, ext = os.path.splitext(filename)
+            if ext.lower() != ".png":
+                continue
+            team_id = _add_team(stem.replace("_", " "))
+            _LOGOS.setdefault(team_id, f"/static/logos/{filename}")
+
+
+_build()
+
+
+# ======================================================
+#               LOOKUPS
+# ======================================================
+
+def team_id(name):
+    """
+    Integer ID for any spelling of a team, or None for blank names.
+    Names not in the table get a fresh ID so they still compare equal
+    to themselves (e.g. TBD placeholders).
+    """
+    key = alias_key(name)
+    if not key:
+        return None
+    found = _ALIASES.get(key)
+    if found is not None:
+        return found
+    return _add_team(name.strip())
+
+
+def known_team_id(name):
+    """team_id for names already in the table, else None. Never registers, so safe on untrusted input."""
+    key = alias_key(name)
+    return _ALIASES.get(key) if key else None
+
+
+def same_team(a, b) -> bool:
+    """True if two names refer to the same (non-blank) team."""
+    a_id = team_id(a)
+    return a_id is not None and a_id == team_id(b)
+
+
+def canonical_name(name):
+    """CFBD spelling for a team name, or the stripped input if unknown."""
+    tid = team_id(name)
+    if tid is None:
+        return name
+    return _NAMES.get(tid, name.strip())
+
+
+def logo_path(name) -> str:
+    """/static/logos/... path for a team, falling back to '<Name_With_Underscores>.png'."""
+    tid = team_id(name)
+    if tid in _LOGOS:
+        return _LOGOS[tid]
+    return f"/static/logos/{str(name).strip().replace(' ', '_')}.png"
@@ -2,6 +2,8 @@ import os
 import requests
 from dotenv import load_dotenv
 
+from jobs.update_spreads import consensus_spread
+
 load_dotenv()
 
 API_KEY = os.getenv("CFBD_API_KEY")
@@ -14,21 +16,7 @@ def fetch_postseason_lines():
     return r.json()
 
 def extract_best_spread(entry):
-    lines = entry.get("lines", [])
-
-    dk = next((l for l in lines
-               if l.get("provider") == "DraftKings"
-               and l.get("spread") is not None), None)
-    if dk:
-        return dk["spread"]
-
-    bov = next((l for l in lines
-                if l.get("provider") == "Bovada"
-                and l.get("spread") is not None), None)
-    if bov:
-        return bov["spread"]
-
-    return None
+    return consensus_spread(entry.get("lines", []))
 
 def main():
     data = fetch_postseason_lines()
@@ -0,0 +1,96 @@
+"""
+In-process request coalescing and rate limiting for the expensive read
+routes. Each gunicorn worker has its own instances; neither needs any
+coordination between workers to do its job.
+"""
+import threading
+import time
+
+
+class SingleFlight:
+    """
+    Concurrent calls for the same key and version share one computation,
+    and the result is kept until the version changes. A thundering herd
+    after a data change runs fn once per worker, not once per request.
+    Callers must treat returned values as read-only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}   # key → (version, Event, outcome dict)
+        self._results = {}    # key → (version, value)
+
+    def do(self, key, version, fn):
+        with self._lock:
+            done = self._results.get(key)
+            if done is not None and done[0] == version:
+                return done[1]
+
+            call = self._inflight.get(key)
+            leader = call is None or call[0] != version
+            if leader:
+                call = (version, threading.Event(), {})
+                self._inflight[key] = call
+
+        _, finished, outcome = call
+        if not leader:
+            finished.wait()
+            if "error" in outcome:
+                raise outcome["error"]
+            return outcome["value"]
+
+        try:
+            outcome["value"] = fn()
+            with self._lock:
+                self._results[key] = (version, outcome["value"])
+            return outcome["value"]
+        except Exception as e:
+            outcome["error"] = e
+            raise
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is call:
+                    del self._inflight[key]
+            finished.set()
+
+    def peek(self, key):
+        """(version, value) of the last finished computation, or None."""
+        return self._results.get(key)
+
+
+class TokenBucket:
+    """
+    `rate` requests/second per key with bursts up to `burst`.
+    take(key) returns 0 if the request may proceed, else the seconds to
+    wait before retrying.
+    """
+
+    MAX_KEYS = 10_000
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._buckets = {}  # key → (tokens, last_refill)
+
+    def take(self, key) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                return 0.0
+
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.MAX_KEYS:
+                self._prune(now)
+            return (1 - tokens) / self.rate
+
+    def _prune(self, now):
+        # Buckets that would be full again are indistinguishable from new ones
+        full_after = self.burst / self.rate
+        self._buckets = {
+            k: v for k, v in self._buckets.items() if now - v[1] < full_after
+        }
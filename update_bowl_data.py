@@ -3,6 +3,8 @@ import requests
 from datetime import datetime, timedelta
 import os
 
+from jobs.update_spreads import consensus_spread
+
 API_KEY = os.getenv("CFBD_API_KEY")
 HEADERS = {"Authorization": f"Bearer {API_KEY}"}
 
@@ -46,8 +48,7 @@ def build_lines_lookup(lines_data):
         if not game.get("lines"):
             continue
 
-        provider_line = game["lines"][0]  # typically DraftKings / default provider
-        lookup[game_id] = provider_line.get("spread")
+        lookup[game_id] = consensus_spread(game["lines"])
 
     return lookup
 
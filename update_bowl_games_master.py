@@ -4,25 +4,14 @@ import requests
 import pandas as pd
 from datetime import datetime
 
+from team_names import canonical_name
+
 API_KEY = os.getenv("CFBD_API_KEY")
 HEADERS = {"Authorization": f"Bearer {API_KEY}"}
 
 # Path to your seed CSV (modify if using a different path)
 CSV_PATH = "./storage_seed/games.csv"
 
-# --------------------------------------------------------------------------
-# Helper: Normalize team names (CFBD sometimes uses abbreviations)
-# --------------------------------------------------------------------------
-def normalize_team_name(name):
-    if not name:
-        return ""
-    return (
-        name.replace("St.", "State")
-        .replace("UConn", "Connecticut")
-        .replace("Miami (OH)", "Miami (OH)")
-        .strip()
-    )
-
 # --------------------------------------------------------------------------
 # Fetch all postseason games for 2025 and 2026
 # --------------------------------------------------------------------------
@@ -101,8 +90,8 @@ def update_games_csv():
         g = cfbd_by_id[game_id]
 
         # Extract real fields
-        home = normalize_team_name(g.get("home_team"))
-        away = normalize_team_name(g.get("away_team"))
+        home = canonical_name(g.get("home_team") or "")
+        away = canonical_name(g.get("away_team") or "")
         network = g.get("tv")
         venue = g["venue"] if g.get("venue") else None
 
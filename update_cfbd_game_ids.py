@@ -3,6 +3,8 @@ import requests
 import pandas as pd
 from dotenv import load_dotenv
 
+from team_names import team_id
+
 # --------------------------------------
 # Load API Key
 # --------------------------------------
@@ -30,11 +32,11 @@ def fetch_postseason_games():
     return response.json()
 
 
-def normalize_team_name(name: str) -> str:
-    """Normalize team names between your CSV and CFBD naming."""
-    if not name or "TBD" in name:
+def csv_team_id(name):
+    """Canonical team ID for a games.csv team, or None for TBD matchups."""
+    if not isinstance(name, str) or "TBD" in name:
         return None
-    return name.strip().replace("St.", "State")
+    return team_id(name)
 
 
 def update_cfbd_ids():
@@ -51,8 +53,8 @@ def update_cfbd_ids():
     for g in games:
         cfbd_lookup.append({
             "cfbd_id": g.get("id"),
-            "home_team": g.get("home_team"),
-            "away_team": g.get("away_team"),
+            "home_id": team_id(g.get("home_team")),
+            "away_id": team_id(g.get("away_team")),
             "date": g.get("start_date"),
         })
 
@@ -63,22 +65,22 @@ def update_cfbd_ids():
     matched = 0
 
     for idx, row in df.iterrows():
-        away = normalize_team_name(row["away_team"])
-        home = normalize_team_name(row["home_team"])
+        away = csv_team_id(row["away_team"])
+        home = csv_team_id(row["home_team"])
 
         if away is None or home is None:
             continue  # ignore CFP TBD matchups
 
         match = cfbd_df[
-            (cfbd_df["away_team"] == away) &
-            (cfbd_df["home_team"] == home)
+            (cfbd_df["away_id"] == away) &
+            (cfbd_df["home_id"] == home)
         ]
 
         if len(match) == 1:
             df.at[idx, "cfbd_game_id"] = match.iloc[0]["cfbd_id"]
             matched += 1
         else:
-            print(f"⚠️ No match for: {away} vs {home}")
+            print(f"⚠️ No match for: {row['away_team']} vs {row['home_team']}")
 
     df.to_csv(CSV_PATH, index=False)
 
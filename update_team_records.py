@@ -1,49 +1,19 @@
-import os
-import requests
-import pandas as pd
-from dotenv import load_dotenv
-
-# Load API key
-load_dotenv()
-API_KEY = os.getenv("CFBD_API_KEY")
+from jobs.refresh_teams import fetch_team_records as fetch_records
 
 YEAR = 2025  # adjust if needed
 
-def fetch_team_records():
-    """Fetch team win/loss records from the CollegeFootballData API."""
-    url = f"https://api.collegefootballdata.com/records?year={YEAR}"
-    headers = {"Authorization": f"Bearer {API_KEY}"}
-
-    response = requests.get(url, headers=headers)
-
-    if response.status_code != 200:
-        print(f"❌ Failed to fetch team records: {response.status_code}")
-        print(response.text)
-        return
+# Full CFBD team list — team_names.py builds its alias table from this file.
+# Bowl teams' ranks and records go straight into games.csv (jobs/refresh_teams.py).
+OUTPUT_PATH = "data/team_records.csv"
 
-    data = response.json()
-    df = pd.json_normalize(data)
 
-    # Extract needed columns
-    df = df[[
-        "team",
-        "total.wins",
-        "total.losses",
-        "total.ties"
-    ]]
-
-    # Rename for clarity
-    df.rename(columns={
-        "total.wins": "wins",
-        "total.losses": "losses",
-        "total.ties": "ties"
-    }, inplace=True)
-
-    # Build W-L record string
-    df["record"] = df["wins"].astype(str) + "-" + df["losses"].astype(str)
+def fetch_team_records():
+    """Fetch team win/loss records from the CollegeFootballData API."""
+    df = fetch_records(YEAR)
+    df = df[["team", "wins", "losses", "ties", "record"]]
 
     # Save file
-    df.to_csv("data/team_records.csv", index=False)
+    df.to_csv(OUTPUT_PATH, index=False)
     print("✅ Team records updated successfully!")
 
 